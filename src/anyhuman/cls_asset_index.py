@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_asset_index.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import os
+import pickle
+import hashlib
+import tempfile
+import collections
+
+from pathlib import Path
+from typing import Optional
+
+
+#########################################################################################################
+class CAssetIndex:
+    """Incrementally refreshed index of the 'models', 'hair' and 'outfits' folders of the HumGen add-on.
+
+    The listing of every folder is stored in a cache file together with the modification time of the
+    folder. As the modification time of a folder changes whenever an entry is added, removed or renamed
+    in it, a refresh only needs to stat each folder and lists the unchanged folders from the cache.
+    Only new or changed folders are listed again.
+
+    Human models, hair and outfits are classified by the components of their path relative to the add-on
+    folder, i.e. 'models/<gender>/.../<name>.json', 'hair/head/<gender>/.../<name>.json',
+    'hair/face_hair/.../<name>.json' and 'outfits/<gender>/<set>/.../<name>.blend'.
+
+    The cache folder is taken from the environment variable ANYHUMAN_CACHE_PATH and defaults to
+    '~/.cache/anyhuman'.
+    """
+
+    iVersion: int = 1
+
+    lRoots: list = ["models", "hair", "outfits"]
+    lGenders: list = ["female", "male"]
+    lFaultyOutfits: list = ["BBQ_Barbara", "New_Intern"]
+
+    def __init__(self, _sAddonPath: str, _sCachePath: Optional[str] = None):
+        self.sAddonPath: str = str(_sAddonPath)
+
+        if _sCachePath is None:
+            _sCachePath = os.environ.get("ANYHUMAN_CACHE_PATH", Path.home() / ".cache" / "anyhuman")
+        # endif
+        sAddonHash = hashlib.sha1(self.sAddonPath.encode("utf-8")).hexdigest()[:16]
+        self.pathCache = Path(_sCachePath) / f"asset_index_{sAddonHash}.pickle"
+
+        # Number of folders that had to be listed in the last call to Refresh()
+        self.iListedDirs: int = 0
+
+    # enddef
+
+    ############################################################################################
+    def _ReadCache(self) -> dict:
+        try:
+            with open(self.pathCache, "rb") as xFile:
+                dicCache = pickle.load(xFile)
+            # endwith
+        except Exception:
+            return {}
+        # endtry
+
+        if (
+            not isinstance(dicCache, dict)
+            or dicCache.get("iVersion") != self.iVersion
+            or dicCache.get("sAddonPath") != self.sAddonPath
+        ):
+            return {}
+        # endif
+
+        return dicCache["dicDirs"]
+
+    # enddef
+
+    ############################################################################################
+    def _WriteCache(self, _dicDirs: dict):
+        dicCache = {
+            "iVersion": self.iVersion,
+            "sAddonPath": self.sAddonPath,
+            "dicDirs": _dicDirs,
+        }
+        try:
+            self.pathCache.parent.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first, so that workers starting in parallel never read a partial cache
+            iFd, sTempPath = tempfile.mkstemp(dir=self.pathCache.parent, suffix=".tmp")
+            with os.fdopen(iFd, "wb") as xFile:
+                pickle.dump(dicCache, xFile, protocol=pickle.HIGHEST_PROTOCOL)
+            # endwith
+            os.replace(sTempPath, self.pathCache)
+        except OSError as xEx:
+            print(f"WARNING: Could not write asset index cache '{self.pathCache}': {xEx}")
+        # endtry
+
+    # enddef
+
+    ############################################################################################
+    def Refresh(self) -> dict:
+        """
+        Return the listing of all folders below the asset roots and update the cache file if it changed.
+
+        Returns
+        -------
+        dict
+            {relative folder path with '/' separators: (modification time, [sub-folder names], [file names])}
+        """
+        dicOldDirs = self._ReadCache()
+        dicDirs = {}
+        self.iListedDirs = 0
+
+        lStack = list(reversed(self.lRoots))
+        while len(lStack) > 0:
+            sRelDir = lStack.pop()
+            sDir = os.path.join(self.sAddonPath, *sRelDir.split("/"))
+            try:
+                iMTime = os.stat(sDir).st_mtime_ns
+            except OSError:
+                continue
+            # endtry
+
+            tEntry = dicOldDirs.get(sRelDir)
+            if tEntry is None or tEntry[0] != iMTime:
+                lSubDirs = []
+                lFiles = []
+                with os.scandir(sDir) as xEntries:
+                    for xEntry in xEntries:
+                        if xEntry.is_dir():
+                            lSubDirs.append(xEntry.name)
+                        else:
+                            lFiles.append(xEntry.name)
+                        # endif
+                    # endfor
+                # endwith
+                tEntry = (iMTime, sorted(lSubDirs), sorted(lFiles))
+                self.iListedDirs += 1
+            # endif
+
+            dicDirs[sRelDir] = tEntry
+            lStack.extend("{}/{}".format(sRelDir, sSubDir) for sSubDir in reversed(tEntry[1]))
+        # endwhile
+
+        if self.iListedDirs > 0 or dicDirs.keys() != dicOldDirs.keys():
+            self._WriteCache(dicDirs)
+        # endif
+
+        return dicDirs
+
+    # enddef
+
+    ############################################################################################
+    def Classify(self, _dicDirs: dict) -> dict:
+        """
+        Sort the files of the folder listing _dicDirs into human models, hair and outfits by gender.
+
+        Returns
+        -------
+        dict
+            The lists and dictionaries of the legacy HumGenWrapper generator config, i.e. 'list_females',
+            'list_males', 'dict_female_head_hair', 'dict_male_head_hair', 'dict_male_face_hair',
+            'dict_female_outfits' and 'dict_male_outfits'.
+        """
+        dicConfig = {
+            "list_females": [],
+            "list_males": [],
+            "dict_female_head_hair": {},
+            "dict_male_head_hair": {},
+            "dict_male_face_hair": {},
+            "dict_female_outfits": collections.defaultdict(list),
+            "dict_male_outfits": collections.defaultdict(list),
+        }
+        dicModels = {"female": dicConfig["list_females"], "male": dicConfig["list_males"]}
+        dicHeadHair = {"female": dicConfig["dict_female_head_hair"], "male": dicConfig["dict_male_head_hair"]}
+        dicOutfits = {"female": dicConfig["dict_female_outfits"], "male": dicConfig["dict_male_outfits"]}
+
+        for sRelDir, (_, _, lFiles) in _dicDirs.items():
+            lParts = sRelDir.split("/")
+            sGender = next((sPart for sPart in lParts[1:] if sPart in self.lGenders), None)
+
+            for sFile in lFiles:
+                sName, sExt = os.path.splitext(sFile)
+                sRelFile = os.path.sep + os.path.join(*lParts, sFile)
+
+                if lParts[0] == "models":
+                    if sExt == ".json" and sGender is not None:
+                        dicModels[sGender].append(sName)
+                    # endif
+
+                elif lParts[0] == "hair":
+                    if sExt != ".json" or len(lParts) < 2:
+                        continue
+                    # endif
+                    if lParts[1] == "head" and sGender is not None:
+                        dicHeadHair[sGender][sName] = sRelFile
+                    elif lParts[1] == "face_hair":
+                        dicConfig["dict_male_face_hair"][sName] = sRelFile
+                    # endif
+
+                elif lParts[0] == "outfits":
+                    # outfits/<gender>/<set>/.../<name>.blend
+                    if (
+                        sExt == ".blend"
+                        and len(lParts) >= 3
+                        and lParts[1] in self.lGenders
+                        and sName not in self.lFaultyOutfits
+                    ):
+                        dicOutfits[lParts[1]][lParts[2]].append(sName)
+                    # endif
+                # endif
+            # endfor
+        # endfor
+
+        return dicConfig
+
+    # enddef
+
+    ############################################################################################
+    def Load(self) -> dict:
+        """Refresh the folder listing and return the classified assets, see Classify()"""
+        return self.Classify(self.Refresh())
+
+    # enddef
+
+
+# endclass
@@ -51,6 +51,7 @@ except Exception as xEx:
 # endtry
 
 from . import tools
+from .cls_asset_index import CAssetIndex
 
 color_dict = {
     # color set from HG3D (see HG_COLORS.py)
@@ -107,9 +108,6 @@ class HumGenWrapper:
         """
         addon_name = "humgen3d"
         addon_path = bpy.context.preferences.addons[addon_name].preferences["filepath"]
-        base_human_path = os.path.join(addon_path, "models")
-        hair_path = os.path.join(addon_path, "hair")
-        outfit_path = os.path.join(addon_path, "outfits")
 
         class HumGenConfigValues:
             def __init__(self):
@@ -127,62 +125,9 @@ class HumGenWrapper:
 
         self.generator_config = HumGenConfigValues()
 
-        for dir_, _, files in os.walk(base_human_path):
-            for file_name in files:
-                rel_dir = os.path.relpath(dir_, base_human_path)
-                rel_file = os.path.join("models", rel_dir, file_name)
-                rel_file = os.path.sep + rel_file
-                if ".json" in rel_file:
-                    file_name = os.path.splitext(os.path.basename(rel_file))[0]
-                    if "female" in rel_file:
-                        self.generator_config.list_females.append(file_name)
-                    elif "male" in rel_file:
-                        self.generator_config.list_males.append(file_name)
-                    # endif gender
-                # endif model
-            # endfor
-        # endfor
-
-        for dir_, _, files in os.walk(hair_path):
-            for file_name in files:
-                rel_dir = os.path.relpath(dir_, hair_path)
-                rel_file = os.path.join("hair", rel_dir, file_name)
-                rel_file = os.path.sep + rel_file
-                if "head" in rel_file and ".json" in rel_file:
-                    file_name = os.path.splitext(os.path.basename(rel_file))[0]
-                    if "female" in rel_file:
-                        self.generator_config.dict_female_head_hair[file_name] = rel_file
-                    elif "male" in rel_file:
-                        self.generator_config.dict_male_head_hair[file_name] = rel_file
-                    # endif gender
-                if "face_hair" in rel_file and ".json" in rel_file:
-                    file_name = os.path.splitext(os.path.basename(file_name))[0]
-                    self.generator_config.dict_male_face_hair[file_name] = rel_file
-                # endif face/head hair
-            # endif hair
-        # endfor
-
-        for dir_, _, files in os.walk(outfit_path):
-            for file_name in files:
-                rel_dir = os.path.relpath(dir_, hair_path)
-                rel_file = os.path.join("outputs", rel_dir, file_name)
-                rel_file = os.path.sep + rel_file
-                components = Path(rel_file).parts
-                if ".blend" in rel_file and len(components) > 5:
-                    set_name = components[5]
-                    file_name = os.path.splitext(os.path.basename(rel_file))[0]
-
-                    # skip faulty outfits
-                    if file_name in ["BBQ_Barbara", "New_Intern"]:
-                        continue
-
-                    if "female" in rel_file:
-                        self.generator_config.dict_female_outfits[set_name].append(file_name)
-                    elif "male" in rel_file:
-                        self.generator_config.dict_male_outfits[set_name].append(file_name)
-                    # endif gender
-                # endif face/head hair
-            # endif hair
+        # models, hair and outfits from the persisted index, which only lists folders that changed since the last run
+        for sName, xValue in CAssetIndex(addon_path).Load().items():
+            setattr(self.generator_config, sName, xValue)
         # endfor
 
         if len(self.generator_config.list_males) == 0:
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_material_library.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import os
+
+import bpy
+
+
+#########################################################################################################
+class CMaterialLibrary:
+    """Materials of a replacement .blend library, e.g. for ReplaceMaterials().
+
+    The library is opened once on creation, to index its material names and to load its
+    'RandomizeShader.py' text as module. A material is appended from the library on its first use
+    and kept with a fake user, so all humans of the scene share the appended material. Every garment
+    gets its own copy of it via GetMaterialInstance(), which is then randomized.
+    """
+
+    sRandomizeScript: str = "RandomizeShader.py"
+
+    def __init__(self, _sLibPath: str):
+        self.sLibPath: str = os.path.abspath(_sLibPath)
+        self._dicMaterials: dict = {}
+        self.iAppendCount: int = 0
+
+        with bpy.data.libraries.load(self.sLibPath, link=True) as (data_src, data_dst):
+            self.setMaterialNames: set = set(data_src.materials)
+            data_dst.texts = [self.sRandomizeScript]
+        # endwith
+
+        if len(data_dst.texts) == 0 or data_dst.texts[0] is None:
+            raise RuntimeError(f"Text {self.sRandomizeScript} not found in {self.sLibPath}")
+        # endif
+        self.xRandomizeModule = data_dst.texts[0].as_module()
+
+    # enddef
+
+    ############################################################################################
+    def GetMaterial(self, _sMaterial: str):
+        """Return the material _sMaterial of the library, which is appended to the scene on first use"""
+        xMaterial = self._dicMaterials.get(_sMaterial)
+        if xMaterial is not None:
+            try:
+                # the material may have been removed from the blend data, e.g. by loading another file
+                xMaterial.name
+                return xMaterial
+            except ReferenceError:
+                pass
+            # endtry
+        # endif
+
+        if _sMaterial not in self.setMaterialNames:
+            raise RuntimeError(f"Material with name {_sMaterial} not found in {self.sLibPath}")
+        # endif
+
+        with bpy.data.libraries.load(self.sLibPath, link=False) as (data_src, data_dst):
+            data_dst.materials = [_sMaterial]
+        # endwith
+
+        if len(data_dst.materials) == 0 or data_dst.materials[0] is None:
+            raise RuntimeError(f"Material with name {_sMaterial} not found in {self.sLibPath}")
+        # endif
+
+        xMaterial = data_dst.materials[0]
+        xMaterial.use_fake_user = True
+        self._dicMaterials[_sMaterial] = xMaterial
+        self.iAppendCount += 1
+        return xMaterial
+
+    # enddef
+
+    ############################################################################################
+    def GetMaterialInstance(self, _sMaterial: str):
+        """Return a new copy of the material _sMaterial, e.g. to randomize it for a single garment"""
+        xMaterial = self.GetMaterial(_sMaterial).copy()
+        xMaterial.use_fake_user = False
+        return xMaterial
+
+    # enddef
+
+
+# endclass
+
+
+# material libraries of this process, {absolute path: (modification time, CMaterialLibrary)}
+_dicMaterialLibraries: dict = {}
+
+
+############################################################################################
+def GetMaterialLibrary(_sLibPath: str) -> CMaterialLibrary:
+    """Return the material library of this process for the .blend file _sLibPath.
+
+    The library is opened again if the file has been modified since it was opened.
+    """
+    sLibPath = os.path.abspath(_sLibPath)
+    iStamp = os.stat(sLibPath).st_mtime_ns
+
+    tEntry = _dicMaterialLibraries.get(sLibPath)
+    if tEntry is None or tEntry[0] != iStamp:
+        tEntry = _dicMaterialLibraries[sLibPath] = (iStamp, CMaterialLibrary(sLibPath))
+    # endif
+
+    return tEntry[1]
+
+
+# enddef
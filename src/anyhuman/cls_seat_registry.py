@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_seat_registry.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import re
+
+import bpy
+import mathutils
+
+
+#########################################################################################################
+class CSeatRegistry:
+    """Seat empties of a vehicle, e.g. for DoPlaceHumanOnSeat().
+
+    The vehicle is scanned once on creation for the empties 'seat_x_seat', 'seat_x_foot_rest', 'seat_x_back_rest',
+    'seat_x_head_rest' and 'seat_x_leg_constraint' and their world matrices are cached. The vehicle is the top
+    most parent of the seat empties. If the seat empties have no parent, all objects of the blend data are scanned
+    and the registry stays valid only as long as the seat empties themselves are unchanged.
+    The placement empty 'seat_x_placement_<armature>' of a human on a seat is created on its first use and reused
+    afterwards, so placing another human on the same seat does not move a human placed there before.
+    """
+
+    lParts: list = ["seat", "foot_rest", "back_rest", "head_rest", "leg_constraint"]
+    reSeatEmpty = re.compile(r"^(seat_\d+)_({})$".format("|".join(lParts)))
+
+    def __init__(self, _objVehicle=None):
+        self.objVehicle = _objVehicle
+        self.xVehicleMatrix: mathutils.Matrix = None
+        # {seat base name: {part: object name}}
+        self.dicSeatObjects: dict = {}
+        # {seat base name: {part: object pointer}}
+        self.dicSeatPointers: dict = {}
+        # {seat base name: {part: world matrix}}
+        self.dicSeatMatrices: dict = {}
+        self._dicPlacementEmpties: dict = {}
+
+        if _objVehicle is None:
+            lObjects = bpy.data.objects
+        else:
+            self.xVehicleMatrix = _objVehicle.matrix_world.copy()
+            lObjects = _objVehicle.children_recursive
+        # endif
+
+        for objX in lObjects:
+            xMatch = self.reSeatEmpty.match(objX.name)
+            if xMatch is None:
+                continue
+            # endif
+            sSeat, sPart = xMatch.groups()
+            self.dicSeatObjects.setdefault(sSeat, {})[sPart] = objX.name
+            self.dicSeatPointers.setdefault(sSeat, {})[sPart] = objX.as_pointer()
+            self.dicSeatMatrices.setdefault(sSeat, {})[sPart] = objX.matrix_world.copy()
+        # endfor
+
+    # enddef
+
+    ############################################################################################
+    def IsValid(self, _objVehicle) -> bool:
+        """Return True, if the registry was created for the vehicle _objVehicle in its current state"""
+        try:
+            if self.objVehicle is None or _objVehicle is None:
+                return self.objVehicle is _objVehicle and self._IsSeatsUnchanged()
+            # endif
+            if self.objVehicle.as_pointer() != _objVehicle.as_pointer():
+                return False
+            # endif
+            return self.xVehicleMatrix is None or self.xVehicleMatrix == _objVehicle.matrix_world
+        except ReferenceError:
+            # the vehicle has been removed from the blend data, e.g. by loading another file
+            return False
+        # endtry
+
+    # enddef
+
+    ############################################################################################
+    def _IsSeatsUnchanged(self) -> bool:
+        """Return True, if all seat empties still exist at their cached world matrices"""
+        for sSeat, dicObjects in self.dicSeatObjects.items():
+            for sPart, sName in dicObjects.items():
+                objX = bpy.data.objects.get(sName)
+                if (
+                    objX is None
+                    or objX.as_pointer() != self.dicSeatPointers[sSeat][sPart]
+                    or objX.matrix_world != self.dicSeatMatrices[sSeat][sPart]
+                ):
+                    return False
+                # endif
+            # endfor
+        # endfor
+        return True
+
+    # enddef
+
+    ############################################################################################
+    def GetSeatNames(self) -> list:
+        """Return the sorted base names 'seat_x' of all seats of the vehicle"""
+        return sorted(self.dicSeatObjects.keys())
+
+    # enddef
+
+    ############################################################################################
+    def GetMatrix(self, _sSeatBasename: str, _sPart: str = "seat") -> mathutils.Matrix:
+        """Return the cached world matrix of the empty '<_sSeatBasename>_<_sPart>'"""
+        dicMatrices = self.dicSeatMatrices.get(_sSeatBasename)
+        if dicMatrices is None or _sPart not in dicMatrices:
+            raise RuntimeError(f"Seat empty '{_sSeatBasename}_{_sPart}' not found")
+        # endif
+        return dicMatrices[_sPart]
+
+    # enddef
+
+    ############################################################################################
+    def GetObject(self, _sSeatBasename: str, _sPart: str = "seat"):
+        """Return the empty '<_sSeatBasename>_<_sPart>'"""
+        self.GetMatrix(_sSeatBasename, _sPart)
+        return bpy.data.objects[self.dicSeatObjects[_sSeatBasename][_sPart]]
+
+    # enddef
+
+    ############################################################################################
+    def GetPlacementEmpty(self, _sSeatBasename: str, _fRotateZ: float, _objArmature):
+        """Return the empty '<_sSeatBasename>_placement_<armature name>', rotated by _fRotateZ around the z-axis
+        of the seat.
+
+        Every armature gets its own placement empty, as the constraints of a human placed on the seat before
+        may still refer to its empty. An existing placement empty of the armature on the seat is reused, so
+        placing a human repeatedly on the same seat does not add new empties to the scene.
+        """
+        sPlacementName = "{}_placement_{}".format(_sSeatBasename, _objArmature.name)
+        objPlacement = self._dicPlacementEmpties.get(sPlacementName)
+        if objPlacement is not None:
+            try:
+                objPlacement.name
+            except ReferenceError:
+                objPlacement = None
+            # endtry
+        # endif
+
+        objSeat = self.GetObject(_sSeatBasename, "seat")
+        if objPlacement is None:
+            objPlacement = bpy.data.objects.get(sPlacementName)
+            if objPlacement is None or objPlacement.type != "EMPTY":
+                objPlacement = bpy.data.objects.new(sPlacementName, None)
+                bpy.context.scene.collection.objects.link(objPlacement)
+            # endif
+            self._dicPlacementEmpties[sPlacementName] = objPlacement
+        # endif
+
+        if objPlacement.parent != objSeat:
+            objPlacement.parent = objSeat
+        # endif
+        objPlacement.scale = mathutils.Vector([0.1, 0.1, 0.1])
+        # Rotation around z axis, default 180 degree.
+        if objPlacement.rotation_euler[2] != _fRotateZ:
+            objPlacement.rotation_euler[2] = _fRotateZ
+        # endif
+        return objPlacement
+
+    # enddef
+
+
+# endclass
+
+
+# seat registry of the current vehicle
+_xSeatRegistry: CSeatRegistry = None
+
+
+############################################################################################
+def GetVehicle(_sSeatBasename: str):
+    """Return the vehicle of the seat _sSeatBasename, i.e. the top most parent of its empty 'seat_x_seat'.
+
+    Returns None, if the seat empty has no parent.
+    """
+    objSeat = bpy.data.objects["{}_seat".format(_sSeatBasename)]
+    if objSeat.parent is None:
+        return None
+    # endif
+
+    objVehicle = objSeat.parent
+    while objVehicle.parent is not None:
+        objVehicle = objVehicle.parent
+    # endwhile
+    return objVehicle
+
+
+# enddef
+
+
+############################################################################################
+def GetSeatRegistry(_sSeatBasename: str) -> CSeatRegistry:
+    """Return the seat registry of the vehicle the seat _sSeatBasename belongs to.
+
+    The vehicle is scanned again only if it is another object or it has been moved since the last scan.
+    """
+    global _xSeatRegistry
+
+    objVehicle = GetVehicle(_sSeatBasename)
+    if (
+        _xSeatRegistry is None
+        or not _xSeatRegistry.IsValid(objVehicle)
+        or _sSeatBasename not in _xSeatRegistry.dicSeatObjects
+    ):
+        _xSeatRegistry = CSeatRegistry(objVehicle)
+    # endif
+
+    return _xSeatRegistry
+
+
+# enddef
@@ -39,6 +39,8 @@ from typing import Optional
 from anybase import convert
 
 from .cls_humgen import SingletonHumGenWrapper
+from .cls_material_library import GetMaterialLibrary
+from .cls_seat_registry import GetSeatRegistry
 
 from .paramgenerators import ComputeParams, ResolveRandomParams
 
@@ -226,6 +228,9 @@ def DoPlaceHumanOnSeat(
     - seat_x_head_rest
     - seat_x_leg_constraint
 
+    The human is glued to the empty seat_x_placement_<armature name>, which is created below seat_x_seat on
+    the first placement of the armature on the seat and reused afterwards (see CSeatRegistry).
+
     Parameters
     ----------
     _objArmature : Blender armature object
@@ -243,8 +248,6 @@ def DoPlaceHumanOnSeat(
         The frame number to insert the keyframe in the pose animation (only applies if _bApplyConstraints=True)
     """
 
-    sSeatObjectName = "{}_seat".format(_sSeatBasename)
-
     # first, switch to edit mode
     bpy.context.view_layer.objects.active = _objArmature
     bpy.ops.object.mode_set(mode="EDIT", toggle=False)
@@ -265,15 +268,10 @@ def DoPlaceHumanOnSeat(
     _objArmature.select_set(True)
     bpy.ops.object.origin_set(type="ORIGIN_CURSOR")
 
-    # create additonal empty at seat location and rotate around z axis
-    sSeatPlacementName = "{}_placement".format(_sSeatBasename)
-    objSeatPlacementEmpty = bpy.data.objects.new(sSeatPlacementName, None)
-
-    bpy.context.scene.collection.objects.link(objSeatPlacementEmpty)
-    objSeatPlacementEmpty.scale = mathutils.Vector([0.1, 0.1, 0.1])
-    objSeatPlacementEmpty.parent = bpy.data.objects[sSeatObjectName]
-    # Rotation around z axis, default 180 degree.
-    objSeatPlacementEmpty.rotation_euler[2] = _fRotateZ
+    # get additonal empty at seat location, rotated around z axis, which is reused for the armature
+    objSeatPlacementEmpty = GetSeatRegistry(_sSeatBasename).GetPlacementEmpty(
+        _sSeatBasename, _fRotateZ, _objArmature
+    )
 
     # create constraints to glue human origin to seat location and rotation
     _objArmature.constraints.new("COPY_LOCATION")
@@ -358,6 +356,118 @@ def DoPlaceHumanOnSeat(
 # enddef
 
 
+##############################################################################################################
+def GetSeatPlacementMatrix(_objArmature, _xSeatMatrix, _fRotateZ, _xShift, _sRootBone: str = "spine"):
+    """
+    World matrix of an armature object that places it on a seat, as done by the constraints of DoPlaceHumanOnSeat().
+
+    The head of the root bone, shifted by _xShift, is moved to the seat location. The rotation around the z-axis
+    is taken from the seat rotated by _fRotateZ, the rotations around the x- and y-axis and the scale of the
+    armature are kept.
+
+    Parameters
+    ----------
+    _objArmature : Blender armature object
+        Human skeleton
+    _xSeatMatrix : mathutils.Matrix
+        World matrix of the seat empty 'seat_x_seat'
+    _fRotateZ : float
+        Rotation around z-Axis (i.e. up-Axis) in radians
+    _xShift : mathutil.Vector[3]
+        Shift in Armature coordinates to fine tune asset placement
+    _sRootBone : str
+        Name of the root bone
+
+    Returns
+    -------
+    mathutils.Matrix
+        4x4 world matrix for the armature object
+    """
+    xPlacementRotation = _xSeatMatrix.to_3x3().normalized() @ mathutils.Matrix.Rotation(_fRotateZ, 3, "Z")
+
+    xMatrixWorld = _objArmature.matrix_world
+    xEuler = xMatrixWorld.to_euler("XYZ")
+    xEuler.z = xPlacementRotation.to_euler("XYZ").z
+    xRotScale = xEuler.to_matrix() @ mathutils.Matrix.Diagonal(xMatrixWorld.to_scale())
+
+    xHead = _objArmature.pose.bones[_sRootBone].head + _xShift
+    xMatrix = xRotScale.to_4x4()
+    xMatrix.translation = _xSeatMatrix.translation - xRotScale @ xHead
+    return xMatrix
+
+
+# enddef
+
+
+##############################################################################################################
+def PlaceHumansOnSeats(
+    _lPlacements: list,
+    _fRotateZ: float = math.pi,
+    _xShift=None,
+    _bPoseRoot: bool = True,
+    _iFrameNumber: int = 1,
+    _sRootBone: str = "spine",
+):
+    """
+    Place several humans, e.g. all passengers of a vehicle cabin, on the seats defined by empties in the scene.
+
+    This gives the same result as DoPlaceHumanOnSeat() with _bApplyConstraints=True for every human, but the
+    transformations are computed directly from the world matrices of the seat empties and the rest matrices
+    of the root bones. No operators, constraints or placement empties are used and the view layer is updated
+    only once, after all humans have been placed.
+
+    Parameters
+    ----------
+    _lPlacements : list
+        Tuples (armature object, seat base name), e.g. [(objDriver, "seat_1"), (objPassenger, "seat_2")]
+    _fRotateZ : float
+        Rotation around z-Axis (i.e. up-Axis) in radians, default value is math.pi
+    _xShift : mathutil.Vector[3]
+        Shift in Armature coordinates to fine tune asset placement, default no shift
+    _bPoseRoot : bool
+        If True, the placement is moved into the pose of the root bone and keyed at _iFrameNumber, and the
+        armature object transformation is reset, as for applied constraints. Otherwise, the placement is set
+        as world matrix of the armature object.
+    _iFrameNumber : int
+        The frame number to insert the keyframe in the pose animation
+    _sRootBone : str
+        Name of the root bone
+    """
+    xShift = mathutils.Vector((0.0, 0.0, 0.0)) if _xShift is None else mathutils.Vector(_xShift)
+
+    for objArmature, sSeatBasename in _lPlacements:
+        xSeatMatrix = GetSeatRegistry(sSeatBasename).GetMatrix(sSeatBasename, "seat")
+        xMatrixWorld = GetSeatPlacementMatrix(objArmature, xSeatMatrix, _fRotateZ, xShift, _sRootBone)
+
+        if not _bPoseRoot:
+            objArmature.matrix_world = xMatrixWorld
+            continue
+        # endif
+
+        # move the object transformation into the root pose-bone transformation, see DoPlaceHumanOnSeat()
+        xRootBone = objArmature.pose.bones[_sRootBone]
+        xRootBone.rotation_mode = "QUATERNION"
+        xRootRestMatrix = objArmature.data.bones[_sRootBone].matrix_local
+        xTransformRoot = xRootRestMatrix.inverted() @ xMatrixWorld @ xRootRestMatrix
+        xRootRotationNew = xTransformRoot.to_3x3() @ xRootBone.rotation_quaternion.to_matrix()
+        xRootBone.rotation_quaternion = xRootRotationNew.to_quaternion()
+        xRootBone.location = xTransformRoot @ xRootBone.location
+
+        xRootBone.keyframe_insert(data_path="rotation_quaternion", frame=_iFrameNumber)
+        xRootBone.keyframe_insert(data_path="location", frame=_iFrameNumber)
+        objArmature.data.bones[_sRootBone].use_local_location = True
+
+        objArmature.rotation_mode = "QUATERNION"
+        objArmature.location = mathutils.Vector((0, 0, 0))
+        objArmature.rotation_quaternion = mathutils.Matrix.Identity(3).to_quaternion()
+    # endfor
+
+    bpy.context.view_layer.update()
+
+
+# enddef
+
+
 ##############################################################################################################
 def PlaceHumanOnSeat(obj, args, sMode, **kwargs):
     """
@@ -443,11 +553,105 @@ def PlaceHumanOnSeat(obj, args, sMode, **kwargs):
 # enddef
 
 
+##############################################################################################################
+def _MapImageFilePath(_sPath: str, _lPrefixes: list) -> Optional[str]:
+    """Return the new path of an image for the prefix table _lPrefixes of (base folder name, new path),
+    or None if the path does not contain any of the base folders or has already been relinked"""
+    for _, sNewPrefix in _lPrefixes:
+        if _sPath.startswith(sNewPrefix):
+            return None
+        # endif
+    # endfor
+
+    for sBase, sNewPrefix in _lPrefixes:
+        iStartPos = _sPath.find(sBase)
+        if iStartPos >= 0:
+            return sNewPrefix + _sPath[iStartPos + len(sBase) :]
+        # endif
+    # endfor
+
+    return None
+
+
+# enddef
+
+
+##############################################################################################################
+def RelinkImageFilePaths(_dicPrefixes: dict, _lHumans: Optional[list] = None) -> int:
+    """
+    Rewrite the file paths of images in one pass over the image datablocks.
+
+    The part of a path up to and including a base folder name, i.e. a key of _dicPrefixes, is replaced
+    by the new path of the base folder. Every path is mapped only once, also if several images or
+    materials share it, and images whose path already starts with one of the new paths are skipped.
+
+    Parameters
+    ----------
+    _dicPrefixes : dict
+        {base folder name: new path}, e.g. {"HumanGeneratorV3": <HumGen asset library path>}
+    _lHumans : list, optional
+        Humans whose images are relinked, all images of the scene if not given
+
+    Returns
+    -------
+    int
+        number of images with a changed file path
+    """
+    if _lHumans is None:
+        lImages = list(bpy.data.images)
+    else:
+        setMaterials = {
+            xSlot.material
+            for objHuman in _lHumans
+            for objChild in objHuman.children
+            for xSlot in objChild.material_slots
+            if xSlot.material is not None and xSlot.material.node_tree is not None
+        }
+        lImages = list(
+            {
+                xNode.image
+                for xMaterial in setMaterials
+                for xNode in xMaterial.node_tree.nodes
+                if getattr(xNode, "image", None) is not None
+            }
+        )
+    # endif
+
+    lPrefixes = list(_dicPrefixes.items())
+    dicNewPaths = {}
+    iCount = 0
+    for xImage in lImages:
+        sOrigPath = xImage.filepath
+        if sOrigPath not in dicNewPaths:
+            dicNewPaths[sOrigPath] = _MapImageFilePath(sOrigPath, lPrefixes)
+        # endif
+
+        sNewPath = dicNewPaths[sOrigPath]
+        if sNewPath is not None and sNewPath != sOrigPath:
+            xImage.filepath = sNewPath
+            iCount += 1
+        # endif
+    # endfor
+
+    return iCount
+
+
+# enddef
+
+
 ##############################################################################################################
 def UpdateImageFilePath(obj, args, sMode):
     """
     Update all material nodes of a human to use the proper HumGen asset library path.
 
+    The args dictionary supports the following settings:
+
+    - sBase: name of the HumGen asset folder in the original image paths, default "HumanGeneratorV3"
+    - lHumans: names of further humans that are updated in the same pass, e.g. a whole crowd
+    - bAllImages: update all images of the scene, default False
+
+    See RelinkImageFilePaths() for details.
+
     Parameters
     ----------
     obj : Blender object
@@ -461,21 +665,13 @@ def UpdateImageFilePath(obj, args, sMode):
 
     sBase = args.get("sBase", "HumanGeneratorV3")
 
-    for child in obj.children:
-        for materialSlot in child.material_slots:
-            for node in materialSlot.material.node_tree.nodes:
-                if hasattr(node, "image") and node.image is not None:
-                    sOrigPath = node.image.filepath
-
-                    aStartPos = sOrigPath.find(sBase)
-
-                    sNewPath = sAddonPath + sOrigPath[aStartPos + len(sBase) :]
+    if args.get("bAllImages", False) is True:
+        lHumans = None
+    else:
+        lHumans = [obj] + [bpy.data.objects[sName] for sName in args.get("lHumans", []) if sName != obj.name]
+    # endif
 
-                    node.image.filepath = sNewPath
-                # endif
-            # endfor
-        # endfor
-    # endfor
+    RelinkImageFilePaths({sBase: sAddonPath}, lHumans)
 
     lRevertHandler = []
     if sMode == "INIT":
@@ -505,6 +701,9 @@ def ReplaceMaterials(obj, args, sMode, **kwargs):
     """
     Switches all material nodes of a human to a material from an addon asset library.
 
+    The library is opened once per process, see cls_material_library.CMaterialLibrary. Every material
+    is appended once and shared by all humans, each garment gets a randomized copy of it.
+
     The args dictionary supports the following settings:
 
     - sReplacementBlendFile: Path to the asset library
@@ -549,38 +748,23 @@ def ReplaceMaterials(obj, args, sMode, **kwargs):
 
     sLibPath = args["sReplacementBlendFile"]
 
-    with bpy.data.libraries.load(sLibPath, link=True) as (data_src, data_dst):
-        data_dst.texts = ["RandomizeShader.py"]
+    xMaterialLibrary = GetMaterialLibrary(sLibPath)
+    xReplaceModule = xMaterialLibrary.xRandomizeModule
 
-    xReplaceModule = data_dst.texts[0].as_module()
+    name2materials = xReplaceModule.name2materials
+    if bFilterGender:
+        name2materials = filterByGender(name2materials)
+    # endif
 
     for xChild in obj.children:
-        name2materials = xReplaceModule.name2materials
-
-        if bFilterGender:
-            name2materials = filterByGender(name2materials)
-        # endif
-
         for sName, lMaterials in name2materials.items():
             if sName in xChild.name:
                 sMaterial = random.choice(lMaterials)
-                # Link the material
-                with bpy.data.libraries.load(sLibPath, link=False) as (data_src, data_dst):
-                    data_dst.materials = [sMaterial]
-                # endwith
-
-                if len(data_dst.materials) == 0 or data_dst.materials[0] is None:
-                    raise RuntimeError(f"Material with name {sMaterial} not found in {sLibPath}")
-                # endif
-
-                for mat in data_dst.materials:
-                    xChild.data.materials[0] = mat
-                # endfor
+                # copy of the material, which is appended from the library only once
+                xChild.data.materials[0] = xMaterialLibrary.GetMaterialInstance(sMaterial)
 
                 # then call the randomization
                 xReplaceModule.randomizeShader(xChild.data.materials[0].name)
-
-                # TODO set original material fake user to false
             # endif
         # endfor
     # endfor
@@ -28,6 +28,8 @@
 
 
 ##################################################################
+import os
+
 try:
     import _bpy
 
@@ -38,25 +40,26 @@ except Exception:
 # endtry
 
 if bInBlenderContext is True:
-    try:
-        bl_info = {  # needs to be removed
-            "name": "Generate a random Human",
-            "blender": (2, 93, 0),
-            "category": "Object",
-        }
-
-        # from . import cls_gen_random_human
-        # ## DEBUG ##
-        import anybase.module
-
-        # anybase.module.ReloadModule(_sName="anyblend", _bChildren=True, _bDoPrint=True) # Reload module anyblend
-        anybase.module.ReloadCurrentChildModules(
-            _bDoPrint=True
-        )  # Reload all child modules of the calling function's module
-        # ###########
-    except Exception as xEx:
-        # pass
-        print(">>>> Exception importing libs:\n{}".format(str(xEx)))
+    bl_info = {  # needs to be removed
+        "name": "Generate a random Human",
+        "blender": (2, 93, 0),
+        "category": "Object",
+    }
+
+    # ## DEBUG ##
+    # Reloading the child modules is only needed while developing, to pick up changed sources
+    # without restarting Blender. It is enabled with the environment variable ANYHUMAN_DEV=1.
+    if os.environ.get("ANYHUMAN_DEV") == "1":
+        try:
+            import anybase.module
+
+            # anybase.module.ReloadModule(_sName="anyblend", _bChildren=True, _bDoPrint=True) # Reload module anyblend
+            anybase.module.ReloadCurrentChildModules(
+                _bDoPrint=True
+            )  # Reload all child modules of the calling function's module
+        except Exception as xEx:
+            print(">>>> Exception importing libs:\n{}".format(str(xEx)))
+        # endtry
     # endif
 # endif in Blender Context
 
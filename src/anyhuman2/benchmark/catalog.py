@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \catalog.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+"""Cold versus warm startup benchmark of the content catalog.
+
+Runs without Blender:
+
+    python -m anyhuman2.benchmark.catalog
+"""
+
+import time
+import tempfile
+
+from pathlib import Path
+
+from ..cls_content_catalog import CContentCatalog
+from . import content_pack
+
+
+############################################################################################
+def RunBenchmark(_iCount: int = 2000, _iRepeat: int = 10) -> dict:
+    """Measure the time to create the generator config with and without catalog cache.
+
+    Parameters
+    ----------
+    _iCount : int
+        number of files per gender and category in the synthetic content packs
+    _iRepeat : int
+        number of repetitions, the best time is reported
+
+    Returns
+    -------
+    dict
+        best cold and warm startup times in seconds
+    """
+    with tempfile.TemporaryDirectory() as sTempPath:
+        pathAddon = content_pack.CreateContentPack(Path(sTempPath) / "HumGen", _iCount, _bWritePresets=False)
+        pathCache = Path(sTempPath) / "cache"
+
+        fTimeCold = float("inf")
+        for _ in range(_iRepeat):
+            for pathFile in pathCache.glob("*.pickle"):
+                pathFile.unlink()
+            # endfor
+            fStart = time.perf_counter()
+            xCatalog = CContentCatalog(pathAddon, _sCachePath=pathCache)
+            xConfigCold = xCatalog.CreateGeneratorConfig()
+            fTimeCold = min(fTimeCold, time.perf_counter() - fStart)
+        # endfor
+
+        fTimeWarm = float("inf")
+        for _ in range(_iRepeat):
+            fStart = time.perf_counter()
+            xCatalog = CContentCatalog(pathAddon, _sCachePath=pathCache)
+            xConfigWarm = xCatalog.CreateGeneratorConfig()
+            fTimeWarm = min(fTimeWarm, time.perf_counter() - fStart)
+        # endfor
+
+        if not xCatalog.bLoadedFromCache or vars(xConfigCold) != vars(xConfigWarm):
+            raise RuntimeError("Content catalog loaded from cache differs from compiled catalog")
+        # endif
+    # endwith
+
+    dicResult = {
+        "iFileCount": sum(len(lFiles) for lFiles in content_pack.CreateFileLists(_iCount).values()),
+        "fTimeCold": fTimeCold,
+        "fTimeWarm": fTimeWarm,
+        "fSpeedup": fTimeCold / fTimeWarm,
+    }
+    print(f"Content catalog benchmark: {dicResult}")
+    return dicResult
+
+
+# enddef
+
+
+if __name__ == "__main__":
+    RunBenchmark()
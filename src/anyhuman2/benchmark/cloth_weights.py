@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cloth_weights.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+"""Benchmark of tools.FixClothBoneWeights on synthetic meshes.
+
+Run from within Blender, e.g.
+
+    blender -b --python-expr "from anyhuman2.benchmark import cloth_weights; cloth_weights.RunBenchmark()"
+"""
+
+import time
+import tempfile
+
+import bpy
+import bmesh
+import mathutils
+
+from .. import tools
+from ..cls_cloth_weight_cache import CClothWeightCache
+
+
+############################################################################################
+def _CreateSphere(_sName: str, _iSegments: int, _fRadius: float):
+    xMesh = bpy.data.meshes.new(_sName)
+    xBMesh = bmesh.new()
+    bmesh.ops.create_uvsphere(xBMesh, u_segments=_iSegments, v_segments=max(3, _iSegments // 2), radius=_fRadius)
+    xBMesh.to_mesh(xMesh)
+    xBMesh.free()
+
+    objMesh = bpy.data.objects.new(_sName, xMesh)
+    bpy.context.scene.collection.objects.link(objMesh)
+    return objMesh
+
+
+# enddef
+
+
+############################################################################################
+def CreateSyntheticSkin(_iSegments: int = 256, _iGroupCount: int = 16):
+    """Create a sphere as skin mesh, with overlapping vertex groups along the z-axis"""
+    objSkin = _CreateSphere("Bench_Skin", _iSegments, 1.0)
+    lGroups = [objSkin.vertex_groups.new(name=f"Bone.{i:03d}") for i in range(_iGroupCount)]
+
+    for xVertex in objSkin.data.vertices:
+        fBand = (xVertex.co.z + 1.0) * 0.5 * (_iGroupCount - 1)
+        iBand = min(int(fBand), _iGroupCount - 2)
+        fWeight = round(fBand - iBand, 2)
+        lGroups[iBand].add([xVertex.index], 1.0 - fWeight, "REPLACE")
+        lGroups[iBand + 1].add([xVertex.index], fWeight, "REPLACE")
+    # endfor
+
+    return objSkin
+
+
+# enddef
+
+
+############################################################################################
+def CreateSyntheticCloth(_iSegments: int = 128):
+    """Create a sphere slightly larger than the skin, with an 'inflate' shape key"""
+    objCloth = _CreateSphere("Bench_Cloth", _iSegments, 1.02)
+    objCloth.location = mathutils.Vector((0.0, 0.0, 0.01))
+
+    objCloth.shape_key_add(name="Basis")
+    xKeyBlock = objCloth.shape_key_add(name="Inflate", from_mix=False)
+    for xPoint in xKeyBlock.data:
+        xPoint.co = xPoint.co * 1.03
+    # endfor
+    xKeyBlock.value = 0.5
+
+    return objCloth
+
+
+# enddef
+
+
+############################################################################################
+def ReferenceFixClothBoneWeights(skinMesh, clothMeshes, paramMaxDist=10.0):
+    """Per-vertex implementation of tools.FixClothBoneWeights, used as reference for the weights"""
+    for clothMesh in clothMeshes:
+        skinVertexTree = mathutils.kdtree.KDTree(len(skinMesh.data.vertices))
+        for i, vertex in enumerate(skinMesh.data.vertices):
+            skinVertexTree.insert(skinMesh.matrix_world @ vertex.co, i)
+        # endfor
+        skinVertexTree.balance()
+
+        clothMesh.vertex_groups.clear()
+        for vertex_group in skinMesh.vertex_groups:
+            clothMesh.vertex_groups.new(name=vertex_group.name)
+        # endfor
+
+        for id_cloth_vertex, clothVertex in enumerate(clothMesh.data.vertices):
+            x = clothVertex.co.copy()
+            for kb in clothMesh.data.shape_keys.key_blocks:
+                x += (kb.data[id_cloth_vertex].co - clothVertex.co) * kb.value
+            # endfor
+
+            _, id_skin_vertex, dist = skinVertexTree.find(clothMesh.matrix_world @ x)
+            if dist < paramMaxDist:
+                for g in skinMesh.data.vertices[id_skin_vertex].groups:
+                    clothMesh.vertex_groups[g.group].add([id_cloth_vertex], g.weight, "ADD")
+                # endfor
+            # endif
+        # endfor
+    # endfor
+
+
+# enddef
+
+
+############################################################################################
+def GetClothWeights(_objCloth) -> dict:
+    """Return the vertex group weights of a mesh as dict {(vertex index, group name): weight}"""
+    lNames = [xGroup.name for xGroup in _objCloth.vertex_groups]
+    return {
+        (xVertex.index, lNames[xGroup.group]): xGroup.weight
+        for xVertex in _objCloth.data.vertices
+        for xGroup in xVertex.groups
+    }
+
+
+# enddef
+
+
+############################################################################################
+def RunBenchmark(_iSkinSegments: int = 256, _iClothSegments: int = 128, _iRepeat: int = 3) -> dict:
+    """Compare the per-vertex reference and the vectorized cloth weight transfer.
+
+    Returns
+    -------
+    dict
+        vertex counts, best run times in seconds, the number of differing weights
+        and the skin index and cloth weight cache counters
+    """
+    objSkin = CreateSyntheticSkin(_iSkinSegments)
+    objCloth = CreateSyntheticCloth(_iClothSegments)
+
+    try:
+        fTimeReference = float("inf")
+        for _ in range(_iRepeat):
+            fStart = time.perf_counter()
+            ReferenceFixClothBoneWeights(objSkin, [objCloth])
+            fTimeReference = min(fTimeReference, time.perf_counter() - fStart)
+        # endfor
+        dicReference = GetClothWeights(objCloth)
+
+        fTimeVectorized = float("inf")
+        for _ in range(_iRepeat):
+            fStart = time.perf_counter()
+            tools.FixClothBoneWeights(objSkin, [objCloth], _bUseWeightCache=False)
+            fTimeVectorized = min(fTimeVectorized, time.perf_counter() - fStart)
+        # endfor
+        dicVectorized = GetClothWeights(objCloth)
+
+        # persistent weight cache in a temporary folder, the first run fills it
+        xClothWeightCache = tools.xClothWeightCache
+        with tempfile.TemporaryDirectory() as sCachePath:
+            tools.xClothWeightCache = CClothWeightCache(sCachePath)
+            try:
+                fTimeCached = float("inf")
+                for _ in range(_iRepeat + 1):
+                    fStart = time.perf_counter()
+                    tools.FixClothBoneWeights(objSkin, [objCloth], _bUseWeightCache=True)
+                    fTimeCached = min(fTimeCached, time.perf_counter() - fStart)
+                # endfor
+                dicCached = GetClothWeights(objCloth)
+                iClothWeightCacheHits = tools.xClothWeightCache.iHits
+            finally:
+                tools.xClothWeightCache = xClothWeightCache
+            # endtry
+        # endwith
+
+        iDiffCount = sum(
+            1
+            for xKey in set(dicReference) | set(dicVectorized)
+            if abs(dicReference.get(xKey, 0.0) - dicVectorized.get(xKey, 0.0)) > 1e-6
+        )
+        iCachedDiffCount = sum(
+            1
+            for xKey in set(dicVectorized) | set(dicCached)
+            if abs(dicVectorized.get(xKey, 0.0) - dicCached.get(xKey, 0.0)) > 1e-6
+        )
+    finally:
+        tools.xSkinIndexCache.Invalidate(objSkin)
+        for objX in (objCloth, objSkin):
+            xMesh = objX.data
+            bpy.data.objects.remove(objX)
+            bpy.data.meshes.remove(xMesh)
+        # endfor
+    # endtry
+
+    dicResult = {
+        "iSkinVertexCount": (_iSkinSegments * (max(3, _iSkinSegments // 2) - 1) + 2),
+        "iClothVertexCount": (_iClothSegments * (max(3, _iClothSegments // 2) - 1) + 2),
+        "fTimeReference": fTimeReference,
+        "fTimeVectorized": fTimeVectorized,
+        "fTimeCached": fTimeCached,
+        "fSpeedup": fTimeReference / fTimeVectorized,
+        "iDiffCount": iDiffCount,
+        "iCachedDiffCount": iCachedDiffCount,
+        "iClothWeightCacheHits": iClothWeightCacheHits,
+        "iSkinIndexCacheHits": tools.xSkinIndexCache.iHits,
+        "iSkinIndexCacheMisses": tools.xSkinIndexCache.iMisses,
+    }
+    print(f"FixClothBoneWeights benchmark: {dicResult}")
+    return dicResult
+
+
+# enddef
+
+
+if __name__ == "__main__":
+    RunBenchmark()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \content_pack.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+"""Synthetic HumGen content pack tree for running benchmarks without a HumGen installation.
+
+The tree has the layout expected by cls_content_catalog.CContentCatalog:
+
+    <addon path>/content_packs/8K_Textures.json
+    <addon path>/content_packs/Base_Humans.json
+    <addon path>/content_packs/Base_Hair.json
+    <addon path>/content_packs/Base_Clothes.json
+    <addon path>/content_packs/Base_Poses.json
+
+together with the model presets and face hair files that are read by the parameter generators.
+"""
+
+import json
+from pathlib import Path
+
+
+############################################################################################
+def CreateFileLists(_iCount: int = 20) -> dict:
+    """Create the file lists of the content packs with _iCount entries per gender and category"""
+    lTextures = []
+    lHumans = []
+    lHair = []
+    lClothes = []
+    lPoses = []
+
+    for sGender in ("female", "male"):
+        for iIdx in range(_iCount):
+            lTextures.append(f"textures/{sGender}/Default 8K/Skin_{iIdx:03d}.png")
+            lTextures.append(f"textures/{sGender}/PBR/Skin_{iIdx:03d}_normal.png")
+            lTextures.append(f"__MACOSX/textures/{sGender}/Default 8K/._Skin_{iIdx:03d}.png")
+            lHumans.append(f"models/{sGender}/Caucasian/{sGender.title()}_{iIdx:03d}.json")
+            lHumans.append(f"models/{sGender}/Caucasian/{sGender.title()}_{iIdx:03d}.png")
+            lHair.append(f"hair/head/{sGender}/Hair_{iIdx:03d}.json")
+            lClothes.append(f"outfits/{sGender}/Casual/Outfit_{iIdx:03d}.blend")
+            lClothes.append(f"footwear/{sGender}/Shoes_{iIdx:03d}.blend")
+        # endfor
+    # endfor
+
+    for iIdx in range(_iCount):
+        lHair.append(f"hair/face_hair/Beard_{iIdx:03d}.json")
+        lPoses.append(f"poses/Base/Pose_{iIdx:03d}.blend")
+    # endfor
+
+    return {
+        "8K_Textures.json": lTextures,
+        "Base_Humans.json": lHumans,
+        "Base_Hair.json": lHair,
+        "Base_Clothes.json": lClothes,
+        "Base_Poses.json": lPoses,
+    }
+
+
+# enddef
+
+
+############################################################################################
+def CreateModelPreset(_sGender: str) -> dict:
+    """Create a HumGen model preset with the elements that are modified by the parameter generators"""
+    dicHair = {
+        "lightness": 0.5,
+        "redness": 0.5,
+        "roughness": 0.5,
+        "salt_and_pepper": 0.0,
+        "roots": 0.0,
+        "root_lightness": 0.0,
+        "root_redness": 0.0,
+        "roots_hue": 0.0,
+        "fast_or_accurate": 1.0,
+        "hue": 0.5,
+    }
+    return {
+        "age": {"set": 30, "age_color": 0.0, "age_wrinkles": 0.0},
+        "keys": {"Male": 1.0 if _sGender == "male" else 0.0, "LIVE_KEY_PERMANENT": 1.0, "LIVE_KEY_TEMP_": 0.0},
+        "skin": {
+            "tone": 1.0,
+            "redness": 0.0,
+            "saturation": 0.5,
+            "normal_strength": 2.0,
+            "roughness_multiplier": 1.5,
+            "freckles": 0.0,
+            "splotches": 0.0,
+            "texture.set": None,
+            "cavity_strength": 0.0,
+            "gender_specific": {"mustache_shadow": 0.0, "beard_shadow": 0.0},
+        },
+        "eyes": {"pupil_color": [0.5, 0.5, 0.5, 1.0], "sclera_color": [1.0, 1.0, 1.0, 1.0]},
+        "height": {"set": 175.0},
+        "hair": {
+            "eyebrows": dict(dicHair, set="Eyebrows_001"),
+            "regular_hair": dict(dicHair, set=None),
+            "face_hair": {},
+        },
+        "clothing": {"outfit": {"set": None}, "footwear": {"set": None}},
+    }
+
+
+# enddef
+
+
+############################################################################################
+def CreateFaceHairPreset() -> dict:
+    """Create a face hair file with the particle hair systems of a beard"""
+    return {"hair_systems": {sName: {"length": 0.5} for sName in ("Beard", "Moustache")}}
+
+
+# enddef
+
+
+############################################################################################
+def _WriteJson(_pathFile: Path, _xData):
+    _pathFile.parent.mkdir(parents=True, exist_ok=True)
+    with open(_pathFile, "w") as xFile:
+        json.dump(_xData, xFile)
+    # endwith
+
+
+# enddef
+
+
+############################################################################################
+def CreateContentPack(_sAddonPath: str, _iCount: int = 20, _bWritePresets: bool = True) -> Path:
+    """Write the content pack JSON files to _sAddonPath/content_packs and return the addon path.
+
+    If _bWritePresets is True, the model presets and face hair files listed in the content packs are written as well.
+    """
+    pathAddon = Path(_sAddonPath)
+
+    for sPackFile, lFiles in CreateFileLists(_iCount).items():
+        _WriteJson(pathAddon / "content_packs" / sPackFile, {"name": sPackFile.split(".")[0], "files": lFiles})
+
+        for sFile in lFiles if _bWritePresets else []:
+            if sFile.startswith("models/") and sFile.endswith(".json"):
+                _WriteJson(pathAddon / sFile, CreateModelPreset(sFile.split("/")[1]))
+            elif sFile.startswith("hair/face_hair/"):
+                _WriteJson(pathAddon / sFile, CreateFaceHairPreset())
+            # endif
+        # endfor
+    # endfor
+
+    return pathAddon
+
+
+# enddef
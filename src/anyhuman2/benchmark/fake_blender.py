@@ -0,0 +1,1181 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \fake_blender.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+"""Lightweight stand-in for the parts of bpy, mathutils, addon_utils and HumGen3D used by anyhuman2.
+
+The stand-in allows running benchmarks on plain Python, e.g. on a Linux CI machine without Blender.
+It models the data that anyhuman2 reads and writes, with the same names as the Blender API:
+
+    - mesh objects with vertex coordinates, normals, shape keys and vertex groups (foreach_get, add, remove)
+    - armature objects with edit bones, bones and pose bones with constraints
+    - object modes, where edit bones are copied to bones and pose bones when the rig leaves edit mode
+    - mathutils.Vector, mathutils.Matrix and mathutils.kdtree.KDTree
+    - HumGen3D.Human.from_preset(), which creates a rig, body and eyes of a synthetic human
+
+Nothing is evaluated or drawn. Install() registers the stand-in modules in sys.modules, so it has to be
+called before any anyhuman2 module that imports bpy is imported.
+"""
+
+import sys
+import types
+import importlib.util
+
+import numpy as np
+
+
+############################################################################################
+class Vector:
+    """Subset of mathutils.Vector, backed by a numpy array"""
+
+    __slots__ = ("_aData",)
+
+    def __init__(self, _xValues=(0.0, 0.0, 0.0)):
+        self._aData = np.array(_xValues, dtype=np.float64).ravel()
+
+    # enddef
+
+    def __array__(self, dtype=None, copy=None):
+        return self._aData if dtype is None else self._aData.astype(dtype)
+
+    # enddef
+
+    def __len__(self) -> int:
+        return len(self._aData)
+
+    # enddef
+
+    def __iter__(self):
+        return iter(self._aData.tolist())
+
+    # enddef
+
+    def __getitem__(self, _iIdx):
+        return self._aData[_iIdx]
+
+    # enddef
+
+    def __setitem__(self, _iIdx, _fValue):
+        self._aData[_iIdx] = _fValue
+
+    # enddef
+
+    def __add__(self, _xOther):
+        return Vector(self._aData + np.asarray(_xOther, dtype=np.float64))
+
+    # enddef
+
+    def __sub__(self, _xOther):
+        return Vector(self._aData - np.asarray(_xOther, dtype=np.float64))
+
+    # enddef
+
+    def __mul__(self, _fValue):
+        return Vector(self._aData * _fValue)
+
+    # enddef
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, _fValue):
+        return Vector(self._aData / _fValue)
+
+    # enddef
+
+    def __neg__(self):
+        return Vector(-self._aData)
+
+    # enddef
+
+    def __eq__(self, _xOther):
+        return np.array_equal(self._aData, np.asarray(_xOther, dtype=np.float64))
+
+    # enddef
+
+    def __repr__(self) -> str:
+        return f"Vector({tuple(self._aData.tolist())})"
+
+    # enddef
+
+    x = property(lambda self: self._aData[0], lambda self, fValue: self.__setitem__(0, fValue))
+    y = property(lambda self: self._aData[1], lambda self, fValue: self.__setitem__(1, fValue))
+    z = property(lambda self: self._aData[2], lambda self, fValue: self.__setitem__(2, fValue))
+
+    @property
+    def length(self) -> float:
+        return float(np.linalg.norm(self._aData))
+
+    # enddef
+
+    def copy(self):
+        return Vector(self._aData)
+
+    # enddef
+
+    def cross(self, _xOther):
+        return Vector(np.cross(self._aData, np.asarray(_xOther, dtype=np.float64)))
+
+    # enddef
+
+    def dot(self, _xOther) -> float:
+        return float(np.dot(self._aData, np.asarray(_xOther, dtype=np.float64)))
+
+    # enddef
+
+    def normalized(self):
+        fLength = self.length
+        return Vector(self._aData / fLength) if fLength > 0.0 else self.copy()
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class Matrix:
+    """Subset of mathutils.Matrix, backed by a numpy array"""
+
+    __slots__ = ("_aData",)
+
+    def __init__(self, _xRows=None):
+        self._aData = np.identity(4) if _xRows is None else np.array(_xRows, dtype=np.float64)
+
+    # enddef
+
+    @classmethod
+    def Identity(cls, _iSize: int):
+        return cls(np.identity(_iSize))
+
+    # enddef
+
+    @classmethod
+    def Translation(cls, _xVector):
+        aData = np.identity(4)
+        aData[:3, 3] = np.asarray(_xVector, dtype=np.float64)
+        return cls(aData)
+
+    # enddef
+
+    def __array__(self, dtype=None, copy=None):
+        return self._aData if dtype is None else self._aData.astype(dtype)
+
+    # enddef
+
+    def __len__(self) -> int:
+        return len(self._aData)
+
+    # enddef
+
+    def __iter__(self):
+        return (Vector(aRow) for aRow in self._aData)
+
+    # enddef
+
+    def __getitem__(self, _iRow):
+        return Vector(self._aData[_iRow])
+
+    # enddef
+
+    def __matmul__(self, _xOther):
+        if isinstance(_xOther, Matrix):
+            return Matrix(self._aData @ _xOther._aData)
+        # endif
+        aVector = np.asarray(_xOther, dtype=np.float64)
+        if len(self._aData) == 4 and len(aVector) == 3:
+            return Vector(self._aData[:3, :3] @ aVector + self._aData[:3, 3])
+        # endif
+        return Vector(self._aData @ aVector)
+
+    # enddef
+
+    def __repr__(self) -> str:
+        return f"Matrix({self._aData.tolist()})"
+
+    # enddef
+
+    @property
+    def translation(self):
+        return Vector(self._aData[:3, 3])
+
+    # enddef
+
+    def copy(self):
+        return Matrix(self._aData)
+
+    # enddef
+
+    def inverted(self):
+        return Matrix(np.linalg.inv(self._aData))
+
+    # enddef
+
+    def to_3x3(self):
+        return Matrix(self._aData[:3, :3])
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class KDTree:
+    """mathutils.kdtree.KDTree with a brute force search, which is sufficient for benchmark meshes"""
+
+    def __init__(self, _iSize: int):
+        self._lPoints: list = []
+        self._lIndices: list = []
+        self._aPoints: np.ndarray = None
+        self._aIndices: np.ndarray = None
+
+    # enddef
+
+    def insert(self, _xCo, _iIndex: int):
+        self._lPoints.append(np.asarray(_xCo, dtype=np.float64))
+        self._lIndices.append(_iIndex)
+
+    # enddef
+
+    def balance(self):
+        self._aPoints = np.array(self._lPoints, dtype=np.float64).reshape(-1, 3)
+        self._aIndices = np.array(self._lIndices, dtype=np.int64)
+
+    # enddef
+
+    def find(self, _xCo) -> tuple:
+        if self._aPoints is None or len(self._aPoints) == 0:
+            return None, None, None
+        # endif
+        aDist = np.linalg.norm(self._aPoints - np.asarray(_xCo, dtype=np.float64), axis=1)
+        iNearest = int(np.argmin(aDist))
+        return Vector(self._aPoints[iNearest]), int(self._aIndices[iNearest]), float(aDist[iNearest])
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CCollection:
+    """Ordered collection of named elements, indexed by position or by name like bpy_prop_collection"""
+
+    def __init__(self):
+        self._lItems: list = []
+
+    # enddef
+
+    def __len__(self) -> int:
+        return len(self._lItems)
+
+    # enddef
+
+    def __iter__(self):
+        return iter(list(self._lItems))
+
+    # enddef
+
+    def __contains__(self, _sName) -> bool:
+        return self.get(_sName) is not None
+
+    # enddef
+
+    def __getitem__(self, _xKey):
+        if isinstance(_xKey, str):
+            xItem = self.get(_xKey)
+            if xItem is None:
+                raise KeyError(f"bpy_prop_collection[key]: key '{_xKey}' not found")
+            # endif
+            return xItem
+        # endif
+        return self._lItems[_xKey]
+
+    # enddef
+
+    def get(self, _sName: str, _xDefault=None):
+        for xItem in self._lItems:
+            if xItem.name == _sName:
+                return xItem
+            # endif
+        # endfor
+        return _xDefault
+
+    # enddef
+
+    def keys(self) -> list:
+        return [xItem.name for xItem in self._lItems]
+
+    # enddef
+
+    def _Append(self, _xItem):
+        self._lItems.append(_xItem)
+        return _xItem
+
+    # enddef
+
+    def remove(self, _xItem):
+        self._lItems.remove(_xItem)
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CIDCollection(CCollection):
+    """Collection of data-blocks, e.g. bpy.data.objects, with unique names and a name index"""
+
+    def __init__(self, _funcCreate=None):
+        super().__init__()
+        self._funcCreate = _funcCreate
+        self._dicByName: dict = {}
+
+    # enddef
+
+    def get(self, _sName: str, _xDefault=None):
+        return self._dicByName.get(_sName, _xDefault)
+
+    # enddef
+
+    def _Append(self, _xItem):
+        sName = _xItem.name
+        iSuffix = 0
+        while sName in self._dicByName:
+            iSuffix += 1
+            sName = f"{_xItem.name}.{iSuffix:03d}"
+        # endwhile
+        _xItem.name = sName
+        self._dicByName[sName] = _xItem
+        return super()._Append(_xItem)
+
+    # enddef
+
+    def new(self, *args, **kwargs):
+        return self._Append(self._funcCreate(*args, **kwargs))
+
+    # enddef
+
+    def remove(self, _xItem, do_unlink: bool = True):
+        del self._dicByName[_xItem.name]
+        super().remove(_xItem)
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CVertexGroupElement:
+    __slots__ = ("group", "weight")
+
+    def __init__(self, _iGroup: int, _fWeight: float):
+        self.group: int = _iGroup
+        self.weight: float = _fWeight
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CVertex:
+    """Vertex of a mesh, a view on the arrays of CMesh"""
+
+    __slots__ = ("_xMesh", "index")
+
+    def __init__(self, _xMesh, _iIndex: int):
+        self._xMesh = _xMesh
+        self.index: int = _iIndex
+
+    # enddef
+
+    co = property(lambda self: Vector(self._xMesh.aCo[self.index]))
+    normal = property(lambda self: Vector(self._xMesh.aNormals[self.index]))
+
+    @property
+    def groups(self) -> list:
+        return [CVertexGroupElement(iGroup, fWeight) for iGroup, fWeight in self._xMesh.lWeights[self.index].items()]
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CVertices:
+    """MeshVertices with foreach_get() for the attributes 'co' and 'normal'"""
+
+    def __init__(self, _xMesh):
+        self._xMesh = _xMesh
+
+    # enddef
+
+    def __len__(self) -> int:
+        return len(self._xMesh.aCo)
+
+    # enddef
+
+    def __getitem__(self, _iIdx: int) -> CVertex:
+        if not -len(self) <= _iIdx < len(self):
+            raise IndexError(f"bpy_prop_collection[index]: index {_iIdx} out of range")
+        # endif
+        return CVertex(self._xMesh, _iIdx % len(self))
+
+    # enddef
+
+    def __iter__(self):
+        return (CVertex(self._xMesh, iIdx) for iIdx in range(len(self)))
+
+    # enddef
+
+    def foreach_get(self, _sAttribute: str, _aData):
+        aValues = {"co": self._xMesh.aCo, "normal": self._xMesh.aNormals}[_sAttribute]
+        _aData[:] = aValues.ravel()
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CShapeKeyPoints:
+    def __init__(self, _aCo: np.ndarray):
+        self.aCo: np.ndarray = _aCo
+
+    # enddef
+
+    def __len__(self) -> int:
+        return len(self.aCo)
+
+    # enddef
+
+    def foreach_get(self, _sAttribute: str, _aData):
+        _aData[:] = self.aCo.ravel()
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CShapeKeys:
+    def __init__(self):
+        self.key_blocks = CCollection()
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CMesh:
+    def __init__(self, _sName: str, _aCo=None, _aNormals=None):
+        self.name: str = _sName
+        self.aCo: np.ndarray = np.zeros((0, 3)) if _aCo is None else np.asarray(_aCo, dtype=np.float32)
+        if _aNormals is None:
+            aLength = np.linalg.norm(self.aCo, axis=1, keepdims=True)
+            _aNormals = np.divide(self.aCo, aLength, out=np.zeros_like(self.aCo), where=aLength > 0)
+        # endif
+        self.aNormals: np.ndarray = np.asarray(_aNormals, dtype=np.float32)
+        # vertex group weights per vertex as dict {group index: weight}
+        self.lWeights: list = [{} for _ in range(len(self.aCo))]
+        self.vertices = CVertices(self)
+        self.shape_keys: CShapeKeys = None
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CVertexGroup:
+    def __init__(self, _objOwner, _sName: str, _iIndex: int):
+        self._objOwner = _objOwner
+        self.name: str = _sName
+        self.index: int = _iIndex
+
+    # enddef
+
+    def add(self, _lIndices, _fWeight: float, _sType: str):
+        lWeights = self._objOwner.data.lWeights
+        for iVertex in _lIndices:
+            dicWeights = lWeights[iVertex]
+            if _sType == "REPLACE":
+                dicWeights[self.index] = _fWeight
+            elif _sType == "ADD":
+                dicWeights[self.index] = min(1.0, dicWeights.get(self.index, 0.0) + _fWeight)
+            elif _sType == "SUBTRACT":
+                dicWeights[self.index] = max(0.0, dicWeights.get(self.index, 0.0) - _fWeight)
+            else:
+                raise TypeError(f"VertexGroup.add(): unknown type '{_sType}'")
+            # endif
+        # endfor
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CVertexGroups(CCollection):
+    """Vertex groups of a mesh object, removing a group shifts the indices of the following groups"""
+
+    def __init__(self, _objOwner):
+        super().__init__()
+        self._objOwner = _objOwner
+        self._dicByName: dict = {}
+
+    # enddef
+
+    def get(self, _sName: str, _xDefault=None):
+        return self._dicByName.get(_sName, _xDefault)
+
+    # enddef
+
+    def new(self, name: str = "Group"):
+        sName = name
+        iSuffix = 0
+        while sName in self._dicByName:
+            iSuffix += 1
+            sName = f"{name}.{iSuffix:03d}"
+        # endwhile
+        xGroup = self._Append(CVertexGroup(self._objOwner, sName, len(self)))
+        self._dicByName[sName] = xGroup
+        return xGroup
+
+    # enddef
+
+    def remove(self, _xGroup):
+        iRemoved = _xGroup.index
+        super().remove(_xGroup)
+        del self._dicByName[_xGroup.name]
+        for iIdx, xGroup in enumerate(self._lItems):
+            xGroup.index = iIdx
+        # endfor
+        for iVertex, dicWeights in enumerate(self._objOwner.data.lWeights):
+            if dicWeights:
+                self._objOwner.data.lWeights[iVertex] = {
+                    iGroup - (iGroup > iRemoved): fWeight
+                    for iGroup, fWeight in dicWeights.items()
+                    if iGroup != iRemoved
+                }
+            # endif
+        # endfor
+
+    # enddef
+
+    def clear(self):
+        self._lItems = []
+        self._dicByName = {}
+        lWeights = self._objOwner.data.lWeights
+        for iVertex in range(len(lWeights)):
+            lWeights[iVertex] = {}
+        # endfor
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CEditBone:
+    def __init__(self, _sName: str):
+        self.name: str = _sName
+        self.head = Vector((0.0, 0.0, 0.0))
+        self.tail = Vector((0.0, 1.0, 0.0))
+        self.parent: "CEditBone" = None
+        self.use_connect: bool = False
+        self.envelope_distance: float = 0.25
+        self.head_radius: float = 0.1
+
+    # enddef
+
+    def __setattr__(self, _sName: str, _xValue):
+        if _sName in ("head", "tail"):
+            _xValue = Vector(_xValue)
+        # endif
+        object.__setattr__(self, _sName, _xValue)
+
+    # enddef
+
+    @property
+    def length(self) -> float:
+        return (self.tail - self.head).length
+
+    # enddef
+
+    @length.setter
+    def length(self, _fLength: float):
+        xDirection = (self.tail - self.head).normalized()
+        self.tail = self.head + xDirection * _fLength
+
+    # enddef
+
+    @property
+    def matrix(self):
+        return Matrix.Translation(self.head)
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CEditBones(CIDCollection):
+    def __init__(self):
+        super().__init__(CEditBone)
+
+    # enddef
+
+    def new(self, _sName: str):
+        return self._Append(CEditBone(_sName))
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CBone:
+    """Bone of an armature in rest pose, created from an edit bone when the rig leaves edit mode"""
+
+    def __init__(self, _xEditBone: CEditBone, _xParent):
+        self.name: str = _xEditBone.name
+        self.parent: "CBone" = _xParent
+        self.head_local = _xEditBone.head.copy()
+        self.tail_local = _xEditBone.tail.copy()
+        self.matrix_local = _xEditBone.matrix
+        self.use_connect: bool = _xEditBone.use_connect
+        self.envelope_distance: float = _xEditBone.envelope_distance
+        self.head_radius: float = _xEditBone.head_radius
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CArmature:
+    def __init__(self, _sName: str):
+        self.name: str = _sName
+        self.bones = CIDCollection()
+        self.edit_bones = CEditBones()
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CConstraint:
+    """Constraint of a pose bone, all properties can be set"""
+
+    def __init__(self, _sType: str, _sName: str):
+        object.__setattr__(self, "type", _sType)
+        self.name: str = _sName
+        self.target = None
+        self.subtarget: str = ""
+        self.influence: float = 1.0
+
+    # enddef
+
+    def __setattr__(self, _sName: str, _xValue):
+        if _sName == "type":
+            raise AttributeError("bpy_struct: attribute 'type' from 'Constraint' is read-only")
+        # endif
+        object.__setattr__(self, _sName, _xValue)
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CConstraints(CCollection):
+    def new(self, _sType: str):
+        return self._Append(CConstraint(_sType, _sType.replace("_", " ").title()))
+
+    # enddef
+
+    def copy(self, _xConstraint: CConstraint):
+        xNew = self.new(_xConstraint.type)
+        for sName, xValue in vars(_xConstraint).items():
+            if sName != "type":
+                setattr(xNew, sName, xValue)
+            # endif
+        # endfor
+        return xNew
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CPoseBone:
+    def __init__(self, _sName: str):
+        self.name: str = _sName
+        self.constraints = CConstraints()
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CPose:
+    def __init__(self):
+        self.bones = CIDCollection()
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class CObject:
+    def __init__(self, _sName: str, _xData):
+        self.name: str = _sName
+        self.data = _xData
+        self.type: str = {CMesh: "MESH", CArmature: "ARMATURE"}.get(type(_xData), "EMPTY")
+        self.mode: str = "OBJECT"
+        self.matrix_world = Matrix()
+        self.location = Vector((0.0, 0.0, 0.0))
+        self.vertex_groups = CVertexGroups(self)
+        self.pose = CPose() if self.type == "ARMATURE" else None
+        self.dicProperties: dict = {}
+
+    # enddef
+
+    def __getitem__(self, _sKey: str):
+        return self.dicProperties[_sKey]
+
+    # enddef
+
+    def __setitem__(self, _sKey: str, _xValue):
+        self.dicProperties[_sKey] = _xValue
+
+    # enddef
+
+    def get(self, _sKey: str, _xDefault=None):
+        return self.dicProperties.get(_sKey, _xDefault)
+
+    # enddef
+
+    def as_pointer(self) -> int:
+        return id(self)
+
+    # enddef
+
+    def evaluated_get(self, _xDepsgraph):
+        return self
+
+    # enddef
+
+    def shape_key_add(self, name: str = "Key", from_mix: bool = True):
+        xMesh = self.data
+        if xMesh.shape_keys is None:
+            xMesh.shape_keys = CShapeKeys()
+        # endif
+        xKeyBlock = types.SimpleNamespace(name=name, value=0.0, data=CShapeKeyPoints(xMesh.aCo.copy()))
+        return xMesh.shape_keys.key_blocks._Append(xKeyBlock)
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+def _EnterEditMode(_objRig):
+    xArmature = _objRig.data
+    xArmature.edit_bones = CEditBones()
+    dicEditBones = {}
+    for xBone in xArmature.bones:
+        xEditBone = xArmature.edit_bones.new(xBone.name)
+        xEditBone.head = xBone.head_local
+        xEditBone.tail = xBone.tail_local
+        xEditBone.parent = dicEditBones.get(xBone.parent.name) if xBone.parent is not None else None
+        xEditBone.use_connect = xBone.use_connect
+        xEditBone.envelope_distance = xBone.envelope_distance
+        xEditBone.head_radius = xBone.head_radius
+        dicEditBones[xBone.name] = xEditBone
+    # endfor
+
+
+# enddef
+
+
+############################################################################################
+def _LeaveEditMode(_objRig):
+    """Copy the edit bones to the bones and rebuild the pose, keeping the constraints of existing pose bones"""
+    xArmature = _objRig.data
+    xArmature.bones = CIDCollection()
+    for xEditBone in xArmature.edit_bones:
+        xParent = xArmature.bones.get(xEditBone.parent.name) if xEditBone.parent is not None else None
+        xArmature.bones._Append(CBone(xEditBone, xParent))
+    # endfor
+
+    xPoseBones = _objRig.pose.bones
+    _objRig.pose.bones = CIDCollection()
+    for xBone in xArmature.bones:
+        _objRig.pose.bones._Append(xPoseBones.get(xBone.name) or CPoseBone(xBone.name))
+    # endfor
+
+
+# enddef
+
+
+############################################################################################
+def ModeSet(mode: str = "OBJECT"):
+    """bpy.ops.object.mode_set() for the active object"""
+    objActive = bpy.context.view_layer.objects.active
+    if objActive is None:
+        raise RuntimeError("Operator bpy.ops.object.mode_set.poll() failed, context is incorrect")
+    # endif
+    if objActive.type == "ARMATURE":
+        if objActive.mode != "EDIT" and mode == "EDIT":
+            _EnterEditMode(objActive)
+        elif objActive.mode == "EDIT" and mode != "EDIT":
+            _LeaveEditMode(objActive)
+        # endif
+    # endif
+    objActive.mode = mode
+    return {"FINISHED"}
+
+
+# enddef
+
+
+############################################################################################
+def CreateMeshObject(_sName: str, _aCo: np.ndarray, _aNormals: np.ndarray = None) -> CObject:
+    """Create a mesh object with the vertex coordinates _aCo and link it to the scene"""
+    xMesh = bpy.data.meshes.new(_sName, _aCo, _aNormals)
+    objMesh = bpy.data.objects.new(_sName, xMesh)
+    bpy.context.scene.collection.objects.link(objMesh)
+    return objMesh
+
+
+# enddef
+
+
+############################################################################################
+def CreateArmatureObject(_sName: str, _lBones: list) -> CObject:
+    """Create an armature object with the bones _lBones as tuples (name, parent name, head, tail)"""
+    objRig = bpy.data.objects.new(_sName, bpy.data.armatures.new(_sName))
+    bpy.context.scene.collection.objects.link(objRig)
+
+    objActive = bpy.context.view_layer.objects.active
+    bpy.context.view_layer.objects.active = objRig
+    ModeSet(mode="EDIT")
+    xEditBones = objRig.data.edit_bones
+    for sName, sParent, tHead, tTail in _lBones:
+        xEditBone = xEditBones.new(sName)
+        xEditBone.head = tHead
+        xEditBone.tail = tTail
+        xEditBone.parent = xEditBones.get(sParent) if sParent is not None else None
+    # endfor
+    ModeSet(mode="OBJECT")
+    bpy.context.view_layer.objects.active = objActive
+
+    return objRig
+
+
+# enddef
+
+
+############################################################################################
+def CreateSpherePoints(_iCount: int, _fRadius: float = 1.0, _iSeed: int = 0) -> np.ndarray:
+    """Return _iCount points evenly distributed on a sphere, on a Fibonacci lattice"""
+    aIdx = np.arange(_iCount, dtype=np.float64) + 0.5
+    aPhi = np.arccos(1.0 - 2.0 * aIdx / _iCount)
+    aTheta = np.pi * (1.0 + 5.0**0.5) * aIdx + _iSeed
+    return _fRadius * np.stack(
+        (np.cos(aTheta) * np.sin(aPhi), np.sin(aTheta) * np.sin(aPhi), np.cos(aPhi)), axis=1
+    ).astype(np.float32)
+
+
+# enddef
+
+
+# bones of the synthetic HumGen rig as tuples (name, parent name, head, tail)
+lHumanBones: list = [
+    ("root", None, (0.0, 0.0, 0.0), (0.0, 0.1, 0.0)),
+    ("spine", "root", (0.0, 0.0, 1.0), (0.0, 0.0, 1.4)),
+    ("neck", "spine", (0.0, 0.0, 1.4), (0.0, 0.0, 1.55)),
+    ("head", "neck", (0.0, 0.0, 1.55), (0.0, 0.0, 1.8)),
+    ("jaw", "head", (0.0, -0.02, 1.6), (0.0, -0.08, 1.58)),
+]
+for sSide, fSide in (("l", 1.0), ("r", -1.0)):
+    lHumanBones.append((f"hand_{sSide}", "spine", (fSide * 0.7, 0.0, 1.0), (fSide * 0.8, 0.0, 1.0)))
+    for iFinger, sFinger in enumerate(("thumb", "index", "middle", "ring", "pinky")):
+        sParent = f"hand_{sSide}"
+        fY = 0.02 * (iFinger - 2)
+        for iPhalanx, sPhalanx in enumerate(("01", "02", "03", "end")):
+            fX = fSide * (0.8 + 0.03 * iPhalanx)
+            sBone = f"{sFinger}_{sPhalanx}_{sSide}"
+            lHumanBones.append((sBone, sParent, (fX, fY, 1.0), (fX + fSide * 0.03, fY, 1.0)))
+            sParent = sBone
+        # endfor
+    # endfor
+# endfor
+
+
+############################################################################################
+class CHumanObjects:
+    def __init__(self, _objRig, _objBody, _objEyes):
+        self.rig = _objRig
+        self.body = _objBody
+        self.eyes = _objEyes
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+class Human:
+    """Stand-in for HumGen3D.Human, creates a rig with the HumGen bone names, a body and eyes"""
+
+    # vertex counts of the synthetic body and eyes, larger than the vertex indices of the label mapping files
+    iBodyVertexCount: int = 10000
+    iEyesVertexCount: int = 3000
+
+    def __init__(self, _sName: str):
+        self.objects = CHumanObjects(
+            CreateArmatureObject(_sName, lHumanBones),
+            CreateMeshObject("HG_Body", CreateSpherePoints(self.iBodyVertexCount, 0.3)),
+            CreateMeshObject("HG_Eyes", CreateSpherePoints(self.iEyesVertexCount, 0.02)),
+        )
+        self.hair = types.SimpleNamespace(particle_systems={})
+        self.expression = types.SimpleNamespace(load_facial_rig=lambda: None)
+
+    # enddef
+
+    @property
+    def name(self) -> str:
+        return self.objects.rig.name
+
+    # enddef
+
+    @name.setter
+    def name(self, _sName: str):
+        self.objects.rig.name = _sName
+
+    # enddef
+
+    @staticmethod
+    def get_preset_options(_sGender: str, context=None) -> list:
+        return [f"models/{_sGender}/Caucasian/{_sGender.title()}_000.json"]
+
+    # enddef
+
+    @classmethod
+    def from_preset(cls, _dicPreset: dict, context=None):
+        xHuman = cls("HG_Human")
+        for sSystem in (_dicPreset.get("hair", {}).get("face_hair") or {}).get("hair_systems", {}):
+            xSettings = bpy.data.particles.new(sSystem)
+            xHuman.hair.particle_systems[sSystem] = types.SimpleNamespace(settings=xSettings)
+        # endfor
+        return xHuman
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+def _CreateBpy(_sAddonPath: str) -> types.ModuleType:
+    xBpy = types.ModuleType("bpy")
+    xBpy.bFake = True
+    xBpy.types = types.SimpleNamespace(
+        Object=CObject, Mesh=CMesh, Armature=CArmature, EditBone=CEditBone, PoseBone=CPoseBone
+    )
+    xBpy.data = types.SimpleNamespace(
+        objects=CIDCollection(CObject),
+        meshes=CIDCollection(CMesh),
+        armatures=CIDCollection(CArmature),
+        particles=CIDCollection(lambda sName: types.SimpleNamespace(name=sName, child_length=1.0)),
+    )
+
+    xSceneObjects = CCollection()
+    xSceneObjects.link = xSceneObjects._Append
+    xSceneObjects.unlink = xSceneObjects.remove
+    xPreferences = types.SimpleNamespace(
+        addons={"HumGen3D": types.SimpleNamespace(preferences={"filepath_": _sAddonPath})}
+    )
+    xBpy.context = types.SimpleNamespace(
+        view_layer=types.SimpleNamespace(objects=types.SimpleNamespace(active=None)),
+        scene=types.SimpleNamespace(collection=types.SimpleNamespace(objects=xSceneObjects)),
+        preferences=xPreferences,
+        evaluated_depsgraph_get=lambda: None,
+    )
+    xBpy.ops = types.SimpleNamespace(object=types.SimpleNamespace(mode_set=ModeSet))
+    xBpy.app = types.SimpleNamespace(version=(4, 1, 0), version_string="4.1.0 (anyhuman2 stand-in)")
+    return xBpy
+
+
+# enddef
+
+
+bpy: types.ModuleType = None
+# number of calls of addon_utils.modules(), i.e. of HumGen version probes
+iAddonProbeCount: int = 0
+
+
+############################################################################################
+def _ListAddons(*args, **kwargs) -> list:
+    """addon_utils.modules() with the HumGen add-on as only installed add-on"""
+    global iAddonProbeCount
+
+    iAddonProbeCount += 1
+    return [types.SimpleNamespace(bl_info={"name": "Human Generator 3D", "version": (4, 0, 0)})]
+
+
+# enddef
+
+
+############################################################################################
+def _CreateDictElementConverter(_funcConvert) -> callable:
+    """Create a stand-in of the anybase.convert.DictElementTo* functions, which convert with _funcConvert"""
+
+    def DictElementTo(_dicData: dict, _sElement: str, bDoRaise: bool = True, **kwargs):
+        # the default value argument is named after its type, e.g. fDefault or lDefault
+        lDefaults = [xValue for sArg, xValue in kwargs.items() if sArg.endswith("Default")]
+        if _sElement not in _dicData:
+            if lDefaults:
+                return lDefaults[0]
+            # endif
+            if bDoRaise:
+                raise RuntimeError(f"Element '{_sElement}' not found in dictionary")
+            # endif
+            return None
+        # endif
+        return _funcConvert(_dicData[_sElement])
+
+    # enddef
+
+    return DictElementTo
+
+
+# enddef
+
+
+############################################################################################
+def _CreateAnybase() -> types.ModuleType:
+    """Create the anybase module with the convert functions used by anyhuman2"""
+    xAnybase = types.ModuleType("anybase")
+    xAnybase.convert = types.ModuleType("anybase.convert")
+    xAnybase.convert.DictElementToBool = _CreateDictElementConverter(bool)
+    xAnybase.convert.DictElementToInt = _CreateDictElementConverter(int)
+    xAnybase.convert.DictElementToFloat = _CreateDictElementConverter(float)
+    xAnybase.convert.DictElementToString = _CreateDictElementConverter(str)
+    xAnybase.convert.DictElementToFloatList = _CreateDictElementConverter(lambda lValue: [float(x) for x in lValue])
+    return xAnybase
+
+
+# enddef
+
+
+############################################################################################
+def Install(_sAddonPath: str = "") -> bool:
+    """Register the stand-in modules bpy, mathutils, mathutils.kdtree, addon_utils and HumGen3D.
+
+    The anybase module is replaced by a stand-in with the convert functions, if it is not installed.
+
+    Nothing is installed, if the real bpy module can be imported, i.e. when running within Blender.
+
+    Parameters
+    ----------
+    _sAddonPath : str
+        HumGen content folder, returned as 'filepath_' by the HumGen add-on preferences
+
+    Returns
+    -------
+    bool
+        True, if the stand-in modules are installed
+    """
+    global bpy
+
+    if bpy is not None:
+        bpy.context.preferences.addons["HumGen3D"].preferences["filepath_"] = _sAddonPath
+        return True
+    # endif
+    if "bpy" in sys.modules or importlib.util.find_spec("bpy") is not None:
+        return False
+    # endif
+
+    bpy = _CreateBpy(_sAddonPath)
+
+    xMathutils = types.ModuleType("mathutils")
+    xMathutils.Vector = Vector
+    xMathutils.Matrix = Matrix
+    xMathutils.kdtree = types.ModuleType("mathutils.kdtree")
+    xMathutils.kdtree.KDTree = KDTree
+
+    xAddonUtils = types.ModuleType("addon_utils")
+    xAddonUtils.modules = _ListAddons
+
+    xHumGen = types.ModuleType("HumGen3D")
+    xHumGen.Human = Human
+
+    sys.modules.update(
+        {
+            "bpy": bpy,
+            "mathutils": xMathutils,
+            "mathutils.kdtree": xMathutils.kdtree,
+            "addon_utils": xAddonUtils,
+            "HumGen3D": xHumGen,
+        }
+    )
+    if importlib.util.find_spec("anybase") is None:
+        xAnybase = _CreateAnybase()
+        sys.modules.update({"anybase": xAnybase, "anybase.convert": xAnybase.convert})
+    # endif
+    return True
+
+
+# enddef
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \imports.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+"""Import time benchmark of the anyhuman2 modules.
+
+Every import is measured in a new Python process, so that no module is cached:
+
+    python -m anyhuman2.benchmark.imports
+
+'lazy' is the import of the module alone. 'eager' additionally does what was done at import time before
+the startup became lazy: probing the installed HumGen version, importing cls_humgen with the labelling
+modules, and importing numpy. Modules that import bpy are measured with the stand-ins of fake_blender,
+which import numpy themselves.
+"""
+
+import os
+import sys
+import json
+import subprocess
+
+from pathlib import Path
+
+
+# module name, whether the Blender stand-ins are needed, code of the eager reference
+lTargets: list = [
+    ("anyhuman2.paramgenerators", False, "import numpy"),
+    (
+        "anyhuman2.ops",
+        True,
+        "import numpy\nfrom anyhuman2.cls_humgen import HumGenWrapper\nHumGenWrapper._ProbeHumGen()",
+    ),
+]
+
+sMeasureCode: str = """
+import sys
+import json
+import time
+import importlib
+
+sModule, bFake, sEager = sys.argv[1], sys.argv[2] == "1", sys.argv[3]
+if bFake:
+    from anyhuman2.benchmark import fake_blender
+
+    fake_blender.Install()
+# endif
+setModules = set(sys.modules)
+
+fStart = time.perf_counter()
+importlib.import_module(sModule)
+if sEager:
+    exec(sEager)
+# endif
+fTime = time.perf_counter() - fStart
+
+print(json.dumps({
+    "fTime": fTime,
+    "iModuleCount": len(set(sys.modules) - setModules),
+    "bNumpy": "numpy" in sys.modules and "numpy" not in setModules,
+    "bHumGenProbed": bFake and fake_blender.iAddonProbeCount > 0,
+}))
+"""
+
+
+############################################################################################
+def _MeasureImport(_sModule: str, _bFake: bool, _sEager: str) -> dict:
+    """Import _sModule in a new Python process and return the measured values"""
+    dicEnv = dict(os.environ)
+    sSourcePath = str(Path(__file__).parent.parent.parent)
+    dicEnv["PYTHONPATH"] = os.pathsep.join(filter(None, (sSourcePath, dicEnv.get("PYTHONPATH"))))
+
+    xProcess = subprocess.run(
+        [sys.executable, "-c", sMeasureCode, _sModule, "1" if _bFake else "0", _sEager],
+        capture_output=True,
+        text=True,
+        env=dicEnv,
+    )
+    if xProcess.returncode != 0:
+        return {"sError": xProcess.stderr.strip().splitlines()[-1]}
+    # endif
+    return json.loads(xProcess.stdout.strip().splitlines()[-1])
+
+
+# enddef
+
+
+############################################################################################
+def RunBenchmark(_iRepeat: int = 5) -> dict:
+    """Measure the lazy and eager import time of the anyhuman2 entry modules.
+
+    Parameters
+    ----------
+    _iRepeat : int
+        number of processes per measurement, the best time is reported
+
+    Returns
+    -------
+    dict
+        {sModule: {"lazy": {...}, "eager": {...}, "fSpeedup"}} with the import time in seconds,
+        the number of imported modules and whether numpy has been imported and HumGen has been probed
+    """
+    dicResult = {}
+    for sModule, bFake, sEager in lTargets:
+        dicModule = {}
+        for sVariant, sCode in (("lazy", ""), ("eager", sEager)):
+            lRuns = [_MeasureImport(sModule, bFake, sCode) for _ in range(_iRepeat)]
+            dicModule[sVariant] = min(lRuns, key=lambda dicRun: dicRun.get("fTime", float("inf")))
+        # endfor
+        if "fTime" in dicModule["lazy"] and "fTime" in dicModule["eager"]:
+            dicModule["fSpeedup"] = dicModule["eager"]["fTime"] / dicModule["lazy"]["fTime"]
+        # endif
+        dicResult[sModule] = dicModule
+    # endfor
+
+    for sModule, dicModule in dicResult.items():
+        for sVariant in ("lazy", "eager"):
+            dicRun = dicModule[sVariant]
+            if "sError" in dicRun:
+                print(f"{sModule:<28} {sVariant:<6} failed: {dicRun['sError']}")
+            else:
+                print(
+                    f"{sModule:<28} {sVariant:<6} {dicRun['fTime'] * 1000.0:8.2f} ms"
+                    f" {dicRun['iModuleCount']:5d} modules"
+                    f" numpy: {dicRun['bNumpy']} HumGen probed: {dicRun['bHumGenProbed']}"
+                )
+            # endif
+        # endfor
+    # endfor
+    return dicResult
+
+
+# enddef
+
+
+if __name__ == "__main__":
+    RunBenchmark()
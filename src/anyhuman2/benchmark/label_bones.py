@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \label_bones.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+
+"""Benchmark of the import of label bones, e.g. the 98 WFLW landmark bones, into a rig.
+
+Counts the object mode switches and measures the time of the import, compared to
+creating the bones with one edit mode switch per bone as done before.
+Run from within Blender, e.g.
+
+    blender -b --python-expr "from anyhuman2.benchmark import label_bones; label_bones.RunBenchmark()"
+"""
+
+import time
+
+import bpy
+
+from ..labelling.cls_label_skeleton import BoneLabel
+
+
+############################################################################################
+def CreateSyntheticRig(_iBoneCount: int = 100):
+    """Create an armature object with a chain of _iBoneCount bones named 'Bone.XXX'"""
+    xArmature = bpy.data.armatures.new("Bench_Armature")
+    objRig = bpy.data.objects.new("Bench_Rig", xArmature)
+    bpy.context.scene.collection.objects.link(objRig)
+
+    bpy.context.view_layer.objects.active = objRig
+    bpy.ops.object.mode_set(mode="EDIT")
+    xParent = None
+    for iIdx in range(_iBoneCount):
+        xBone = xArmature.edit_bones.new(f"Bone.{iIdx:03d}")
+        xBone.head = (0.0, 0.0, 0.1 * iIdx)
+        xBone.tail = (0.0, 0.0, 0.1 * (iIdx + 1))
+        xBone.parent = xParent
+        xParent = xBone
+    # endfor
+    bpy.ops.object.mode_set(mode="OBJECT")
+
+    return objRig
+
+
+# enddef
+
+
+############################################################################################
+def CreateSyntheticSkeleton(_sSkeletonType: str, _iLabelCount: int = 98, _iBoneCount: int = 100) -> dict:
+    """Create a skeleton dictionary as in the label mapping files, with one label bone per landmark"""
+    return {
+        "sSkeletonType": _sSkeletonType,
+        "lBones": [
+            {
+                "sName": f"{iIdx:03d}",
+                "sParent": f"Bone.{iIdx % _iBoneCount:03d}",
+                "lHead": [0.01 * iIdx, 0.0, 0.0],
+                "lTail": [0.01 * iIdx, 0.01, 0.0],
+                "fEnvelope": 0.01,
+                "fHeadRadius": 0.005,
+                "lConstraints": [],
+            }
+            for iIdx in range(_iLabelCount)
+        ],
+    }
+
+
+# enddef
+
+
+############################################################################################
+def ReferenceImportSkeletonBones(_dicSkeleton: dict, _objRig) -> int:
+    """Create the label bones with one edit mode switch per bone, returns the number of mode switches"""
+    iModeSwitchCount = 0
+    xArmature = _objRig.data
+    for dicBone in _dicSkeleton["lBones"]:
+        bpy.context.view_layer.objects.active = _objRig
+        bpy.ops.object.mode_set(mode="EDIT")
+        iModeSwitchCount += 1
+
+        sNewBoneName = "AT.Label;" + _dicSkeleton["sSkeletonType"] + ";" + dicBone["sName"]
+        xNewBone = xArmature.edit_bones.new(sNewBoneName)
+        xNewBone.parent = xArmature.edit_bones.get(dicBone["sParent"])
+        xNewBone.head = dicBone["lHead"]
+        xNewBone.tail = dicBone["lTail"]
+        xNewBone.envelope_distance = dicBone["fEnvelope"]
+        xNewBone.head_radius = dicBone["fHeadRadius"]
+    # endfor
+    bpy.ops.object.mode_set(mode="OBJECT")
+    iModeSwitchCount += 1
+
+    return iModeSwitchCount
+
+
+# enddef
+
+
+############################################################################################
+def RunBenchmark(_iLabelCount: int = 98, _iBoneCount: int = 100) -> dict:
+    """Compare the label bone import of BoneLabel with one edit mode switch per bone.
+
+    Returns
+    -------
+    dict
+        number of mode switches and run times in seconds per import
+    """
+    objRig = CreateSyntheticRig(_iBoneCount)
+    # BoneLabel only needs the rig for the bone import
+    xBoneLabel = BoneLabel.__new__(BoneLabel)
+    xBoneLabel.objRig = objRig
+    xBoneLabel.objArmature = objRig.data
+
+    try:
+        fStart = time.perf_counter()
+        iModeSwitchesReference = ReferenceImportSkeletonBones(
+            CreateSyntheticSkeleton("Reference", _iLabelCount, _iBoneCount), objRig
+        )
+        fTimeReference = time.perf_counter() - fStart
+
+        iModeSwitchStart = BoneLabel.iModeSwitchCount
+        fStart = time.perf_counter()
+        xBoneLabel.ImportSkeletonBones(
+            CreateSyntheticSkeleton("Batched", _iLabelCount, _iBoneCount), objRig.data, objRig
+        )
+        BoneLabel.SetMode(objRig, "OBJECT")
+        fTimeBatched = time.perf_counter() - fStart
+        iModeSwitchesBatched = BoneLabel.iModeSwitchCount - iModeSwitchStart
+
+        iLabelBoneCount = sum(1 for xBone in objRig.data.bones if xBone.name.startswith("AT.Label;Batched;"))
+    finally:
+        xArmature = objRig.data
+        bpy.data.objects.remove(objRig)
+        bpy.data.armatures.remove(xArmature)
+    # endtry
+
+    dicResult = {
+        "iLabelCount": _iLabelCount,
+        "iLabelBoneCount": iLabelBoneCount,
+        "iModeSwitchesReference": iModeSwitchesReference,
+        "iModeSwitchesBatched": iModeSwitchesBatched,
+        "fTimeReference": fTimeReference,
+        "fTimeBatched": fTimeBatched,
+        "fSpeedup": fTimeReference / fTimeBatched,
+    }
+    print(f"Label bone import benchmark: {dicResult}")
+    return dicResult
+
+
+# enddef
+
+
+if __name__ == "__main__":
+    RunBenchmark()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \params.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+"""Throughput benchmark of the parameter generation.
+
+Runs without Blender on a synthetic content pack tree:
+
+    python -m anyhuman2.benchmark.params
+"""
+
+import json
+import time
+import tempfile
+import tracemalloc
+
+from pathlib import Path
+
+from ..paramgenerators import dryrun
+from ..paramgenerators.cls_preset_cache import xPresetCache
+from . import content_pack
+
+
+############################################################################################
+def _MeasureMode(_xGeneratorConfig, _sMode: str, _dicParamConfig: dict, _iCount: int) -> dict:
+    lParams = [
+        {"sId": f"Human.{iIdx:04d}", "xSeed": iIdx, "sMode": _sMode, "mParamConfig": dict(_dicParamConfig)}
+        for iIdx in range(_iCount)
+    ]
+
+    fStart = time.perf_counter()
+    for dicParams in lParams:
+        dryrun.DryRunParams(dicParams, _xGeneratorConfig)
+    # endfor
+    fTime = time.perf_counter() - fStart
+
+    # memory retained by the generated parameter sets
+    tracemalloc.start()
+    iMemStart, _ = tracemalloc.get_traced_memory()
+    lParamSets = [dryrun.DryRunParams(dicParams, _xGeneratorConfig) for dicParams in lParams]
+    iMemEnd, iMemPeak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "fSetsPerSecond": _iCount / fTime,
+        "iBytesPerSet": (iMemEnd - iMemStart) // len(lParamSets),
+        "iPeakBytes": iMemPeak - iMemStart,
+    }
+
+
+# enddef
+
+
+############################################################################################
+def RunBenchmark(_iCount: int = 1000) -> dict:
+    """Measure parameter sets per second and memory per set for every parameter mode.
+
+    Returns
+    -------
+    dict
+        {sName: {"fSetsPerSecond", "iBytesPerSet", "iPeakBytes"}}
+    """
+    with tempfile.TemporaryDirectory() as sTempPath:
+        pathAddon = content_pack.CreateContentPack(Path(sTempPath) / "humgen")
+        xGeneratorConfig = dryrun.CreateGeneratorConfig(pathAddon, _sCachePath=Path(sTempPath) / "cache")
+
+        pathFile = Path(sTempPath) / "human.json"
+        with open(pathFile, "w") as xFile:
+            json.dump(dryrun.DryRunParams({"xSeed": 0, "mParamConfig": {}}, xGeneratorConfig), xFile)
+        # endwith
+
+        dicModes = {
+            "RANDOM_REALISTIC": ("RANDOM_REALISTIC", {}),
+            "RANDOM_REALISTIC/VECTORIZED": ("RANDOM_REALISTIC", {"sSampler": "VECTORIZED"}),
+            "RANDOM_FULL": ("RANDOM_FULL", {}),
+            "PERSONA": ("PERSONA", {"sPersonaId": "female_000"}),
+            "FILE": ("FILE", {"sFilename": pathFile.as_posix()}),
+        }
+
+        dicResult = {
+            sName: _MeasureMode(xGeneratorConfig, sMode, dicParamConfig, _iCount)
+            for sName, (sMode, dicParamConfig) in dicModes.items()
+        }
+    # endwith
+
+    for sMode, dicValues in dicResult.items():
+        print(
+            f"{sMode:<28} {dicValues['fSetsPerSecond']:10.1f} sets/s"
+            f" {dicValues['iBytesPerSet']:10d} bytes/set {dicValues['iPeakBytes']:12d} peak bytes"
+        )
+    # endfor
+    print(f"preset cache: {xPresetCache.iHits} hits, {xPresetCache.iMisses} misses")
+    return dicResult
+
+
+# enddef
+
+
+if __name__ == "__main__":
+    RunBenchmark()
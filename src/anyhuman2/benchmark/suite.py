@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \suite.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+"""Headless benchmark suite of anyhuman2, runs on plain Python without Blender and HumGen:
+
+    python -m anyhuman2.benchmark.suite
+
+The Blender modules are replaced by the stand-ins of fake_blender and the HumGen content by a synthetic
+content pack tree, see content_pack. For every stage, the best wall time of a number of runs and the
+allocations of one additional run, traced with tracemalloc, are reported:
+
+    catalog         content catalog compiled from the content packs (cold) and loaded from its cache (warm)
+    params          RANDOM_REALISTIC parameter sets, see paramgenerators.dryrun
+    label_import    hand, WFLW, IMS and eyebrow labels of a human, as in HumGenWrapper.CreateHuman()
+    cloth_weights   tools.FixClothBoneWeights() without and with the persistent cloth weight cache
+
+Times measured with the stand-ins show the cost of the anyhuman2 code itself, not of Blender,
+e.g. a change of the number of mode switches or of Python calls per vertex.
+"""
+
+import os
+import json
+import time
+import tempfile
+import contextlib
+import tracemalloc
+
+from pathlib import Path
+
+import numpy as np
+
+from . import fake_blender
+from . import content_pack
+
+
+############################################################################################
+def _Measure(_funcRun, _iRepeat: int) -> dict:
+    """Best wall time of _iRepeat runs of _funcRun and the traced allocations of one more run"""
+    fTime = float("inf")
+    with open(os.devnull, "w") as xNull, contextlib.redirect_stdout(xNull):
+        for _ in range(_iRepeat):
+            fStart = time.perf_counter()
+            _funcRun()
+            fTime = min(fTime, time.perf_counter() - fStart)
+        # endfor
+
+        tracemalloc.start()
+        iMemStart, _ = tracemalloc.get_traced_memory()
+        xResult = _funcRun()
+        iMemEnd, iMemPeak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    # endwith
+
+    return {
+        "fTime": fTime,
+        "iAllocPeakBytes": iMemPeak - iMemStart,
+        "iAllocRetainedBytes": iMemEnd - iMemStart,
+        "xResult": xResult,
+    }
+
+
+# enddef
+
+
+############################################################################################
+def _GetMappingFile(*_lPath: str) -> str:
+    return str(Path(__file__).parent.parent / "labelling" / "mapping" / Path(*_lPath))
+
+
+# enddef
+
+
+############################################################################################
+def _LabelHuman(_dicHumGen: dict) -> dict:
+    """Create a human from _dicHumGen and add its labels, returns the instrumentation report"""
+    from HumGen3D import Human
+    from ..labelling.cls_label_skeleton import BoneLabel
+    from ..cls_instrumentation import xInstrumentation
+
+    xInstrumentation.Begin("label_import")
+    try:
+        xHuman = Human.from_preset(_dicHumGen)
+        objRig = xHuman.objects.rig
+        xBoneLabel = BoneLabel(_human=xHuman)
+        with xInstrumentation.Span("hand_labels"):
+            xBoneLabel.AddHandLabels(_GetMappingFile("openpose_hand_anyhuman.json"), objRig.data, objRig)
+        # endwith
+        with xInstrumentation.Span("wflw_labels"):
+            xBoneLabel.ImportSkeletonData(_GetMappingFile("WFLW_labels_anyhuman.json"), _replaceVertexGroups=True)
+        # endwith
+        with xInstrumentation.Span("ims_labels"):
+            xBoneLabel.ImportSkeletonData(_GetMappingFile("IMS_bones.json"), _replaceVertexGroups=False)
+        # endwith
+        with xInstrumentation.Span("eyebrow_labels"):
+            sEyebrowStyle = _dicHumGen["hair"]["eyebrows"]["set"]
+            xBoneLabel.UpdateEyebrowLabels(sEyebrowStyle, _GetMappingFile("eyebrows", sEyebrowStyle + ".json"))
+        # endwith
+    finally:
+        dicReport = xInstrumentation.End()
+    # endtry
+
+    return dicReport
+
+
+# enddef
+
+
+############################################################################################
+def _CreateClothMeshes(_iSkinVertexCount: int, _iClothVertexCount: int, _iGroupCount: int = 16) -> tuple:
+    """Create a sphere as skin with overlapping vertex groups along the z-axis, and a slightly larger cloth"""
+    objSkin = fake_blender.CreateMeshObject("Bench_Skin", fake_blender.CreateSpherePoints(_iSkinVertexCount))
+    lGroups = [objSkin.vertex_groups.new(name=f"Bone.{iIdx:03d}") for iIdx in range(_iGroupCount)]
+
+    aBand = (objSkin.data.aCo[:, 2].astype(np.float64) + 1.0) * 0.5 * (_iGroupCount - 1)
+    aBandIdx = np.minimum(aBand.astype(np.int64), _iGroupCount - 2)
+    aWeight = np.round(aBand - aBandIdx, 2)
+    for iVertex, (iBand, fWeight) in enumerate(zip(aBandIdx.tolist(), aWeight.tolist())):
+        lGroups[iBand].add([iVertex], 1.0 - fWeight, "REPLACE")
+        lGroups[iBand + 1].add([iVertex], fWeight, "REPLACE")
+    # endfor
+
+    objCloth = fake_blender.CreateMeshObject(
+        "Bench_Cloth", fake_blender.CreateSpherePoints(_iClothVertexCount, 1.02, _iSeed=1)
+    )
+    objCloth.matrix_world = fake_blender.Matrix.Translation((0.0, 0.0, 0.01))
+    objCloth.shape_key_add(name="Basis")
+    xKeyBlock = objCloth.shape_key_add(name="Inflate", from_mix=False)
+    xKeyBlock.data.aCo *= 1.03
+    xKeyBlock.value = 0.5
+
+    return objSkin, objCloth
+
+
+# enddef
+
+
+############################################################################################
+def RunBenchmark(
+    _iPackCount: int = 200,
+    _iParamCount: int = 500,
+    _iSkinVertexCount: int = 8000,
+    _iClothVertexCount: int = 4000,
+    _iRepeat: int = 3,
+) -> dict:
+    """Run all stages of the headless benchmark suite.
+
+    Parameters
+    ----------
+    _iPackCount : int
+        number of files per gender and category in the synthetic content packs
+    _iParamCount : int
+        number of parameter sets per run of the params stage
+    _iSkinVertexCount : int
+        number of vertices of the skin mesh of the cloth_weights stage
+    _iClothVertexCount : int
+        number of vertices of the cloth mesh of the cloth_weights stage
+    _iRepeat : int
+        number of timed runs per stage, the best time is reported
+
+    Returns
+    -------
+    dict
+        {sStage: {"fTime", "iAllocPeakBytes", "iAllocRetainedBytes", ...}}
+    """
+    with tempfile.TemporaryDirectory() as sTempPath:
+        pathAddon = content_pack.CreateContentPack(Path(sTempPath) / "HumGen", _iPackCount)
+        pathCache = Path(sTempPath) / "cache"
+        if not fake_blender.Install(pathAddon.as_posix()):
+            raise RuntimeError(
+                "The headless benchmark suite cannot run within Blender, use the benchmarks label_bones and"
+                " cloth_weights instead"
+            )
+        # endif
+
+        from ..cls_content_catalog import CContentCatalog
+        from ..paramgenerators import dryrun
+        from .. import tools
+        from ..cls_cloth_weight_cache import CClothWeightCache
+
+        dicResult = {}
+
+        # content catalog
+        def _RunCatalogCold():
+            for pathFile in pathCache.glob("*.pickle"):
+                pathFile.unlink()
+            # endfor
+            return CContentCatalog(pathAddon, _sCachePath=pathCache).CreateGeneratorConfig()
+
+        # enddef
+
+        dicResult["catalog_cold"] = _Measure(_RunCatalogCold, _iRepeat)
+        dicResult["catalog_warm"] = _Measure(
+            lambda: CContentCatalog(pathAddon, _sCachePath=pathCache).CreateGeneratorConfig(), _iRepeat
+        )
+        xGeneratorConfig = dicResult["catalog_warm"]["xResult"]
+
+        # parameter generation
+        lParams = [
+            {"sId": f"Human.{iIdx:04d}", "xSeed": iIdx, "sMode": "RANDOM_REALISTIC", "mParamConfig": {}}
+            for iIdx in range(_iParamCount)
+        ]
+        dicResult["params"] = _Measure(
+            lambda: [dryrun.DryRunParams(dicParams, xGeneratorConfig) for dicParams in lParams], _iRepeat
+        )
+        dicResult["params"]["fSetsPerSecond"] = _iParamCount / dicResult["params"]["fTime"]
+        dicHumGen = dicResult["params"]["xResult"][0]["dictHumGen_V4"]
+
+        # label import
+        dicResult["label_import"] = _Measure(lambda: _LabelHuman(dicHumGen), _iRepeat)
+        dicReport = dicResult["label_import"]["xResult"]
+        dicResult["label_import"]["dicCounters"] = dicReport["dicCounters"]
+        dicResult["label_import"]["dicSpans"] = {
+            dicSpan["sName"]: dicSpan["fDuration"] for dicSpan in dicReport["lSpans"]
+        }
+
+        # cloth weight transfer
+        objSkin, objCloth = _CreateClothMeshes(_iSkinVertexCount, _iClothVertexCount)
+        dicResult["cloth_weights"] = _Measure(
+            lambda: tools.FixClothBoneWeights(objSkin, [objCloth], _bUseWeightCache=False), _iRepeat
+        )
+        xClothWeightCache = tools.xClothWeightCache
+        tools.xClothWeightCache = CClothWeightCache(Path(sTempPath) / "cloth_weights")
+        try:
+            dicResult["cloth_weights_cached"] = _Measure(
+                lambda: tools.FixClothBoneWeights(objSkin, [objCloth], _bUseWeightCache=True), _iRepeat
+            )
+        finally:
+            tools.xClothWeightCache = xClothWeightCache
+            tools.xSkinIndexCache.Invalidate(objSkin)
+        # endtry
+    # endwith
+
+    for dicStage in dicResult.values():
+        del dicStage["xResult"]
+    # endfor
+
+    for sStage, dicStage in dicResult.items():
+        print(
+            f"{sStage:<22} {dicStage['fTime'] * 1000.0:10.2f} ms {dicStage['iAllocPeakBytes']:12d} peak bytes"
+            f" {dicStage['iAllocRetainedBytes']:12d} retained bytes"
+        )
+    # endfor
+    print(f"label_import counters: {json.dumps(dicResult['label_import']['dicCounters'])}")
+    return dicResult
+
+
+# enddef
+
+
+if __name__ == "__main__":
+    RunBenchmark()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_cloth_weight_cache.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import os
+import re
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from .cls_skin_index_cache import CSkinIndexCache
+
+
+#########################################################################################################
+class CClothWeightCache:
+    """Persistent cache of the vertex group weights that tools.FixClothBoneWeights transfers to a cloth mesh.
+
+    An entry stores the cloth-vertex to skin-vertex mapping and the resulting weights, grouped by
+    (vertex group, weight), as compressed NumPy arrays. It is keyed on
+    - the outfit file, if given and existing, otherwise the basis vertex positions of the cloth mesh,
+    - the name and vertex count of the cloth mesh,
+    - a hash of the skin basis vertex positions and world matrix, see CSkinIndexCache.GetShapeHash(),
+    - the vertex group names of the skin,
+    - the shape-key values and world matrices of the cloth,
+    - the parameters of the transfer.
+    So the same outfit on a body with the same shape, e.g. in PERSONA mode or in seeded re-runs,
+    needs no nearest neighbour search.
+
+    The cache folder is taken from the environment variable ANYHUMAN_CACHE_PATH and defaults to
+    '~/.cache/anyhuman2'. The entries are stored in its sub-folder 'cloth_weights'. Entries are never
+    removed, and body shapes that are randomized per human never hit the cache. So the cache is only used,
+    if it is enabled explicitly, see IsEnabled().
+    """
+
+    def __init__(self, _sCachePath: Optional[str] = None):
+        if _sCachePath is None:
+            _sCachePath = os.environ.get("ANYHUMAN_CACHE_PATH", Path.home() / ".cache" / "anyhuman2")
+        # endif
+        self.pathCache = Path(_sCachePath) / "cloth_weights"
+        self.iHits: int = 0
+        self.iMisses: int = 0
+
+    # enddef
+
+    ############################################################################################
+    @staticmethod
+    def IsEnabled() -> bool:
+        """True, if the environment variable ANYHUMAN_CLOTH_WEIGHT_CACHE is set to 1"""
+        return os.environ.get("ANYHUMAN_CLOTH_WEIGHT_CACHE") == "1"
+
+    # enddef
+
+    ############################################################################################
+    @staticmethod
+    def GetKey(_objSkin, _objCloth, _sOutfitFile: Optional[str], _sSkinShapeHash: str, _tParams: tuple) -> str:
+        """Cache key of the weights of _objCloth on _objSkin"""
+        xHash = hashlib.sha1()
+        iOutfitMTime = None
+        if _sOutfitFile is not None:
+            sOutfitFile = os.path.abspath(_sOutfitFile)
+            try:
+                iOutfitMTime = os.stat(sOutfitFile).st_mtime_ns
+            except OSError:
+                # e.g. a HumGen outfit 'set' that is not a path relative to the add-on folder
+                print(f"WARNING: Outfit file '{sOutfitFile}' not found, cloth weights are keyed on the cloth mesh")
+            # endtry
+        # endif
+
+        if iOutfitMTime is not None:
+            xHash.update(f"{sOutfitFile}|{iOutfitMTime}".encode("utf-8"))
+        else:
+            xVertices = _objCloth.data.vertices
+            aCo = np.empty(len(xVertices) * 3, dtype=np.float32)
+            xVertices.foreach_get("co", aCo)
+            xHash.update(aCo.tobytes())
+        # endif
+
+        # the same mesh of an outfit gets a numeric suffix for every human, e.g. 'HG_Shirt.003'
+        sClothName = re.sub(r"\.\d+$", "", _objCloth.data.name)
+        xHash.update(f"|{sClothName}|{len(_objCloth.data.vertices)}|{_sSkinShapeHash}|{_tParams}".encode("utf-8"))
+        xHash.update("|".join(xGroup.name for xGroup in _objSkin.vertex_groups).encode("utf-8"))
+        xHash.update(np.array(_objCloth.matrix_world, dtype=np.float32).tobytes())
+
+        xShapeKeys = _objCloth.data.shape_keys
+        if xShapeKeys is not None:
+            aValues = np.array([xKeyBlock.value for xKeyBlock in xShapeKeys.key_blocks], dtype=np.float32)
+            xHash.update(aValues.tobytes())
+        # endif
+
+        return xHash.hexdigest()
+
+    # enddef
+
+    ############################################################################################
+    @staticmethod
+    def GetSkinShapeHash(_objSkin) -> str:
+        """Hash of the skin data the weights are transferred from, see CSkinIndexCache.GetShapeHash()"""
+        return CSkinIndexCache.GetShapeHash(_objSkin)
+
+    # enddef
+
+    ############################################################################################
+    def Load(self, _sKey: str) -> Optional[dict]:
+        """Return the arrays of the entry _sKey, or None if there is no entry"""
+        pathEntry = self.pathCache / f"{_sKey}.npz"
+        try:
+            with np.load(pathEntry) as xData:
+                dicEntry = {sName: xData[sName] for sName in xData.files}
+            # endwith
+        except FileNotFoundError:
+            self.iMisses += 1
+            return None
+        except Exception as xEx:
+            print(f"WARNING: Could not read cloth weight cache entry '{pathEntry}': {xEx}")
+            self.iMisses += 1
+            return None
+        # endtry
+
+        self.iHits += 1
+        return dicEntry
+
+    # enddef
+
+    ############################################################################################
+    def Save(self, _sKey: str, **_dicArrays):
+        """Store the arrays of the entry _sKey"""
+        try:
+            self.pathCache.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first, so that parallel workers never read a partial entry
+            iFd, sTempPath = tempfile.mkstemp(dir=self.pathCache, suffix=".npz.tmp")
+            with os.fdopen(iFd, "wb") as xFile:
+                np.savez_compressed(xFile, **_dicArrays)
+            # endwith
+            os.replace(sTempPath, self.pathCache / f"{_sKey}.npz")
+        except OSError as xEx:
+            print(f"WARNING: Could not write cloth weight cache entry '{_sKey}': {xEx}")
+        # endtry
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_content_catalog.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import os
+import json
+import pickle
+import hashlib
+import tempfile
+
+from pathlib import Path
+from typing import Optional
+
+
+#########################################################################################################
+class HumGenConfigValues:
+    def __init__(self):
+        self.dict_textures = {}  # Textures
+        self.dict_models = {}  # Humans
+        self.dict_regular_hair = {}  # Hair
+        self.dict_face_hair = {}  # Face hair
+        self.dict_clothes = {}  # Clothes
+        self.dict_footwear = {}  # Footwear
+        self.dict_poses = {}  # Poses
+        self.dict_info = {}  # Info about the addon
+
+    # enddef
+
+    @staticmethod
+    def CreateDictionary(filelist: list, gender_position: int) -> dict:
+        """
+        Creates dictionaries for regular hair, textures, models, regular head hair, and face hair based on the given file list.
+
+        Parameters:
+        - filelist (list): A list of file paths.
+        - gender_position (int): The position of gender ("male" or "female") in the file path.
+
+        Returns:
+        - dictName (dict)
+        """
+        dictName = {}
+        for file_path in filelist:
+            components = file_path.split("/")
+            gender = components[gender_position]  # Extracting the gender (second component)
+            filename = components[-1].split(".")[0]  # Extracting the filename without extension
+            if gender not in dictName:
+                dictName[gender] = {}
+            dictName[gender][filename] = file_path
+        # endfor
+        return dictName
+
+    # enddef
+
+
+# endclass
+
+
+#########################################################################################################
+class CContentCatalog:
+    """Compiled index of the HumGen content packs.
+
+    Every content pack JSON is parsed once and the filtered file dictionaries are stored in a cache file.
+    The cache is keyed on the modification time and size of each content pack, so a worker that starts
+    without changes to the content packs loads the dictionaries without any JSON parsing or filtering.
+
+    The cache folder is taken from the environment variable ANYHUMAN_CACHE_PATH and defaults to
+    '~/.cache/anyhuman2'.
+    """
+
+    iVersion: int = 1
+
+    lPackFiles: list = [
+        "8K_Textures.json",
+        "Base_Humans.json",
+        "Base_Hair.json",
+        "Base_Clothes.json",
+        "Base_Poses.json",
+    ]
+
+    def __init__(self, _sAddonPath: str, _sCachePath: Optional[str] = None):
+        self.sAddonPath: str = str(_sAddonPath)
+        self.pathContentPacks = Path(self.sAddonPath) / "content_packs"
+
+        if _sCachePath is None:
+            _sCachePath = os.environ.get("ANYHUMAN_CACHE_PATH", Path.home() / ".cache" / "anyhuman2")
+        # endif
+        sAddonHash = hashlib.sha1(self.sAddonPath.encode("utf-8")).hexdigest()[:16]
+        self.pathCache = Path(_sCachePath) / f"content_catalog_{sAddonHash}.pickle"
+
+        # True, if the last call to Load() used the cache file
+        self.bLoadedFromCache: bool = False
+
+    # enddef
+
+    ############################################################################################
+    def GetPackStats(self) -> dict:
+        """Modification time and size of every content pack, used as cache key"""
+        dicStats = {}
+        for sPackFile in self.lPackFiles:
+            xStat = (self.pathContentPacks / sPackFile).stat()
+            dicStats[sPackFile] = (xStat.st_mtime_ns, xStat.st_size)
+        # endfor
+        return dicStats
+
+    # enddef
+
+    ############################################################################################
+    def _LoadPackFiles(self, _sPackFile: str) -> list:
+        with open(self.pathContentPacks / _sPackFile, "r") as xFile:
+            return json.load(xFile)["files"]
+        # endwith
+
+    # enddef
+
+    ############################################################################################
+    def Compile(self) -> dict:
+        """Parse each content pack once and create the file dictionaries"""
+        lTextures = self._LoadPackFiles("8K_Textures.json")
+        lHumans = self._LoadPackFiles("Base_Humans.json")
+        lHair = self._LoadPackFiles("Base_Hair.json")
+        lClothes = self._LoadPackFiles("Base_Clothes.json")
+        lPoses = self._LoadPackFiles("Base_Poses.json")
+
+        def IsGendered(_sFile: str) -> bool:
+            return ("female" in _sFile) or ("male" in _sFile)
+
+        # enddef
+
+        dicCatalog = {}
+
+        # Create textures dictionary
+        dicCatalog["dict_textures"] = HumGenConfigValues.CreateDictionary(
+            [
+                file
+                for file in lTextures
+                if ("Default 8K" in file)
+                and IsGendered(file)
+                and file.endswith(".png")
+                and "__MACOSX" not in file
+                and "PBR" not in file
+            ],
+            1,
+        )
+
+        # Create models dictionary
+        dicCatalog["dict_models"] = HumGenConfigValues.CreateDictionary(
+            [
+                file
+                for file in lHumans
+                if ("models" in file) and IsGendered(file) and file.endswith(".json") and "__MACOSX" not in file
+            ],
+            1,
+        )
+
+        # Create regular head hair dictionary
+        dicCatalog["dict_regular_hair"] = HumGenConfigValues.CreateDictionary(
+            [file for file in lHair if "head" in file and IsGendered(file) and file.endswith(".json")], 2
+        )
+
+        # Create face hair dictionary, only male have facial hair
+        dicFaceHair = {}
+        for file_path in lHair:
+            if "face_hair" in file_path and file_path.endswith(".json"):
+                filename = file_path.split("/")[-1].split(".")[0]  # Extracting the filename without extension
+                dicFaceHair.setdefault("male", {})[filename] = file_path
+            # endif
+        # endfor
+        dicCatalog["dict_face_hair"] = dicFaceHair
+
+        # Create Clothes dictionary
+        dicCatalog["dict_clothes"] = HumGenConfigValues.CreateDictionary(
+            [file for file in lClothes if "outfits" in file and IsGendered(file) and file.endswith(".blend")], 1
+        )
+
+        # Create Footwear dictionary
+        dicCatalog["dict_footwear"] = HumGenConfigValues.CreateDictionary(
+            [file for file in lClothes if "footwear" in file and IsGendered(file) and file.endswith(".blend")], 1
+        )
+
+        # Create Poses dictionary
+        dicCatalog["dict_poses"] = HumGenConfigValues.CreateDictionary(
+            [file for file in lPoses if "poses" in file and file.endswith(".blend")], 1
+        )
+
+        return dicCatalog
+
+    # enddef
+
+    ############################################################################################
+    def _ReadCache(self, _dicStats: dict) -> Optional[dict]:
+        try:
+            with open(self.pathCache, "rb") as xFile:
+                dicCache = pickle.load(xFile)
+            # endwith
+        except Exception:
+            return None
+        # endtry
+
+        if (
+            not isinstance(dicCache, dict)
+            or dicCache.get("iVersion") != self.iVersion
+            or dicCache.get("sAddonPath") != self.sAddonPath
+            or dicCache.get("dicStats") != _dicStats
+        ):
+            return None
+        # endif
+
+        return dicCache["dicCatalog"]
+
+    # enddef
+
+    ############################################################################################
+    def _WriteCache(self, _dicStats: dict, _dicCatalog: dict):
+        dicCache = {
+            "iVersion": self.iVersion,
+            "sAddonPath": self.sAddonPath,
+            "dicStats": _dicStats,
+            "dicCatalog": _dicCatalog,
+        }
+        try:
+            self.pathCache.parent.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first, so that workers starting in parallel never read a partial cache
+            iFd, sTempPath = tempfile.mkstemp(dir=self.pathCache.parent, suffix=".tmp")
+            with os.fdopen(iFd, "wb") as xFile:
+                pickle.dump(dicCache, xFile, protocol=pickle.HIGHEST_PROTOCOL)
+            # endwith
+            os.replace(sTempPath, self.pathCache)
+        except OSError as xEx:
+            print(f"WARNING: Could not write content catalog cache '{self.pathCache}': {xEx}")
+        # endtry
+
+    # enddef
+
+    ############################################################################################
+    def Load(self) -> dict:
+        """Return the file dictionaries, from the cache file if the content packs are unchanged"""
+        dicStats = self.GetPackStats()
+        dicCatalog = self._ReadCache(dicStats)
+        self.bLoadedFromCache = dicCatalog is not None
+
+        if dicCatalog is None:
+            dicCatalog = self.Compile()
+            self._WriteCache(dicStats, dicCatalog)
+        # endif
+
+        return dicCatalog
+
+    # enddef
+
+    ############################################################################################
+    def CreateGeneratorConfig(self) -> HumGenConfigValues:
+        """Create the generator config used by the parameter generators"""
+        xConfig = HumGenConfigValues()
+        for sName, dicFiles in self.Load().items():
+            setattr(xConfig, sName, dicFiles)
+        # endfor
+
+        # Add info about humgenv4 addon path
+        xConfig.dict_info = {"HumGenV4 Path": self.sAddonPath}
+        return xConfig
+
+    # enddef
+
+
+# endclass
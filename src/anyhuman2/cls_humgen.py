@@ -28,16 +28,11 @@
 
 
 import bpy
-import bmesh
 
 import os
-import os.path
-import colorsys
-import collections
-
-import json
 
 from pathlib import Path
+from typing import Optional
 import sys
 
 if sys.version_info < (3, 10):
@@ -45,13 +40,13 @@ if sys.version_info < (3, 10):
 else:
     from importlib import resources as res
 
-from anyblend import node
-from anyblend.util.node import GetByLabelOrId
-from anyblend.collection import RemoveCollection
 from anybase import convert
 import addon_utils
 
 from .labelling.cls_label_skeleton import BoneLabel
+from .labelling.cls_label_rig_template import xLabelRigTemplates
+from .cls_content_catalog import CContentCatalog
+from .cls_instrumentation import xInstrumentation, CInstrumentation
 
 
 #########################################################################################################
@@ -69,177 +64,73 @@ class HumGenWrapper:
         return humgen_version
 
     # enddef
-    # Import Human class based on the version
-    version_info = None
-    try:
-        version_info = get_installed_humgen_version()
-    except ImportError:
-        # Handle ImportError if get_installed_humgen_version is not available
-        pass
-
-    if version_info and version_info[0] == 4:
-        # Check only MAJOR version number
-        from HumGen3D import Human
-
-        addon_name = "HumGen3D"
-    elif version_info and version_info[0] == 3:
-        from humgen3d import Human  # Adjust the import based on your actual module structure
-
-        addon_name = "humgen3d"
-    else:
-        from HumGen3D import Human
+
+    # (version_info, Human, addon_name) of the installed HumGen, see _ProbeHumGen()
+    _tHumGen: tuple = None
+
+    @classmethod
+    def _ProbeHumGen(cls) -> tuple:
+        """Detect the installed HumGen version and import its Human class.
+
+        Listing the add-ons reads the bl_info of every installed add-on, so this is only done
+        on first use of version_info, Human or addon_name, not when the module is imported.
+        """
+        if cls._tHumGen is None:
+            version_info = None
+            try:
+                version_info = cls.get_installed_humgen_version()
+            except ImportError:
+                # Handle ImportError if get_installed_humgen_version is not available
+                pass
+            # endtry
+
+            # Check only MAJOR version number, HumGen V4 is used if the version is unknown
+            if version_info and version_info[0] == 3:
+                from humgen3d import Human  # Adjust the import based on your actual module structure
+
+                addon_name = "humgen3d"
+            else:
+                from HumGen3D import Human
+
+                addon_name = "HumGen3D"
+            # endif
+            cls._tHumGen = (version_info, Human, addon_name)
+        # endif
+        return cls._tHumGen
+
+    # enddef
+
+    @property
+    def version_info(self) -> tuple:
+        return self._ProbeHumGen()[0]
+
+    # enddef
+
+    @property
+    def Human(self):
+        return self._ProbeHumGen()[1]
+
+    # enddef
+
+    @property
+    def addon_name(self) -> str:
+        return self._ProbeHumGen()[2]
+
+    # enddef
 
     def __init__(self):
         """
         Sets lists for base humans/hair/beard styles from humgen content folder
         """
         addon_path = bpy.context.preferences.addons[self.addon_name].preferences["filepath_"]
-        content_packs = os.path.join(addon_path, "content_packs")
-        textures = os.path.join(content_packs, "8K_Textures.json")
-        base_humans = os.path.join(content_packs, "Base_Humans.json")
-        base_hair = os.path.join(content_packs, "Base_Hair.json")
-        base_clothes = os.path.join(content_packs, "Base_Clothes.json")
-        base_poses = os.path.join(content_packs, "Base_Poses.json")
-
-        class HumGenConfigValues:
-            def __init__(self):
-                self.dict_textures = {}  # Textures
-                self.dict_models = {}  # Humans
-                self.dict_regular_hair = {}  # Hair
-                self.dict_face_hair = {}  # Face hair
-                self.dict_clothes = {}  # Clothes
-                self.dict_footwear = {}  # Footwear
-                self.dict_poses = {}  # Poses
-
-            def CreateDictionary(self, filelist: list, gender_position: int):
-                """
-                Creates dictionaries for regular hair, textures, models, regular head hair, and face hair based on the given file list.
-
-                Parameters:
-                - filelist (list): A list of file paths.
-                - gender_position (int): The position of gender ("male" or "female") in the file path.
-
-                Returns:
-                - dictName (dict)
-                """
-                dictName = {}
-                for file_path in filelist:
-                    components = file_path.split("/")
-                    gender = components[gender_position]  # Extracting the gender (second component)
-                    filename = components[-1].split(".")[0]  # Extracting the filename without extension
-                    if gender == "male":
-                        if gender not in dictName:
-                            dictName[gender] = {}
-                        dictName[gender][filename] = file_path
-                    if gender == "female":
-                        if gender not in dictName:
-                            dictName[gender] = {}
-                        dictName[gender][filename] = file_path
-                    else:
-                        if gender not in dictName:
-                            dictName[gender] = {}
-                        dictName[gender][filename] = file_path
-                return dictName
-                # enddef
-
-        self.generator_config = HumGenConfigValues()
-
-        # Create textures dictionary
-        with open(textures) as json_file:
-            dict = json.load(json_file)
-            filtered_elements = [
-                file
-                for file in dict["files"]
-                if ("Default 8K" in file)
-                and (("female" in file) or ("male" in file))
-                and file.endswith(".png")
-                and "__MACOSX" not in file
-                and "PBR" not in file
-            ]
-
-        self.generator_config.dict_textures = HumGenConfigValues.CreateDictionary(self, filtered_elements, 1)
-
-        # Create models dictionary
-        with open(base_humans) as json_file:
-            dict = json.load(json_file)
-            filtered_elements = [
-                file
-                for file in dict["files"]
-                if ("models" in file)
-                and (("female" in file) or ("male" in file))
-                and file.endswith(".json")
-                and "__MACOSX" not in file
-            ]
-
-        self.generator_config.dict_models = HumGenConfigValues.CreateDictionary(self, filtered_elements, 1)
-
-        # Create regular head hair dictionary
-        with open(base_hair) as json_file:
-            dict = json.load(json_file)
-            filtered_elements = [
-                file
-                for file in dict["files"]
-                if "head" in file and (("female" in file) or ("male" in file)) and file.endswith(".json")
-            ]
-
-        self.generator_config.dict_regular_hair = HumGenConfigValues.CreateDictionary(self, filtered_elements, 2)
-
-        # Create face hair dictionary
-        with open(base_hair) as json_file:
-            dict = json.load(json_file)
-            filtered_elements = [file for file in dict["files"] if "face_hair" in file and file.endswith(".json")]
-        for file_path in filtered_elements:
-            components = file_path.split("/")
-            gender = "male"  # Only male have facial hair
-            filename = components[-1].split(".")[0]  # Extracting the filename without extension
-            if gender == "male":
-                if gender not in self.generator_config.dict_face_hair:
-                    self.generator_config.dict_face_hair[gender] = {}
-                self.generator_config.dict_face_hair[gender][filename] = file_path
-
-        # Create Clothes dictionary
-        with open(base_clothes) as json_file:
-            dict = json.load(json_file)
-            filtered_elements = [
-                file
-                for file in dict["files"]
-                if "outfits" in file and (("female" in file) or ("male" in file)) and file.endswith(".blend")
-            ]
-
-        self.generator_config.dict_clothes = HumGenConfigValues.CreateDictionary(self, filtered_elements, 1)
-
-        # Create Footwear dictionary
-        with open(base_clothes) as json_file:
-            dict = json.load(json_file)
-            filtered_elements = [
-                file
-                for file in dict["files"]
-                if "footwear" in file and (("female" in file) or ("male" in file)) and file.endswith(".blend")
-            ]
-
-        self.generator_config.dict_footwear = HumGenConfigValues.CreateDictionary(self, filtered_elements, 1)
-
-        # Create Footwear dictionary
-        with open(base_clothes) as json_file:
-            dict = json.load(json_file)
-            filtered_elements = [
-                file
-                for file in dict["files"]
-                if "footwear" in file and (("female" in file) or ("male" in file)) and file.endswith(".blend")
-            ]
-
-        self.generator_config.dict_footwear = HumGenConfigValues.CreateDictionary(self, filtered_elements, 1)
-
-        # Create Poses dictionary
-        with open(base_poses) as json_file:
-            dict = json.load(json_file)
-            filtered_elements = [file for file in dict["files"] if "poses" in file and file.endswith(".blend")]
-
-        self.generator_config.dict_poses = HumGenConfigValues.CreateDictionary(self, filtered_elements, 1)
-        # enddef
-
-        # Add info about humgenv4 addon path
-        self.generator_config.dict_info = {"HumGenV4 Path": addon_path}
+        self.sAddonPath: str = addon_path
+
+        # The content packs are parsed only if they changed since the catalog cache was written
+        xCatalog = CContentCatalog(addon_path)
+        self.generator_config = xCatalog.CreateGeneratorConfig()
+
+        # HumGen preset options per gender, they are only listed once per process
+        self.dicPresetOptions: dict = {}
 
     # enddef
 
@@ -257,7 +148,53 @@ class HumGenWrapper:
 
     # enddef
 
-    def CreateHuman(self, generatedParams: dict):
+    def CreateHuman(
+        self, generatedParams: dict, _sInstrumentationFile: Optional[str] = None, _bProfile: Optional[bool] = None
+    ):
+        """
+        Create human from a dictAnyhuman (or a dictHumGen_V4 dictionary), see _CreateHuman(), and record
+        the time of every creation stage and counters such as created bones in an instrumentation report.
+
+        The report of the last human is kept in self.dicLastReport. If _sInstrumentationFile or the environment
+        variable ANYHUMAN_INSTRUMENTATION_FILE is set, the report is appended as JSON line to this file. With
+        _bProfile or ANYHUMAN_PROFILE=1, the report also contains the functions with the largest cumulative
+        time of a cProfile run. These are runtime switches, so they are not part of the human parameters.
+        """
+        dictCustom: dict = generatedParams.get("dictCustom") or {}
+        sReportFile = _sInstrumentationFile or os.environ.get("ANYHUMAN_INSTRUMENTATION_FILE")
+        bProfile: bool = _bProfile is True or (_bProfile is None and os.environ.get("ANYHUMAN_PROFILE") == "1")
+
+        dicInfo = {
+            "sArmatureName": dictCustom.get("sArmatureName"),
+            "sGender": dictCustom.get("sGender"),
+            "sHumGenVersion": ".".join(map(str, self.version_info)) if self.version_info else None,
+            "sBlenderVersion": bpy.app.version_string,
+        }
+        iModeSwitchCount = BoneLabel.iModeSwitchCount
+        xInstrumentation.Begin("CreateHuman", _bProfile=bProfile, _dicInfo=dicInfo)
+        try:
+            with xInstrumentation.Span("create_human"):
+                objRig = self._CreateHuman(generatedParams)
+            # endwith
+        finally:
+            self.dicLastReport: dict = xInstrumentation.End()
+        # endtry
+
+        dicCounters = self.dicLastReport["dicCounters"]
+        print(
+            f"INFO: Human {dicInfo['sArmatureName']} created in {self.dicLastReport['fTotalTime']:.2f} s,"
+            f" {dicCounters.get('iBonesCreated', 0)} bones, {dicCounters.get('iVertexGroupsCreated', 0)} vertex"
+            f" groups, {BoneLabel.iModeSwitchCount - iModeSwitchCount} label mode switches"
+        )
+        if sReportFile:
+            CInstrumentation.WriteReport(sReportFile, self.dicLastReport)
+        # endif
+
+        return objRig
+
+    # enddef
+
+    def _CreateHuman(self, generatedParams: dict):
         """
         Create human from a dictAnyhuman (or a dictHumGen_V4 dictionary) which is a composition of the standard
         HumGenV4 as_dict() + some additional parameters such as gender, pose, labels,...
@@ -280,31 +217,53 @@ class HumGenWrapper:
                 sName: str = convert.DictElementToString(dictCustom, "sArmatureName", bDoRaise=True)
                 self.dBeardLength: dict = dictCustom["dBeardLength"]
                 # Get preset for selected gender
-                self.chosen_option = self.Human.get_preset_options(sGender)
+                if sGender not in self.dicPresetOptions:
+                    self.dicPresetOptions[sGender] = self.Human.get_preset_options(sGender)
+                # endif
+                self.chosen_option = self.dicPresetOptions[sGender]
                 # Use previously generated HumGenV4 compatible directory
-                self.human_obj = self.Human.from_preset(self.dictHumGenV4)
+                with xInstrumentation.Span("from_preset"):
+                    self.human_obj = self.Human.from_preset(self.dictHumGenV4)
+                # endwith
                 # If dbeardLength is not empty (False), custom parameters must be loaded after human has been created
-                if sGender == "male" and self.dBeardLength is not None:
-                    try:
-                        for i, key in enumerate(self.dBeardLength["hair_systems"]):
-                            # obtain the particle system which is connected to the hair system
-                            particle_system = self.human_obj.hair.particle_systems[key].settings.name
-                            # Set the length of the respective particle system to the value in the dict
-                            bpy.data.particles[particle_system].child_length = self.dBeardLength["hair_systems"][key][
-                                "length"
-                            ]
-                    except KeyError:
-                        raise KeyError(
-                            f"The key '{self.dBeardLength}' and '{self.dictHumGenV4['hair']['face_hair']['set']}' is not present in the dictionary."
-                        )
+                with xInstrumentation.Span("beard"):
+                    if sGender == "male" and self.dBeardLength is not None:
+                        try:
+                            for i, key in enumerate(self.dBeardLength["hair_systems"]):
+                                # obtain the particle system which is connected to the hair system
+                                particle_system = self.human_obj.hair.particle_systems[key].settings.name
+                                # Set the length of the respective particle system to the value in the dict
+                                bpy.data.particles[particle_system].child_length = self.dBeardLength["hair_systems"][
+                                    key
+                                ]["length"]
+                        except KeyError:
+                            raise KeyError(
+                                f"The key '{self.dBeardLength}' and '{self.dictHumGenV4['hair']['face_hair']['set']}' is not present in the dictionary."
+                            )
 
-                else:
-                    pass
-                # endif
+                    else:
+                        pass
+                    # endif
+                # endwith
+                # Transfer the bone weights of the body to the outfit
+                with xInstrumentation.Span("cloth_weights"):
+                    if dictCustom.get("bFixClothBoneWeights", False) is True:
+                        from . import tools
+
+                        sOutfit = self.dictHumGenV4.get("clothing", {}).get("outfit", {}).get("set")
+                        tools.FixClothBoneWeights(
+                            self.human_obj.objects.body,
+                            self.human_obj.clothing.outfit.objects,
+                            _sOutfitFile=os.path.join(self.sAddonPath, sOutfit) if sOutfit else None,
+                        )
+                    # endif
+                # endwith
                 # Set facial rig
-                if dictCustom["bFacialRig"] == True:
-                    self.human_obj.expression.load_facial_rig()
-                # endif
+                with xInstrumentation.Span("facial_rig"):
+                    if dictCustom["bFacialRig"] == True:
+                        self.human_obj.expression.load_facial_rig()
+                    # endif
+                # endwith
                 # initialize xBoneLabel class
                 try:
                     self.xBoneLabel = BoneLabel(_human=self.human_obj)
@@ -312,71 +271,110 @@ class HumGenWrapper:
                     raise AttributeError(f"Human not generated successfully, ERROR: {e}")
                     return
 
-                if dictCustom["sOpenposeHandLabelFile"] is not None:
-                    # sHandLabelFile = dictCustom["sOpenposeHandLabelFile"]
-                    sHandLabelFile: str = convert.DictElementToString(
-                        dictCustom, "sOpenposeHandLabelFile", bDoRaise=False
-                    )
-                    if sHandLabelFile == "OpenPoseHandLabel":
-                        DefaultOpenPoseHandLabel = res.files("anyhuman2").joinpath(
-                            "labelling", "mapping", "openpose_hand_anyhuman.json"
+                # Label rig template: the label bones and constraints of the first rig of a topology are kept
+                # and copied to later rigs, instead of rebuilding them from the mapping files
+                bLabelRigTemplate: bool = dictCustom.get("bLabelRigTemplate", False) is True
+                if bLabelRigTemplate:
+                    objRig = self.human_obj.objects.rig
+                    lBaseBones = [xBone.name for xBone in objRig.data.bones]
+                    lLabelSettings = [
+                        dictCustom.get(sKey) for sKey in ("sOpenposeHandLabelFile", "sWFLWLableFile", "sIMSLabels")
+                    ]
+                    with xInstrumentation.Span("label_rig_template"):
+                        sTemplateKey = xLabelRigTemplates.GetKey(objRig, lLabelSettings)
+                        self.xBoneLabel.bCreateBones = not xLabelRigTemplates.Apply(
+                            sTemplateKey, objRig, self.human_obj.objects.body, self.human_obj.objects.eyes
                         )
-                        with res.as_file(DefaultOpenPoseHandLabel) as pathData:
-                            self.sFilePathImport = pathData.as_posix()
-                        objRig = self.human_obj.objects.rig
-                        objArmature = objRig.data
-                        sJsonFile = self.GetAbsPath(_sFile=self.sFilePathImport)
-                        self.xBoneLabel.AddHandLabels(_sLabelFile=sJsonFile, _objArmature=objArmature, _objRig=objRig)
-                    else:
-                        objRig = self.human_obj.objects.rig
-                        objArmature = objRig.data
-                        sJsonFile = self.GetAbsPath(_sFile=sHandLabelFile)
-                        self.xBoneLabel.AddHandLabels(_sLabelFile=sJsonFile, _objArmature=objArmature, _objRig=objRig)
-                    # endif
-                else:
-                    print("INFO: OpenposeHandLabelFile is not defined")
+                    # endwith
                 # endif
 
-                if dictCustom["sWFLWLableFile"] is not None:
-                    # sWFLWLableFile = dictCustom["sWFLWLableFile"]
-                    sWFLWLableFile: str = convert.DictElementToString(dictCustom, "sWFLWLableFile", bDoRaise=False)
-                    if sWFLWLableFile == "WFLWLabel":
-                        DefaultWFLWLabelFile = res.files("anyhuman2").joinpath(
-                            "labelling", "mapping", "WFLW_labels_anyhuman.json"
+                with xInstrumentation.Span("hand_labels"):
+                    if dictCustom["sOpenposeHandLabelFile"] is not None:
+                        # sHandLabelFile = dictCustom["sOpenposeHandLabelFile"]
+                        sHandLabelFile: str = convert.DictElementToString(
+                            dictCustom, "sOpenposeHandLabelFile", bDoRaise=False
                         )
-                        with res.as_file(DefaultWFLWLabelFile) as pathData:
-                            self.sFilePathImport = pathData.as_posix()
-                        sJsonFile = self.GetAbsPath(_sFile=self.sFilePathImport)
-                        self.xBoneLabel.ImportSkeletonData(_sSkeletonDataFile=sJsonFile, _replaceVertexGroups=True)
-                        pass
+                        if sHandLabelFile == "OpenPoseHandLabel":
+                            DefaultOpenPoseHandLabel = res.files("anyhuman2").joinpath(
+                                "labelling", "mapping", "openpose_hand_anyhuman.json"
+                            )
+                            with res.as_file(DefaultOpenPoseHandLabel) as pathData:
+                                self.sFilePathImport = pathData.as_posix()
+                            objRig = self.human_obj.objects.rig
+                            objArmature = objRig.data
+                            sJsonFile = self.GetAbsPath(_sFile=self.sFilePathImport)
+                            self.xBoneLabel.AddHandLabels(
+                                _sLabelFile=sJsonFile, _objArmature=objArmature, _objRig=objRig
+                            )
+                        else:
+                            objRig = self.human_obj.objects.rig
+                            objArmature = objRig.data
+                            sJsonFile = self.GetAbsPath(_sFile=sHandLabelFile)
+                            self.xBoneLabel.AddHandLabels(
+                                _sLabelFile=sJsonFile, _objArmature=objArmature, _objRig=objRig
+                            )
+                        # endif
                     else:
-                        sJsonFile = self.GetAbsPath(_sFile=sWFLWLableFile)
-                        self.xBoneLabel.ImportSkeletonData(_sSkeletonDataFile=sJsonFile, _replaceVertexGroups=True)
-                # endif
+                        print("INFO: OpenposeHandLabelFile is not defined")
+                    # endif
+                # endwith
+
+                with xInstrumentation.Span("wflw_labels"):
+                    if dictCustom["sWFLWLableFile"] is not None:
+                        # sWFLWLableFile = dictCustom["sWFLWLableFile"]
+                        sWFLWLableFile: str = convert.DictElementToString(dictCustom, "sWFLWLableFile", bDoRaise=False)
+                        if sWFLWLableFile == "WFLWLabel":
+                            DefaultWFLWLabelFile = res.files("anyhuman2").joinpath(
+                                "labelling", "mapping", "WFLW_labels_anyhuman.json"
+                            )
+                            with res.as_file(DefaultWFLWLabelFile) as pathData:
+                                self.sFilePathImport = pathData.as_posix()
+                            sJsonFile = self.GetAbsPath(_sFile=self.sFilePathImport)
+                            self.xBoneLabel.ImportSkeletonData(_sSkeletonDataFile=sJsonFile, _replaceVertexGroups=True)
+                            pass
+                        else:
+                            sJsonFile = self.GetAbsPath(_sFile=sWFLWLableFile)
+                            self.xBoneLabel.ImportSkeletonData(_sSkeletonDataFile=sJsonFile, _replaceVertexGroups=True)
+                    # endif
+                # endwith
+
+                with xInstrumentation.Span("ims_labels"):
+                    if dictCustom["sIMSLabels"] is not None:
+                        # sIMSLabelFile = dictCustom["sIMSLabels"]
+                        sIMSLabelFile: str = convert.DictElementToString(dictCustom, "sIMSLabels", bDoRaise=False)
+                        if sIMSLabelFile == "IMSLabel":
+                            # TODO: If sIMSLabelFile is "IMSLabel" the respective label file from the folder should be loaded
+                            pass
+                        else:
+                            sJsonFile = self.GetAbsPath(_sFile=sIMSLabelFile)
+                            self.xBoneLabel.ImportSkeletonData(_sSkeletonDataFile=sJsonFile, _replaceVertexGroups=False)
+                    # endif
+                # endwith
 
-                if dictCustom["sIMSLabels"] is not None:
-                    # sIMSLabelFile = dictCustom["sIMSLabels"]
-                    sIMSLabelFile: str = convert.DictElementToString(dictCustom, "sIMSLabels", bDoRaise=False)
-                    if sIMSLabelFile == "IMSLabel":
-                        # TODO: If sIMSLabelFile is "IMSLabel" the respective label file from the folder should be loaded
-                        pass
-                    else:
-                        sJsonFile = self.GetAbsPath(_sFile=sIMSLabelFile)
-                        self.xBoneLabel.ImportSkeletonData(_sSkeletonDataFile=sJsonFile, _replaceVertexGroups=False)
+                if bLabelRigTemplate and self.xBoneLabel.bCreateBones:
+                    with xInstrumentation.Span("label_rig_template_capture"):
+                        xLabelRigTemplates.Capture(
+                            sTemplateKey, objRig, lBaseBones, self.human_obj.objects.body, self.human_obj.objects.eyes
+                        )
+                    # endwith
                 # endif
 
                 # NOTE: Keep eyebrows labels in end
-                if dictCustom["sEyebrowStyle"] is not None:
-                    try:
-                        sEyebrowStyle = self.dictHumGenV4["hair"]["eyebrows"]["set"]
-                        sEyebrowStyleFile = sEyebrowStyle + ".json"
-                        sLabelFile = res.files("anyhuman2").joinpath(
-                            "labelling", "mapping", "eyebrows", sEyebrowStyleFile
-                        )
-                        sEyebrowLabelsFile = self.GetAbsPath(_sFile=sLabelFile)
-                        self.xBoneLabel.UpdateEyebrowLabels(_sEyebrowStyle=sEyebrowStyle, _labelFile=sEyebrowLabelsFile)
-                    except Exception as e:
-                        raise Exception(f"Eyebrow style could not be fetched, Error: {e}")
+                with xInstrumentation.Span("eyebrow_labels"):
+                    if dictCustom["sEyebrowStyle"] is not None:
+                        try:
+                            sEyebrowStyle = self.dictHumGenV4["hair"]["eyebrows"]["set"]
+                            sEyebrowStyleFile = sEyebrowStyle + ".json"
+                            sLabelFile = res.files("anyhuman2").joinpath(
+                                "labelling", "mapping", "eyebrows", sEyebrowStyleFile
+                            )
+                            sEyebrowLabelsFile = self.GetAbsPath(_sFile=sLabelFile)
+                            self.xBoneLabel.UpdateEyebrowLabels(
+                                _sEyebrowStyle=sEyebrowStyle, _labelFile=sEyebrowLabelsFile
+                            )
+                        except Exception as e:
+                            raise Exception(f"Eyebrow style could not be fetched, Error: {e}")
+                # endwith
 
             # case: only humgen dictionary
             else:
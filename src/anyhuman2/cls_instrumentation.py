@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_instrumentation.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import os
+import json
+import time
+import pstats
+import cProfile
+import contextlib
+
+
+#########################################################################################################
+class CInstrumentation:
+    """Named timing spans, counters and an optional cProfile run for the creation of one human.
+
+    A report is started with Begin() and finished with End(). In between, code at any depth records
+    stages with Span() and increments counters with Count(), e.g. 'iModeSwitches' or 'iBonesCreated'.
+    Outside of Begin() and End(), Span() and Count() do nothing, so they can stay in the code paths
+    that are also used without instrumentation, e.g. by the label operators.
+    """
+
+    # number of functions listed in the profile of a report, ordered by cumulative time
+    iProfileEntries: int = 40
+
+    def __init__(self):
+        self._dicReport: dict = None
+        self._lStack: list = []
+        self._fStart: float = 0.0
+        self._xProfile: cProfile.Profile = None
+
+    # enddef
+
+    ############################################################################################
+    @property
+    def bActive(self) -> bool:
+        return self._dicReport is not None
+
+    # enddef
+
+    ############################################################################################
+    def Begin(self, _sName: str, _bProfile: bool = False, _dicInfo: dict = None):
+        """Start the report _sName, a report that is still open is discarded"""
+        self._dicReport = {
+            "sName": _sName,
+            "sTimestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "dicInfo": dict(_dicInfo or {}),
+            "fTotalTime": 0.0,
+            "lSpans": [],
+            "dicCounters": {},
+        }
+        self._lStack = []
+        self._xProfile = None
+        if _bProfile:
+            self._xProfile = cProfile.Profile()
+            self._xProfile.enable()
+        # endif
+        self._fStart = time.perf_counter()
+
+    # enddef
+
+    ############################################################################################
+    @contextlib.contextmanager
+    def Span(self, _sName: str):
+        """Time the enclosed block as span _sName, spans may be nested"""
+        if self._dicReport is None:
+            yield
+            return
+        # endif
+
+        self._lStack.append(_sName)
+        dicSpan = {"sName": "/".join(self._lStack), "iDepth": len(self._lStack) - 1}
+        self._dicReport["lSpans"].append(dicSpan)
+        fStart = time.perf_counter()
+        try:
+            yield
+        finally:
+            dicSpan["fStart"] = fStart - self._fStart
+            dicSpan["fDuration"] = time.perf_counter() - fStart
+            self._lStack.pop()
+        # endtry
+
+    # enddef
+
+    ############################################################################################
+    def Count(self, _sCounter: str, _iValue: int = 1):
+        """Add _iValue to the counter _sCounter of the open report"""
+        if self._dicReport is None:
+            return
+        # endif
+        dicCounters = self._dicReport["dicCounters"]
+        dicCounters[_sCounter] = dicCounters.get(_sCounter, 0) + _iValue
+
+    # enddef
+
+    ############################################################################################
+    def End(self) -> dict:
+        """Finish the open report and return it, returns None if no report has been started"""
+        dicReport = self._dicReport
+        if dicReport is None:
+            return None
+        # endif
+        dicReport["fTotalTime"] = time.perf_counter() - self._fStart
+
+        if self._xProfile is not None:
+            self._xProfile.disable()
+            dicReport["lProfile"] = self.GetProfileEntries(self._xProfile, self.iProfileEntries)
+            self._xProfile = None
+        # endif
+
+        self._dicReport = None
+        self._lStack = []
+        return dicReport
+
+    # enddef
+
+    ############################################################################################
+    @staticmethod
+    def GetProfileEntries(_xProfile: cProfile.Profile, _iCount: int) -> list:
+        """Return the _iCount functions with the largest cumulative time of _xProfile as list of dicts"""
+        xStats = pstats.Stats(_xProfile)
+        lEntries = []
+        for tFunction, (iPrimitiveCalls, iCalls, fTotalTime, fCumTime, _) in xStats.stats.items():
+            sFile, iLine, sFunction = tFunction
+            lEntries.append(
+                {
+                    "sFunction": f"{os.path.basename(sFile)}:{iLine}({sFunction})",
+                    "iCalls": iCalls,
+                    "iPrimitiveCalls": iPrimitiveCalls,
+                    "fTotalTime": fTotalTime,
+                    "fCumTime": fCumTime,
+                }
+            )
+        # endfor
+        lEntries.sort(key=lambda dicEntry: dicEntry["fCumTime"], reverse=True)
+        return lEntries[:_iCount]
+
+    # enddef
+
+    ############################################################################################
+    @staticmethod
+    def WriteReport(_sFilePath: str, _dicReport: dict):
+        """Append _dicReport as single JSON line to the file _sFilePath"""
+        sFolder = os.path.dirname(os.path.abspath(_sFilePath))
+        os.makedirs(sFolder, exist_ok=True)
+        with open(_sFilePath, "a") as xFile:
+            xFile.write(json.dumps(_dicReport) + "\n")
+        # endwith
+
+    # enddef
+
+
+# endclass
+
+# instrumentation shared by all modules of this process
+xInstrumentation = CInstrumentation()
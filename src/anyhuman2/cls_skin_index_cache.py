@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_skin_index_cache.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import hashlib
+import collections
+
+import numpy as np
+
+
+#########################################################################################################
+class CSkinIndexCache:
+    """Process-wide cache of the spatial index over the vertices of a skin mesh.
+
+    An entry is keyed on the identity of the skin object and a hash of exactly the data the index is built
+    from, see tools.BuildSkinIndex(): the basis vertex positions of the mesh, without modifiers, pose or
+    shape keys, and the world matrix. The index is therefore built once per body and reused for every
+    garment of the outfit. Posing the body or changing its shape-key values keeps its entry, changing its
+    mesh or moving it invalidates it.
+    """
+
+    def __init__(self, _iMaxEntries: int = 8):
+        self._iMaxEntries: int = _iMaxEntries
+        self._dicEntries = collections.OrderedDict()
+        self.iHits: int = 0
+        self.iMisses: int = 0
+
+    # enddef
+
+    ############################################################################################
+    @staticmethod
+    def GetObjectKey(_objSkin) -> tuple:
+        """Identity of the skin object, stable for the lifetime of the Blender object"""
+        return (_objSkin.name, _objSkin.as_pointer())
+
+    # enddef
+
+    ############################################################################################
+    @staticmethod
+    def GetShapeHash(_objSkin) -> str:
+        """Hash of the basis vertex positions and the world matrix of the skin, which the index is built from"""
+        xVertices = _objSkin.data.vertices
+        aCo = np.empty(len(xVertices) * 3, dtype=np.float32)
+        xVertices.foreach_get("co", aCo)
+
+        xHash = hashlib.blake2b(aCo.tobytes(), digest_size=16)
+        xHash.update(np.array(_objSkin.matrix_world, dtype=np.float32).tobytes())
+        return xHash.hexdigest()
+
+    # enddef
+
+    ############################################################################################
+    def Get(self, _objSkin, _funcBuild):
+        """Return the cached index of the skin, building it with _funcBuild(_objSkin) if needed"""
+        tObjectKey = self.GetObjectKey(_objSkin)
+        sShapeHash = self.GetShapeHash(_objSkin)
+
+        xEntry = self._dicEntries.get(tObjectKey)
+        if xEntry is not None and xEntry[0] == sShapeHash:
+            self.iHits += 1
+            self._dicEntries.move_to_end(tObjectKey)
+            return xEntry[1]
+        # endif
+
+        self.iMisses += 1
+        xIndex = _funcBuild(_objSkin)
+        self._dicEntries[tObjectKey] = (sShapeHash, xIndex)
+        self._dicEntries.move_to_end(tObjectKey)
+        while len(self._dicEntries) > self._iMaxEntries:
+            self._dicEntries.popitem(last=False)
+        # endwhile
+
+        return xIndex
+
+    # enddef
+
+    ############################################################################################
+    def Invalidate(self, _objSkin=None):
+        """Remove the entry of the given skin object, or all entries if no object is given"""
+        if _objSkin is None:
+            self._dicEntries.clear()
+        else:
+            self._dicEntries.pop(self.GetObjectKey(_objSkin), None)
+        # endif
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_label_constraints.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import time
+
+import bpy
+
+from .cls_label_mapping import CLabelSkeleton
+from ..cls_instrumentation import xInstrumentation
+
+
+#########################################################################################################
+class CLabelConstraintBuilder:
+    """Creates the constraints of a compiled label skeleton on the label bones of a rig.
+
+    Plan() resolves the pose bones, targets and subtargets of all constraints once into a lookup table
+    and validates them, before anything is changed. A missing pose bone or an unresolved target is an
+    error, constraints with an unknown type or a missing subtarget are warnings. All errors and warnings
+    are reported together. Apply() then creates all planned constraints, while the rig is in pose mode,
+    and prints a timing summary per constraint type. Constraints of an unknown type are skipped.
+    """
+
+    def __init__(self, _objRig, _objHGBody, _objEyes):
+        self.objRig = _objRig
+        self.objHGBody = _objHGBody
+        self.objEyes = _objEyes
+
+        self.dicSetters: dict = {
+            "STRETCH_TO": self._SetStretchTo,
+            "LIMIT_LOCATION": self._SetLimitLocation,
+            "CHILD_OF": self._SetChildOf,
+            "COPY_LOCATION": self._SetCopyLocation,
+        }
+
+        # planned constraints as tuples (pose bone, type, target, constraint parameters)
+        self.lPlan: list = []
+        self.lErrors: list = []
+        self.lWarnings: list = []
+
+        self._dicTargets: dict = {}
+        self._dicSubtargets: dict = {}
+
+    # enddef
+
+    ############################################################################################
+    def _ResolveTarget(self, _sType: str, _dicConstraint: dict):
+        """Return the target object of a constraint, resolved once per target name"""
+        if _sType == "STRETCH_TO":
+            sTarget = _dicConstraint["target"]
+        elif _sType == "COPY_LOCATION":
+            sTarget = _dicConstraint["sTarget"]
+        else:
+            # LIMIT_LOCATION and CHILD_OF always refer to the body
+            return self.objHGBody
+        # endif
+
+        if sTarget not in self._dicTargets:
+            if _sType == "STRETCH_TO":
+                self._dicTargets[sTarget] = bpy.data.objects.get(sTarget)
+            # NOTE: Only supported targets = HG_Body & HG_Eyes
+            elif sTarget.startswith("HG_Body"):
+                self._dicTargets[sTarget] = self.objHGBody
+            elif sTarget.startswith("HG_Eyes"):
+                self._dicTargets[sTarget] = self.objEyes
+            else:
+                self._dicTargets[sTarget] = None
+            # endif
+        # endif
+        return self._dicTargets[sTarget]
+
+    # enddef
+
+    ############################################################################################
+    def _GetSubtargets(self, _objTarget) -> set:
+        """Return the names of the vertex groups or bones of a target object, collected once per target"""
+        sKey = _objTarget.name
+        if sKey not in self._dicSubtargets:
+            if _objTarget.type == "ARMATURE":
+                self._dicSubtargets[sKey] = {xBone.name for xBone in _objTarget.data.bones}
+            else:
+                self._dicSubtargets[sKey] = {xVertexGroup.name for xVertexGroup in _objTarget.vertex_groups}
+            # endif
+        # endif
+        return self._dicSubtargets[sKey]
+
+    # enddef
+
+    ############################################################################################
+    def Plan(self, _xSkeleton: CLabelSkeleton) -> bool:
+        """Resolve and validate all constraints of _xSkeleton, returns True if there are no errors"""
+        dicPoseBones = {xPoseBone.name: xPoseBone for xPoseBone in self.objRig.pose.bones}
+        dicUnknownTypes: dict = {}
+
+        for iBone, sType, dicConstraint in zip(
+            _xSkeleton.aConstraintBones.tolist(), _xSkeleton.lConstraintTypes, _xSkeleton.lConstraints
+        ):
+            sBoneName = _xSkeleton.lBoneNames[iBone]
+            if sType not in self.dicSetters:
+                dicUnknownTypes[sType] = dicUnknownTypes.get(sType, 0) + 1
+                continue
+            # endif
+
+            xPoseBone = dicPoseBones.get(sBoneName)
+            if xPoseBone is None:
+                self.lErrors.append(f"pose bone {sBoneName} not found")
+                continue
+            # endif
+
+            objTarget = self._ResolveTarget(sType, dicConstraint)
+            if objTarget is None:
+                self.lErrors.append(f"target of constraint {sType} of {sBoneName} not found")
+                continue
+            # endif
+
+            sSubtarget = dicConstraint.get("subtarget", dicConstraint.get("sSubtarget"))
+            if sSubtarget and sSubtarget not in self._GetSubtargets(objTarget):
+                self.lWarnings.append(f"subtarget {sSubtarget} of constraint {sType} of {sBoneName} not found")
+            # endif
+
+            self.lPlan.append((xPoseBone, sType, objTarget, dicConstraint))
+        # endfor
+
+        for sType, iCount in dicUnknownTypes.items():
+            self.lWarnings.append(f"constraint {sType} not implemented yet ({iCount}x)")
+        # endfor
+
+        if self.lErrors or self.lWarnings:
+            print(
+                f"Constraints of {_xSkeleton.sSkeletonType}:"
+                f" {len(self.lErrors)} errors, {len(self.lWarnings)} warnings"
+            )
+            for sMessage in self.lErrors:
+                print(f"  Error: {sMessage}")
+            # endfor
+            for sMessage in self.lWarnings:
+                print(f"  Warning: {sMessage}")
+            # endfor
+        # endif
+
+        return len(self.lErrors) == 0
+
+    # enddef
+
+    ############################################################################################
+    def Apply(self) -> dict:
+        """Create all planned constraints, returns {constraint type: (count, time in seconds)}"""
+        dicTiming: dict = {}
+        for xPoseBone, sType, objTarget, dicConstraint in self.lPlan:
+            fStart = time.perf_counter()
+            xNewConstraint = xPoseBone.constraints.new(sType)
+            xNewConstraint.target = objTarget
+            self.dicSetters[sType](xNewConstraint, dicConstraint)
+            iCount, fTime = dicTiming.get(sType, (0, 0.0))
+            dicTiming[sType] = (iCount + 1, fTime + time.perf_counter() - fStart)
+        # endfor
+
+        for sType, (iCount, fTime) in dicTiming.items():
+            xInstrumentation.Count("iConstraintsCreated", iCount)
+            print(f"Added {iCount} {sType} constraints in {fTime * 1000.0:.1f} ms")
+        # endfor
+        self.lPlan = []
+
+        return dicTiming
+
+    # enddef
+
+    ############################################################################################
+    @staticmethod
+    def _SetStretchTo(_xConstraint, _dicConstraint: dict):
+        _xConstraint.subtarget = _dicConstraint["subtarget"]
+        _xConstraint.keep_axis = _dicConstraint["sKeepAxis"]
+        _xConstraint.volume = _dicConstraint["sVolume"]
+        _xConstraint.influence = _dicConstraint["fInfluence"]
+
+    # enddef
+
+    ############################################################################################
+    @staticmethod
+    def _SetLimitLocation(_xConstraint, _dicConstraint: dict):
+        # the type given by 'sType' is set when the constraint is created
+        _xConstraint.max_x = _dicConstraint["fMaxX"]
+        _xConstraint.max_y = _dicConstraint["fMaxY"]
+        _xConstraint.max_z = _dicConstraint["fMaxZ"]
+        _xConstraint.min_x = _dicConstraint["fMinX"]
+        _xConstraint.min_y = _dicConstraint["fMinY"]
+        _xConstraint.min_z = _dicConstraint["fMinZ"]
+        _xConstraint.use_transform_limit = _dicConstraint["bUseTransformLimit"]
+        _xConstraint.owner_space = _dicConstraint["sOwnerSpace"]
+        _xConstraint.influence = _dicConstraint["fInfluence"]
+
+    # enddef
+
+    ############################################################################################
+    @staticmethod
+    def _SetChildOf(_xConstraint, _dicConstraint: dict):
+        _xConstraint.subtarget = _dicConstraint["sSubtarget"]
+        _xConstraint.keep_axis = _dicConstraint["sKeepAxis"]
+        _xConstraint.volume = _dicConstraint["sVolume"]
+        _xConstraint.influence = _dicConstraint["fInfluence"]
+
+    # enddef
+
+    ############################################################################################
+    @staticmethod
+    def _SetCopyLocation(_xConstraint, _dicConstraint: dict):
+        _xConstraint.subtarget = _dicConstraint["sSubtarget"]
+        _xConstraint.use_x = _dicConstraint["bUseX"]
+        _xConstraint.use_y = _dicConstraint["bUseY"]
+        _xConstraint.use_z = _dicConstraint["bUseZ"]
+        _xConstraint.invert_x = _dicConstraint["bInvertX"]
+        _xConstraint.invert_y = _dicConstraint["bInvertY"]
+        _xConstraint.invert_z = _dicConstraint["bInvertZ"]
+        _xConstraint.target_space = _dicConstraint["sTargetSpace"]
+        _xConstraint.owner_space = _dicConstraint["sOwnerSpace"]
+        _xConstraint.influence = _dicConstraint["fInfluence"]
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_label_exporter.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import bpy
+import numpy as np
+
+from . import landmarks
+from ..tools import TransformPoints
+
+
+#########################################################################################################
+class CLabelExporter:
+    """Streams the world space positions of all labels of a human to a landmark file, frame by frame.
+
+    The labels are the heads of the 'AT.Label;*' bones of the rig and the centroids of the label vertex
+    groups of the body and eye meshes. Per frame, the depsgraph is evaluated once and all positions are read
+    with foreach_get into NumPy arrays, so the cost per frame does not grow with Python calls per label.
+    See landmarks.ReadLandmarks() for reading the stream.
+    """
+
+    def __init__(self, _objRig, _dicMeshVertexGroups: dict, _sFilePath: str, _sBonePrefix: str = "AT.Label;"):
+        """
+        Parameters
+        ----------
+        _objRig : bpy.types.Object
+            rig with the label bones
+        _dicMeshVertexGroups : dict
+            {mesh object: list of label vertex group names}
+        _sFilePath : str
+            path of the landmark stream without extension
+        _sBonePrefix : str
+            prefix of the names of the label bones
+        """
+        self.objRig = _objRig
+        self.sFilePath: str = _sFilePath
+        self.lLabels: list = []
+        self.lKinds: list = []
+        self._xFile = None
+
+        # label bones, as indices into the pose bones of the rig
+        lBoneNames = [xPoseBone.name for xPoseBone in _objRig.pose.bones]
+        self.iBoneCount: int = len(lBoneNames)
+        self.aBoneIndices = np.array(
+            [iIdx for iIdx, sName in enumerate(lBoneNames) if sName.startswith(_sBonePrefix)], dtype=np.int64
+        )
+        self.lLabels.extend(lBoneNames[iIdx] for iIdx in self.aBoneIndices)
+        self.lKinds.extend("BONE" for _ in self.aBoneIndices)
+
+        # label vertex groups, as vertex indices sorted by group for np.add.reduceat
+        self.lMeshes: list = []
+        for objMesh, lGroups in _dicMeshVertexGroups.items():
+            dicGroupIndex = {
+                objMesh.vertex_groups[sGroup].index: sGroup for sGroup in lGroups if sGroup in objMesh.vertex_groups
+            }
+            if not dicGroupIndex:
+                continue
+            # endif
+
+            dicVertices = {iGroup: [] for iGroup in dicGroupIndex}
+            for xVertex in objMesh.data.vertices:
+                for xGroup in xVertex.groups:
+                    if xGroup.group in dicVertices and xGroup.weight > 0.0:
+                        dicVertices[xGroup.group].append(xVertex.index)
+                    # endif
+                # endfor
+            # endfor
+
+            lGroups = [iGroup for iGroup in dicGroupIndex if dicVertices[iGroup]]
+            aCounts = np.array([len(dicVertices[iGroup]) for iGroup in lGroups], dtype=np.int64)
+            self.lMeshes.append(
+                (
+                    objMesh,
+                    len(objMesh.data.vertices),
+                    np.concatenate([np.array(dicVertices[iGroup], dtype=np.int64) for iGroup in lGroups]),
+                    np.concatenate(([0], np.cumsum(aCounts)[:-1])),
+                    aCounts,
+                )
+            )
+            self.lLabels.extend(f"{objMesh.name};{dicGroupIndex[iGroup]}" for iGroup in lGroups)
+            self.lKinds.extend("VERTEX_GROUP" for _ in lGroups)
+        # endfor
+
+        self.xRecordType = landmarks.GetRecordType(len(self.lLabels))
+
+    # enddef
+
+    ############################################################################################
+    @classmethod
+    def FromBoneLabel(cls, _xBoneLabel, _sFilePath: str) -> "CLabelExporter":
+        """Exporter for the labels created by a BoneLabel instance"""
+        dicMeshVertexGroups = {}
+        for objMesh in (_xBoneLabel.objHGBody, _xBoneLabel.objEyes):
+            if objMesh is not None and objMesh.name in _xBoneLabel.dicLabelVertexGroups:
+                dicMeshVertexGroups[objMesh] = sorted(_xBoneLabel.dicLabelVertexGroups[objMesh.name])
+            # endif
+        # endfor
+        return cls(_xBoneLabel.objRig, dicMeshVertexGroups, _sFilePath)
+
+    # enddef
+
+    def __enter__(self):
+        self.Open()
+        return self
+
+    # enddef
+
+    def __exit__(self, _xType, _xValue, _xTraceback):
+        self.Close()
+
+    # enddef
+
+    ############################################################################################
+    def Open(self):
+        """Write the header and open the record file for writing"""
+        landmarks.WriteHeader(self.sFilePath, self.lLabels, self.lKinds, {"sRig": self.objRig.name})
+        self._xFile = open(self.sFilePath + ".bin", "wb")
+
+    # enddef
+
+    ############################################################################################
+    def Close(self):
+        if self._xFile is not None:
+            self._xFile.close()
+            self._xFile = None
+        # endif
+
+    # enddef
+
+    ############################################################################################
+    def GetPositions(self, _xDepsgraph=None) -> np.ndarray:
+        """Return the world space positions of all labels in the current frame as array of shape (label count, 3)"""
+        xDepsgraph = _xDepsgraph or bpy.context.evaluated_depsgraph_get()
+        lPositions = []
+
+        if len(self.aBoneIndices) > 0:
+            objRigEval = self.objRig.evaluated_get(xDepsgraph)
+            aHeads = np.empty(self.iBoneCount * 3, dtype=np.float32)
+            objRigEval.pose.bones.foreach_get("head", aHeads)
+            aHeads = aHeads.reshape(-1, 3)[self.aBoneIndices]
+            lPositions.append(TransformPoints(aHeads, objRigEval.matrix_world))
+        # endif
+
+        for objMesh, iVertexCount, aVertices, aStarts, aCounts in self.lMeshes:
+            objMeshEval = objMesh.evaluated_get(xDepsgraph)
+            xVertices = objMeshEval.data.vertices
+            if len(xVertices) != iVertexCount:
+                raise RuntimeError(
+                    f"Evaluated mesh {objMesh.name} has {len(xVertices)} instead of {iVertexCount} vertices,"
+                    " disable modifiers that change the topology for the landmark export"
+                )
+            # endif
+            aCo = np.empty(iVertexCount * 3, dtype=np.float32)
+            xVertices.foreach_get("co", aCo)
+            aCentroids = np.add.reduceat(aCo.reshape(-1, 3)[aVertices], aStarts, axis=0) / aCounts[:, None]
+            lPositions.append(TransformPoints(aCentroids, objMeshEval.matrix_world))
+        # endfor
+
+        if not lPositions:
+            return np.zeros((0, 3), dtype=np.float32)
+        # endif
+        return np.concatenate(lPositions).astype(np.float32)
+
+    # enddef
+
+    ############################################################################################
+    def WriteFrame(self, _iFrame: int = None, _xDepsgraph=None):
+        """Append the label positions of the current frame to the stream, e.g. from a frame change handler"""
+        aRecord = np.empty(1, dtype=self.xRecordType)
+        aRecord["iFrame"] = bpy.context.scene.frame_current if _iFrame is None else _iFrame
+        aRecord["aPoints"] = self.GetPositions(_xDepsgraph)
+        self._xFile.write(aRecord.tobytes())
+
+    # enddef
+
+    ############################################################################################
+    def Export(self, _iFrameStart: int = None, _iFrameEnd: int = None, _iFrameStep: int = 1) -> int:
+        """Write the label positions of all frames in [_iFrameStart, _iFrameEnd], defaults to the scene frame range.
+
+        Returns the number of written frames.
+        """
+        xScene = bpy.context.scene
+        iFrameStart = xScene.frame_start if _iFrameStart is None else _iFrameStart
+        iFrameEnd = xScene.frame_end if _iFrameEnd is None else _iFrameEnd
+        iFrameCurrent = xScene.frame_current
+
+        iCount = 0
+        bOwnFile = self._xFile is None
+        if bOwnFile:
+            self.Open()
+        # endif
+        try:
+            for iFrame in range(iFrameStart, iFrameEnd + 1, _iFrameStep):
+                xScene.frame_set(iFrame)
+                self.WriteFrame(iFrame, bpy.context.evaluated_depsgraph_get())
+                iCount += 1
+            # endfor
+        finally:
+            if bOwnFile:
+                self.Close()
+            # endif
+            xScene.frame_set(iFrameCurrent)
+        # endtry
+
+        return iCount
+
+    # enddef
+
+
+# endclass
+
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_label_mapping.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import os
+import sys
+import json
+import threading
+
+import numpy as np
+
+from ..cls_instrumentation import xInstrumentation
+
+
+#########################################################################################################
+class CLabelSkeleton:
+    """Compiled form of a label skeleton mapping file, e.g. WFLW_labels_anyhuman.json.
+
+    The bones are stored column-wise: interned names and parent names, and NumPy arrays of the heads,
+    tails, envelopes and head radii. The constraints of all bones form a flat table of bone index,
+    interned constraint type and constraint parameters. The vertex groups 'lLabelVertices' are kept as
+    in the mapping file.
+    """
+
+    def __init__(self):
+        self.sSkeletonType: str = None
+        self.lNames: list = []
+        self.lBoneNames: list = []
+        self.lParents: list = []
+        self.aHeads: np.ndarray = np.zeros((0, 3))
+        self.aTails: np.ndarray = np.zeros((0, 3))
+        self.aEnvelopes: np.ndarray = np.zeros(0)
+        self.aHeadRadii: np.ndarray = np.zeros(0)
+        self.aConstraintBones: np.ndarray = np.zeros(0, dtype=np.int32)
+        self.lConstraintTypes: list = []
+        self.lConstraints: list = []
+        self.lLabelVertices: list = []
+
+    # enddef
+
+    def __len__(self) -> int:
+        return len(self.lNames)
+
+    # enddef
+
+    ############################################################################################
+    @staticmethod
+    def GetBoneName(_sSkeletonType: str, _sName: str) -> str:
+        """Name of the label bone _sName of a skeleton in the rig"""
+        return sys.intern("AT.Label;" + _sSkeletonType + ";" + _sName)
+
+    # enddef
+
+    ############################################################################################
+    @classmethod
+    def FromDict(cls, _dicSkeleton: dict) -> "CLabelSkeleton":
+        """Compile the content of a label skeleton mapping file"""
+        xSkeleton = cls()
+        lBones = _dicSkeleton.get("lBones", [])
+
+        xSkeleton.sSkeletonType = _dicSkeleton.get("sSkeletonType")
+        xSkeleton.lNames = [sys.intern(dicBone["sName"]) for dicBone in lBones]
+        xSkeleton.lBoneNames = [cls.GetBoneName(xSkeleton.sSkeletonType, dicBone["sName"]) for dicBone in lBones]
+        xSkeleton.lParents = [sys.intern(dicBone["sParent"]) for dicBone in lBones]
+        xSkeleton.aHeads = np.array([dicBone["lHead"] for dicBone in lBones], dtype=np.float64).reshape(-1, 3)
+        xSkeleton.aTails = np.array([dicBone["lTail"] for dicBone in lBones], dtype=np.float64).reshape(-1, 3)
+        xSkeleton.aEnvelopes = np.array([dicBone["fEnvelope"] for dicBone in lBones], dtype=np.float64)
+        xSkeleton.aHeadRadii = np.array([dicBone["fHeadRadius"] for dicBone in lBones], dtype=np.float64)
+
+        lConstraintBones = []
+        for iBone, dicBone in enumerate(lBones):
+            for dicConstraint in dicBone.get("lConstraints", []):
+                lConstraintBones.append(iBone)
+                xSkeleton.lConstraintTypes.append(sys.intern(dicConstraint["sType"]))
+                xSkeleton.lConstraints.append(dicConstraint)
+            # endfor
+        # endfor
+        xSkeleton.aConstraintBones = np.array(lConstraintBones, dtype=np.int32)
+
+        xSkeleton.lLabelVertices = _dicSkeleton.get("lLabelVertices", [])
+        return xSkeleton
+
+    # enddef
+
+
+# endclass
+
+
+#########################################################################################################
+class CLabelMappingCache:
+    """Process-wide memo of label mapping files.
+
+    A file is parsed once and its entry is invalidated when its modification time or size changes.
+    The returned data is shared by all callers and must not be modified.
+    """
+
+    def __init__(self):
+        self._dicEntries: dict = {}
+        self._xLock = threading.Lock()
+        self.iHits: int = 0
+        self.iMisses: int = 0
+
+    # enddef
+
+    ############################################################################################
+    def _Get(self, _sFile: str, _bCompile: bool):
+        sFile = os.path.abspath(str(_sFile))
+        xStat = os.stat(sFile)
+        tStamp = (xStat.st_mtime_ns, xStat.st_size)
+        tKey = (sFile, _bCompile)
+
+        with self._xLock:
+            tEntry = self._dicEntries.get(tKey)
+            if tEntry is not None and tEntry[0] == tStamp:
+                self.iHits += 1
+                return tEntry[1]
+            # endif
+            self.iMisses += 1
+        # endwith
+        xInstrumentation.Count("iFilesRead")
+
+        with open(sFile, "r") as xJsonFile:
+            xData = json.load(xJsonFile)
+        # endwith
+        if _bCompile:
+            xData = CLabelSkeleton.FromDict(xData)
+        # endif
+
+        with self._xLock:
+            self._dicEntries[tKey] = (tStamp, xData)
+        # endwith
+        return xData
+
+    # enddef
+
+    ############################################################################################
+    def Get(self, _sFile: str):
+        """Return the parsed JSON content of the mapping file _sFile"""
+        return self._Get(_sFile, False)
+
+    # enddef
+
+    ############################################################################################
+    def GetSkeleton(self, _sFile: str) -> CLabelSkeleton:
+        """Return the compiled label skeleton of the mapping file _sFile"""
+        return self._Get(_sFile, True)
+
+    # enddef
+
+    ############################################################################################
+    def Clear(self):
+        """Remove all entries and reset the hit and miss counters"""
+        with self._xLock:
+            self._dicEntries.clear()
+            self.iHits = 0
+            self.iMisses = 0
+        # endwith
+
+    # enddef
+
+
+# endclass
+
+# mapping files parsed by this process
+xLabelMappingCache = CLabelMappingCache()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_label_rig_template.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import json
+import hashlib
+
+import bpy
+import mathutils
+
+from .cls_label_skeleton import BoneLabel
+from ..cls_instrumentation import xInstrumentation
+
+
+#########################################################################################################
+class CLabelRigTemplates:
+    """Templates of labelled rigs, which are copied to new rigs instead of rebuilding the labels.
+
+    The label bones (OpenPose hand, WFLW, IMS, ...) and their constraints are the same for every HumGen rig
+    with the same bones and label settings. After the first rig of such a topology has been labelled,
+    Capture() keeps a copy of it as hidden template object with a fake user. Apply() then copies the label
+    bones of the template to a new rig in one edit mode session, with heads, tails and rolls retargeted
+    relative to the parent bones, and copies their constraints in one pose mode session. Constraint targets
+    on the body, eyes and rig of the template human are stored as roles, which Apply() resolves to the body,
+    eyes and rig of the new human.
+
+    As the template objects have a fake user, they are saved with the .blend file. They are reused when the
+    file is opened again; Clear() removes them, e.g. before saving a file without them.
+    """
+
+    sNamePrefix: str = "AT.LabelRigTemplate."
+    iVersion: int = 2
+
+    ############################################################################################
+    @staticmethod
+    def GetKey(_objRig, _lLabelSettings: list) -> str:
+        """Topology key of a rig, from its bone names before labelling and the label settings"""
+        xHash = hashlib.sha1(json.dumps([str(xSetting) for xSetting in _lLabelSettings]).encode("utf-8"))
+        for sBone in sorted(xBone.name for xBone in _objRig.data.bones):
+            xHash.update(sBone.encode("utf-8"))
+            xHash.update(b"\0")
+        # endfor
+        return xHash.hexdigest()[:16]
+
+    # enddef
+
+    ############################################################################################
+    def GetTemplate(self, _sKey: str):
+        """Return the template object for the topology key _sKey, or None if there is none yet"""
+        objTemplate = bpy.data.objects.get(self.sNamePrefix + _sKey)
+        if objTemplate is None or "sLabelRigTemplate" not in objTemplate:
+            return None
+        # endif
+
+        if json.loads(objTemplate["sLabelRigTemplate"]).get("iVersion") != self.iVersion:
+            # template of an older version, e.g. from a saved .blend file, is captured again
+            self._Remove(objTemplate)
+            return None
+        # endif
+        return objTemplate
+
+    # enddef
+
+    ############################################################################################
+    @staticmethod
+    def _Remove(_objTemplate):
+        xArmature = _objTemplate.data
+        bpy.data.objects.remove(_objTemplate)
+        if xArmature.users == 0 or (xArmature.use_fake_user and xArmature.users == 1):
+            bpy.data.armatures.remove(xArmature)
+        # endif
+
+    # enddef
+
+    ############################################################################################
+    def Clear(self):
+        """Remove all label rig templates from the blend data"""
+        for objTemplate in [objX for objX in bpy.data.objects if objX.name.startswith(self.sNamePrefix)]:
+            self._Remove(objTemplate)
+        # endfor
+
+    # enddef
+
+    ############################################################################################
+    def Capture(self, _sKey: str, _objRig, _lBaseBones: list, _objBody, _objEyes):
+        """Keep a copy of the labelled rig _objRig as template. _lBaseBones are the bone names before labelling."""
+        setBaseBones = set(_lBaseBones)
+        xBones = _objRig.data.bones
+
+        # label bones, ordered such that parents come before their children
+        lLabelBones = []
+        setAdded = set(setBaseBones)
+        lPending = [xBone for xBone in xBones if xBone.name not in setBaseBones]
+        while lPending:
+            lRemaining = []
+            for xBone in lPending:
+                if xBone.parent is None or xBone.parent.name in setAdded:
+                    lLabelBones.append(xBone.name)
+                    setAdded.add(xBone.name)
+                else:
+                    lRemaining.append(xBone)
+                # endif
+            # endfor
+            if len(lRemaining) == len(lPending):
+                raise RuntimeError(f"Label bones of rig '{_objRig.name}' have parents outside of the rig")
+            # endif
+            lPending = lRemaining
+        # endwhile
+
+        objTemplate = _objRig.copy()
+        objTemplate.data = _objRig.data.copy()
+        objTemplate.name = self.sNamePrefix + _sKey
+        objTemplate.data.name = self.sNamePrefix + _sKey
+        objTemplate.use_fake_user = True
+        objTemplate.data.use_fake_user = True
+
+        # replace the targets on the template human by roles, so that the template does not depend on the
+        # names or the existence of the objects of the template human
+        lTargetRoles = [(_objRig, "RIG"), (objTemplate, "RIG"), (_objBody, "BODY"), (_objEyes, "EYES")]
+        dicConstraintRoles = {}
+        for sBone in lLabelBones:
+            lRoles = []
+            for xConstraint in objTemplate.pose.bones[sBone].constraints:
+                objTarget = getattr(xConstraint, "target", None)
+                sRole = next((sRole for objX, sRole in lTargetRoles if objX is not None and objTarget == objX), "")
+                if sRole:
+                    xConstraint.target = None
+                # endif
+                lRoles.append(sRole)
+            # endfor
+            dicConstraintRoles[sBone] = lRoles
+        # endfor
+
+        objTemplate["sLabelRigTemplate"] = json.dumps(
+            {"iVersion": self.iVersion, "lLabelBones": lLabelBones, "dicConstraintRoles": dicConstraintRoles}
+        )
+
+        print(f"INFO: Label rig template {objTemplate.name} with {len(lLabelBones)} label bones created")
+        return objTemplate
+
+    # enddef
+
+    ############################################################################################
+    def Apply(self, _sKey: str, _objRig, _objBody, _objEyes) -> bool:
+        """Copy the label bones and constraints of the template for _sKey to _objRig.
+
+        Returns False, if there is no template for _sKey yet.
+        """
+        objTemplate = self.GetTemplate(_sKey)
+        if objTemplate is None:
+            return False
+        # endif
+
+        dicInfo = json.loads(objTemplate["sLabelRigTemplate"])
+        lLabelBones = dicInfo["lLabelBones"]
+        dicConstraintRoles = dicInfo["dicConstraintRoles"]
+        dicTargets = {"RIG": _objRig, "BODY": _objBody, "EYES": _objEyes}
+        xTemplateBones = objTemplate.data.bones
+
+        # label bones, in a single edit mode session
+        BoneLabel.SetMode(_objRig, "EDIT")
+        xEditBones = _objRig.data.edit_bones
+        dicEditBones = {xEditBone.name: xEditBone for xEditBone in xEditBones}
+        for sBone in lLabelBones:
+            xTemplateBone = xTemplateBones[sBone]
+            xEditBone = dicEditBones.get(sBone)
+            if xEditBone is None:
+                xEditBone = dicEditBones[sBone] = xEditBones.new(sBone)
+                xInstrumentation.Count("iBonesCreated")
+            # endif
+
+            # transformation from the parent in the template rest pose to the parent in this rig
+            xParent = dicEditBones.get(xTemplateBone.parent.name) if xTemplateBone.parent is not None else None
+            if xParent is not None:
+                xTransform = xParent.matrix @ xTemplateBone.parent.matrix_local.inverted()
+            else:
+                xTransform = mathutils.Matrix.Identity(4)
+            # endif
+
+            xEditBone.head = xTransform @ xTemplateBone.head_local
+            xEditBone.tail = xTransform @ xTemplateBone.tail_local
+            xEditBone.matrix = xTransform @ xTemplateBone.matrix_local
+            xEditBone.parent = xParent
+            xEditBone.use_connect = xTemplateBone.use_connect
+            xEditBone.envelope_distance = xTemplateBone.envelope_distance
+            xEditBone.head_radius = xTemplateBone.head_radius
+        # endfor
+
+        # constraints of the label bones, in a single pose mode session
+        BoneLabel.SetMode(_objRig, "POSE")
+        xTemplatePoseBones = objTemplate.pose.bones
+        xPoseBones = _objRig.pose.bones
+        iConstraintCount = 0
+        for sBone in lLabelBones:
+            xPoseBone = xPoseBones[sBone]
+            for xConstraint, sRole in zip(xTemplatePoseBones[sBone].constraints, dicConstraintRoles[sBone]):
+                xNewConstraint = xPoseBone.constraints.copy(xConstraint)
+                if sRole:
+                    xNewConstraint.target = dicTargets[sRole]
+                # endif
+                iConstraintCount += 1
+            # endfor
+        # endfor
+        BoneLabel.SetMode(_objRig, "OBJECT")
+        xInstrumentation.Count("iConstraintsCreated", iConstraintCount)
+
+        print(
+            f"INFO: {len(lLabelBones)} label bones and {iConstraintCount} constraints"
+            f" copied from label rig template {objTemplate.name}"
+        )
+        return True
+
+    # enddef
+
+
+# endclass
+
+# label rig templates of this process, the template objects themselves are stored in bpy.data
+xLabelRigTemplates = CLabelRigTemplates()
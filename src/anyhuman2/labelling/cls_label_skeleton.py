@@ -13,12 +13,20 @@ RuntimeError
 
 
 import json
+from typing import Optional, Union
 from mathutils import Vector
 import bpy
 from HumGen3D import Human
 
+from .cls_label_mapping import CLabelSkeleton, xLabelMappingCache
+from .cls_label_constraints import CLabelConstraintBuilder
+from ..cls_instrumentation import xInstrumentation
+
 
 class BoneLabel:
+    # Number of object mode switches done by all instances, see SetMode()
+    iModeSwitchCount: int = 0
+
     def __init__(self, _human: Human):
         """
         A LabelBone is a label attached to a bone or vertex group and identifies itself as landmark.
@@ -32,15 +40,39 @@ class BoneLabel:
         print(f"INFO: Working on Human:  {_human.name} ")
 
         self.lOpenPoseHandLabels = []
+        # False, if the label bones and constraints have been copied from a label rig template,
+        # then only the vertex groups are created from the mapping files
+        self.bCreateBones: bool = True
+        # names of the label vertex groups per mesh object, e.g. for CLabelExporter
+        self.dicLabelVertexGroups: dict = {}
+
+    @staticmethod
+    def LoadMappingFile(_sFile: str):
+        """Return the parsed JSON mapping file, which is parsed once per process, see CLabelMappingCache.
+        The returned data is shared and must not be modified."""
+        return xLabelMappingCache.Get(_sFile)
+
+    # enddef
+
+    @classmethod
+    def SetMode(cls, _objRig: bpy.types.Object, _sMode: str):
+        """Make _objRig the active object and switch it to object mode _sMode, if it is not in this mode yet"""
+        bpy.context.view_layer.objects.active = _objRig
+        if _objRig.mode != _sMode:
+            bpy.ops.object.mode_set(mode=_sMode)
+            cls.iModeSwitchCount += 1
+            xInstrumentation.Count("iModeSwitches")
+        # endif
+
+    # enddef
 
     # ************************************* BEGIN HAND LABELS ********************************************************
 
     def LoadHandMappings(self, _sHandLabelsFile: str):
         try:
-            with open(_sHandLabelsFile, "r") as json_file:
-                lOpenPoseHandLabels = json.load(json_file)
-                return lOpenPoseHandLabels
-                # print(f"{len(self.label_config.lOpenPoseHandLabels)} labels found for hand mapping")
+            lOpenPoseHandLabels = self.LoadMappingFile(_sHandLabelsFile)
+            return lOpenPoseHandLabels
+            # print(f"{len(self.label_config.lOpenPoseHandLabels)} labels found for hand mapping")
         except FileNotFoundError:
             print(f"File not found: {_sHandLabelsFile}")
             return []
@@ -52,6 +84,8 @@ class BoneLabel:
     # enddef
 
     def AddHandLabels(self, _sLabelFile: str, _objArmature: bpy.types.Armature, _objRig: bpy.types.Object):
+        if not self.bCreateBones:
+            return
         self.lOpenPoseHandLabels = self.LoadHandMappings(_sLabelFile)
         if len(self.lOpenPoseHandLabels) is None:
             return
@@ -59,8 +93,7 @@ class BoneLabel:
             print("Error _objArmature not found")
             return
 
-        bpy.context.view_layer.objects.active = _objRig
-        bpy.ops.object.mode_set(mode="EDIT")
+        self.SetMode(_objRig, "EDIT")
 
         for i in self.lOpenPoseHandLabels:
             sParent = i["sBone"]
@@ -79,6 +112,7 @@ class BoneLabel:
             # endif openpose_mark_bone is not None:
             if sAttachTo == "head":
                 new_bone = _objArmature.edit_bones.new(str(sOpenposeLabel))
+                xInstrumentation.Count("iBonesCreated")
                 print(f"{sParent}\t{sAttachTo}\t{sOpenposeLabel}")
                 # parent_bone = armature.edit_bones.get(str(sParent))
                 new_bone.parent = parent_bone
@@ -89,6 +123,7 @@ class BoneLabel:
             # endif sAttachTo == 'head':
             else:
                 new_bone = _objArmature.edit_bones.new(str(sOpenposeLabel))
+                xInstrumentation.Count("iBonesCreated")
                 print(f"{sParent}\t{sAttachTo}\t{sOpenposeLabel}")
                 new_bone.parent = parent_bone
                 new_bone.head = parent_bone.tail
@@ -98,7 +133,7 @@ class BoneLabel:
             # endelse
         # endfor
         # TODO: set to original/previous mode
-        bpy.ops.object.mode_set(mode="OBJECT")
+        self.SetMode(_objRig, "OBJECT")
         return
 
     # enddef
@@ -108,10 +143,9 @@ class BoneLabel:
 
     def UpdateEyebrowLabels(self, _sEyebrowStyle: str, _labelFile: str):
         try:
-            with open(_labelFile, "r") as jsonFile:
-                dictEyebrow = json.load(jsonFile)
+            xEyebrow = xLabelMappingCache.GetSkeleton(_labelFile)
             self.CreateVertexGroups(
-                _objMesh=self.objHGBody, _lLabelVertices=dictEyebrow["lLabelVertices"], _replaceExisting=True
+                _objMesh=self.objHGBody, _lLabelVertices=xEyebrow.lLabelVertices, _replaceExisting=True
             )
         except FileNotFoundError as e:
             print(f"{e}")
@@ -120,40 +154,53 @@ class BoneLabel:
 
     def ImportSkeletonData(self, _sSkeletonDataFile, _replaceVertexGroups):
         # STEP 1: Parse input json and extract skeletal bones with constraints and vertex groups
-        dicSkeleton = self.ParseSkeleton(_sInSkeletonFile=_sSkeletonDataFile)
+        xSkeleton = self.ParseSkeleton(_sInSkeletonFile=_sSkeletonDataFile)
+        if xSkeleton is None:
+            return {"CANCELLED"}
+        # endif
         # STEP 2: Add vertex groups to objHGBody (Mesh)
-        if "lLabelVertices" in dicSkeleton:
-            lLabelVertices = dicSkeleton["lLabelVertices"]
-        else:
-            lLabelVertices = []
-        self.CreateVertexGroups(
-            _objMesh=self.objHGBody,
-            _lLabelVertices=lLabelVertices,
-            _replaceExisting=_replaceVertexGroups,
-        )
-        # STEP 3: Add bones
-        self.ImportSkeletonBones(_dicSkeleton=dicSkeleton, _objArmature=self.objArmature, _objRig=self.objRig)
-        # STEP 4: Add constraints
-        self.AddConstraints(_dicSkeleton=dicSkeleton, _objArmature=self.objArmature, _objRig=self.objRig)
+        with xInstrumentation.Span("vertex_groups"):
+            self.CreateVertexGroups(
+                _objMesh=self.objHGBody,
+                _lLabelVertices=xSkeleton.lLabelVertices,
+                _replaceExisting=_replaceVertexGroups,
+            )
+        # endwith
+        if self.bCreateBones:
+            # STEP 3: Add bones
+            with xInstrumentation.Span("bones"):
+                self.ImportSkeletonBones(_dicSkeleton=xSkeleton, _objArmature=self.objArmature, _objRig=self.objRig)
+            # endwith
+            # STEP 4: Add constraints
+            with xInstrumentation.Span("constraints"):
+                self.AddConstraints(_dicSkeleton=xSkeleton, _objArmature=self.objArmature, _objRig=self.objRig)
+            # endwith
+        # endif
 
         return {"FINISHED"}
 
     # add bone based on contents of _dicBone
-    def AddBone(self, _sSkeletonType, _dicBone, _objArmature, _objRig):
-        bpy.context.view_layer.objects.active = _objRig
-        bpy.ops.object.mode_set(mode="EDIT")
+    # _dicEditBones maps bone names to the edit bones of _objArmature. If it is given, the rig has to be in
+    # edit mode already and new bones are added to it, see ImportSkeletonBones().
+    def AddBone(self, _sSkeletonType, _dicBone, _objArmature, _objRig, _dicEditBones: Optional[dict] = None):
+        if _dicEditBones is None:
+            self.SetMode(_objRig, "EDIT")
+            _dicEditBones = {xEditBone.name: xEditBone for xEditBone in _objArmature.edit_bones}
+        # endif
 
         sNewBoneName = "AT.Label;" + _sSkeletonType + ";" + _dicBone["sName"]
-        objNewBone = _objArmature.edit_bones.get(str(sNewBoneName))
+        objNewBone = _dicEditBones.get(sNewBoneName)
         if objNewBone is not None:
-            print("Error: %s already present - only updating envelope_distance & head_radius", str(sNewBoneName))
+            print(f"Error: {sNewBoneName} already present - only updating envelope_distance & head_radius")
             # _objArmature.edit_bones.remove(objNewBone)
             objNewBone.envelope_distance = _dicBone["fEnvelope"]
             objNewBone.head_radius = _dicBone["fHeadRadius"]
             return
         objNewBone = _objArmature.edit_bones.new(sNewBoneName)
+        _dicEditBones[sNewBoneName] = objNewBone
+        xInstrumentation.Count("iBonesCreated")
 
-        xParentBone = _objArmature.edit_bones.get(_dicBone["sParent"])
+        xParentBone = _dicEditBones.get(_dicBone["sParent"])
         objNewBone.parent = xParentBone if xParentBone else None
 
         lHead = Vector((_dicBone["lHead"][0], _dicBone["lHead"][1], _dicBone["lHead"][2]))
@@ -166,172 +213,123 @@ class BoneLabel:
 
     # enddef
 
-    def AddConstraints(self, _dicSkeleton, _objArmature, _objRig):
-        # pose mode
-        bpy.context.view_layer.objects.active = _objRig
-        bpy.ops.object.mode_set(mode="POSE")
-
-        for dicBone in _dicSkeleton["lBones"]:
-            # construct bone name
-            sPoseBoneName = "AT.Label;" + dicBone["sType"] + ";" + dicBone["sName"]
-
-            # get pose bone
-            objPoseBone = _objRig.pose.bones[sPoseBoneName]
-
-            # add constraints
-            # TODO: Implement switch (lConstraints) statement for faster execution
-            for objConstraint in dicBone["lConstraints"]:
-                sContraintType = objConstraint["sType"]
-                print(f"Adding constraint {sContraintType} for posebone {sPoseBoneName}")
-                if sContraintType == "STRETCH_TO":
-                    self.AddConstraintStretchTo(objPoseBone, objConstraint)
-                elif sContraintType == "LIMIT_LOCATION":
-                    self.AddConstraintLimitLocation(objPoseBone, objConstraint)
-                elif sContraintType == "CHILD_OF":
-                    self.AddConstraintChildOf(objPoseBone, objConstraint)
-                elif sContraintType == "COPY_LOCATION":
-                    self.AddConstraintCopyLocation(objPoseBone, objConstraint)
-                else:
-                    print(f"Error: constraint {sContraintType} not implemented yet")
-            # endfor
-
-        # get into object mode
-        bpy.ops.object.mode_set(mode="OBJECT")
-
-    # enddef
-
-    # add STRETCH_TO constraint
-    def AddConstraintStretchTo(_self, _xPoseBone, _lStretchConstraint):
-        xNewConstraint = _xPoseBone.constraints.new("STRETCH_TO")
-        xNewConstraint.target = bpy.data.objects[_lStretchConstraint["target"]]
-        xNewConstraint.subtarget = _lStretchConstraint["subtarget"]
-        xNewConstraint.keep_axis = _lStretchConstraint["sKeepAxis"]
-        xNewConstraint.volume = _lStretchConstraint["sVolume"]
-        xNewConstraint.influence = _lStretchConstraint["fInfluence"]
-
-    # enddef
-
-    # add LIMIT_LOCATION constraint
-    def AddConstraintLimitLocation(self, _xPoseBone, _lLimitLocationConstraint):
-        xNewConstraint = _xPoseBone.constraints.new("LIMIT_LOCATION")
-        xNewConstraint.target = self.objHGBody
-        xNewConstraint.type = _lLimitLocationConstraint["sType"]
-        xNewConstraint.max_x = _lLimitLocationConstraint["fMaxX"]
-        xNewConstraint.max_y = _lLimitLocationConstraint["fMaxY"]
-        xNewConstraint.max_z = _lLimitLocationConstraint["fMaxZ"]
-        xNewConstraint.min_x = _lLimitLocationConstraint["fMinX"]
-        xNewConstraint.min_y = _lLimitLocationConstraint["fMinY"]
-        xNewConstraint.min_z = _lLimitLocationConstraint["fMinZ"]
-        xNewConstraint.use_transform_limit = _lLimitLocationConstraint["bUseTransformLimit"]
-        xNewConstraint.owner_space = _lLimitLocationConstraint["sOwnerSpace"]
-        xNewConstraint.influence = _lLimitLocationConstraint["fInfluence"]
-
-    # enddef
-
-    # add CHILD_OF constraint
-    def AddConstraintChildOf(self, _xPoseBone, lChildOfConstraint):
-        xNewConstraint = _xPoseBone.constraints.new("CHILD_OF")
-        xNewConstraint.target = self.objHGBody
-        xNewConstraint.subtarget = lChildOfConstraint["sSubtarget"]
-        xNewConstraint.keep_axis = lChildOfConstraint["sKeepAxis"]
-        xNewConstraint.volume = lChildOfConstraint["sVolume"]
-        xNewConstraint.influence = lChildOfConstraint["fInfluence"]
-
-    # enddef
-
-    # NOTE: Only supported targets = HG_Body & HG_Eyes
-    def AddTarget(self, _lConstraintCopyLocation):
-        sTarget = _lConstraintCopyLocation["sTarget"]
-        if sTarget.startswith("HG_Body"):
-            return self.objHGBody
-        elif sTarget.startswith("HG_Eyes"):
-            return self.objEyes
-        else:
-            print(f"{sTarget} not found")
-            return None
+    def AddConstraints(self, _dicSkeleton: Union[dict, CLabelSkeleton], _objArmature, _objRig):
+        xSkeleton = _dicSkeleton if isinstance(_dicSkeleton, CLabelSkeleton) else CLabelSkeleton.FromDict(_dicSkeleton)
+
+        # the pose bones of new label bones only exist after the rig has left edit mode,
+        # all constraints are resolved and validated, before any of them is created
+        self.SetMode(_objRig, "POSE")
+        xBuilder = CLabelConstraintBuilder(_objRig, self.objHGBody, self.objEyes)
+        if not xBuilder.Plan(xSkeleton):
+            self.SetMode(_objRig, "OBJECT")
+            raise RuntimeError(
+                f"Cannot add constraints of {xSkeleton.sSkeletonType}:\n  " + "\n  ".join(xBuilder.lErrors)
+            )
+        # endif
 
-    # enddef
+        # create all constraints in one pose mode session
+        xBuilder.Apply()
 
-    # add COPY_LOCATION constraint
-    def AddConstraintCopyLocation(self, _xPoseBone, _lConstraintCopyLocation):
-        xNewConstraint = _xPoseBone.constraints.new("COPY_LOCATION")
-        xNewConstraint.target = self.AddTarget(_lConstraintCopyLocation)
-        xNewConstraint.subtarget = _lConstraintCopyLocation["sSubtarget"]
-        xNewConstraint.use_x = _lConstraintCopyLocation["bUseX"]
-        xNewConstraint.use_y = _lConstraintCopyLocation["bUseY"]
-        xNewConstraint.use_z = _lConstraintCopyLocation["bUseZ"]
-        xNewConstraint.invert_x = _lConstraintCopyLocation["bInvertX"]
-        xNewConstraint.invert_y = _lConstraintCopyLocation["bInvertY"]
-        xNewConstraint.invert_z = _lConstraintCopyLocation["bInvertZ"]
-        xNewConstraint.target_space = _lConstraintCopyLocation["sTargetSpace"]
-        xNewConstraint.owner_space = _lConstraintCopyLocation["sOwnerSpace"]
-        xNewConstraint.influence = _lConstraintCopyLocation["fInfluence"]
+        # get into object mode
+        self.SetMode(_objRig, "OBJECT")
 
     # enddef
 
-    # Import bones and add to rig
-    def ImportSkeletonBones(self, _dicSkeleton, _objArmature, _objRig):
+    # Import bones and add to rig, all bones are created in a single edit mode session
+    def ImportSkeletonBones(self, _dicSkeleton: Union[dict, CLabelSkeleton], _objArmature, _objRig):
         try:
-            sSkeletonType = _dicSkeleton["sSkeletonType"]
-            for dicBone in _dicSkeleton["lBones"]:
-                self.AddBone(sSkeletonType, dicBone, _objArmature, _objRig)
+            xSkeleton = (
+                _dicSkeleton if isinstance(_dicSkeleton, CLabelSkeleton) else CLabelSkeleton.FromDict(_dicSkeleton)
+            )
+            self.SetMode(_objRig, "EDIT")
+            dicEditBones = {xEditBone.name: xEditBone for xEditBone in _objArmature.edit_bones}
+            for iBone, sNewBoneName in enumerate(xSkeleton.lBoneNames):
+                objNewBone = dicEditBones.get(sNewBoneName)
+                if objNewBone is not None:
+                    print(f"Error: {sNewBoneName} already present - only updating envelope_distance & head_radius")
+                else:
+                    objNewBone = dicEditBones[sNewBoneName] = _objArmature.edit_bones.new(sNewBoneName)
+                    xInstrumentation.Count("iBonesCreated")
+                    objNewBone.parent = dicEditBones.get(xSkeleton.lParents[iBone])
+                    objNewBone.head = xSkeleton.aHeads[iBone]
+                    objNewBone.tail = xSkeleton.aTails[iBone]
+                # endif
+                objNewBone.envelope_distance = xSkeleton.aEnvelopes[iBone]
+                objNewBone.head_radius = xSkeleton.aHeadRadii[iBone]
+            # endfor
         except ValueError as e:
             print(f"ERROR: {e}")
 
     # enddef
 
-    # import skeleton from json file
-    def ParseSkeleton(self, _sInSkeletonFile):
+    # import skeleton from json file, the compiled skeleton is parsed once per process
+    def ParseSkeleton(self, _sInSkeletonFile) -> Optional[CLabelSkeleton]:
         try:
-            with open(_sInSkeletonFile, "r") as sJsonFile:
-                dicSkeleton = json.load(sJsonFile)
-            return dicSkeleton
+            xSkeleton = xLabelMappingCache.GetSkeleton(_sInSkeletonFile)
+            return xSkeleton
         except FileNotFoundError:
             print(f"{_sInSkeletonFile} not found")
-            return {}
+            return None
 
     # enddef
 
     def AddVertexGroupToMesh(self, _objMesh, _dicVertexGroup: dict, _replaceExisting=True):
+        self.AddVertexGroupsToMesh(_objMesh, _dicVertexGroup["lLabels"], _replaceExisting=_replaceExisting)
+
+    # enddef
+
+    # create the vertex groups of all labels in _lLabels in one pass over the existing vertex groups of _objMesh
+    def AddVertexGroupsToMesh(self, _objMesh, _lLabels: list, _replaceExisting=True):
         try:
-            for dictLabel in _dicVertexGroup["lLabels"]:
-                sVertexGroup = dictLabel["sName"]
-                lVertices = dictLabel["lVertices"]
-                iIndex = _objMesh.vertex_groups.find(sVertexGroup)
-                if iIndex == -1:
-                    print(f"Creating vertex group {sVertexGroup} in {_objMesh.name}")
-                    xVertexGroup = _objMesh.vertex_groups.new(name=sVertexGroup)
-                    xVertexGroup.add(lVertices, 1.0, "ADD")
-                elif _replaceExisting:
-                    print(f"Vertex Group {sVertexGroup} already exists in {_objMesh.name}, replacing as specified")
-                    _objMesh.vertex_groups.remove(_objMesh.vertex_groups[iIndex])
-                    xVertexGroup = _objMesh.vertex_groups.new(name=sVertexGroup)
-                    xVertexGroup.add(lVertices, 1.0, "ADD")
-                else:
-                    print(f"Vertex Group {sVertexGroup} already exists in {_objMesh.name}")
-                    pass
+            # the last label of a name wins, as if the labels were added one after the other
+            dicRequested = {dictLabel["sName"]: dictLabel["lVertices"] for dictLabel in _lLabels}
+            self.dicLabelVertexGroups.setdefault(_objMesh.name, set()).update(dicRequested)
+            dicExisting = {xVertexGroup.name: xVertexGroup for xVertexGroup in _objMesh.vertex_groups}
+
+            lStale = [dicExisting[sName] for sName in dicRequested if sName in dicExisting]
+            if _replaceExisting:
+                for xVertexGroup in lStale:
+                    _objMesh.vertex_groups.remove(xVertexGroup)
+                # endfor
+                lCreate = list(dicRequested)
+            else:
+                lCreate = [sName for sName in dicRequested if sName not in dicExisting]
+            # endif
+
+            for sVertexGroup in lCreate:
+                xVertexGroup = _objMesh.vertex_groups.new(name=sVertexGroup)
+                xVertexGroup.add(dicRequested[sVertexGroup], 1.0, "REPLACE")
+            # endfor
+
+            xInstrumentation.Count("iVertexGroupsCreated", len(lCreate))
+            iReplaced = len(lStale) if _replaceExisting else 0
+            print(
+                f"Vertex groups in {_objMesh.name}: {len(lCreate) - iReplaced} created, {iReplaced} replaced,"
+                f" {len(lStale) - iReplaced} kept"
+            )
         except ValueError as e:
             print(f"ERROR: {e}")
 
     # enddef
 
-    # import and create vertex groups
+    # import and create vertex groups, the labels of all entries for the same mesh are created together
     def CreateVertexGroups(self, _objMesh, _lLabelVertices, _replaceExisting=True):
+        dicLabelsByMesh = {}
         for dicVertexGroup in _lLabelVertices:
             sObject = dicVertexGroup["sObject"]
-            try:
-                if sObject.startswith("HG_Body"):
-                    self.AddVertexGroupToMesh(
-                        _objMesh=self.objHGBody, _dicVertexGroup=dicVertexGroup, _replaceExisting=True
-                    )
-                elif sObject.startswith("HG_Eyes"):
-                    self.AddVertexGroupToMesh(
-                        _objMesh=self.objEyes, _dicVertexGroup=dicVertexGroup, _replaceExisting=True
-                    )
-                else:
-                    print(f"Logic not implemented for Mesh/Object: {sObject}")
-            except ValueError as e:
-                print(f"ERROR: {e}")
+            if sObject.startswith("HG_Body"):
+                objMesh = self.objHGBody
+            elif sObject.startswith("HG_Eyes"):
+                objMesh = self.objEyes
+            else:
+                print(f"Logic not implemented for Mesh/Object: {sObject}")
+                continue
+            # endif
+            dicLabelsByMesh.setdefault(objMesh.name, (objMesh, []))[1].extend(dicVertexGroup["lLabels"])
+        # endfor
+
+        for objMesh, lLabels in dicLabelsByMesh.values():
+            self.AddVertexGroupsToMesh(_objMesh=objMesh, _lLabels=lLabels, _replaceExisting=True)
         # endfor
 
     # enddef
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \landmarks.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+"""File format of the landmark streams written by CLabelExporter.
+
+A stream consists of two files:
+- '<name>.json': header with the labels, see WriteHeader()
+- '<name>.bin': one record per exported frame, with the frame number as int32 and the world space
+  positions of all labels as float32 array of shape (label count, 3)
+
+The records can be read without Blender, e.g. with ReadLandmarks().
+"""
+
+import os
+import json
+
+import numpy as np
+
+iFormatVersion: int = 1
+
+
+############################################################################################
+def GetRecordType(_iLabelCount: int) -> np.dtype:
+    """Numpy record type of a frame with _iLabelCount labels"""
+    return np.dtype([("iFrame", "<i4"), ("aPoints", "<f4", (_iLabelCount, 3))])
+
+
+# enddef
+
+
+############################################################################################
+def WriteHeader(_sFilePath: str, _lLabels: list, _lKinds: list, _dicInfo: dict = None):
+    """Write the header file '<_sFilePath>.json' of a landmark stream.
+
+    _lLabels are the names of the labels and _lKinds their kind, 'BONE' or 'VERTEX_GROUP'.
+    """
+    dicHeader = {
+        "iVersion": iFormatVersion,
+        "sRecordType": "int32 frame, float32 points[label count][3]",
+        "iLabelCount": len(_lLabels),
+        "lLabels": list(_lLabels),
+        "lKinds": list(_lKinds),
+        "dicInfo": _dicInfo or {},
+    }
+    with open(_sFilePath + ".json", "w") as xFile:
+        json.dump(dicHeader, xFile, indent=4)
+    # endwith
+
+
+# enddef
+
+
+############################################################################################
+def ReadLandmarks(_sFilePath: str, _bMemoryMap: bool = True) -> tuple:
+    """Read a landmark stream.
+
+    Parameters
+    ----------
+    _sFilePath : str
+        path of the stream without extension
+    _bMemoryMap : bool
+        map the records into memory instead of reading them
+
+    Returns
+    -------
+    tuple
+        (dicHeader, aFrames, aPoints) with the frame numbers of shape (frame count,) and
+        the positions of shape (frame count, label count, 3)
+    """
+    with open(_sFilePath + ".json", "r") as xFile:
+        dicHeader = json.load(xFile)
+    # endwith
+
+    if dicHeader["iVersion"] != iFormatVersion:
+        raise RuntimeError(f"Unsupported landmark stream version {dicHeader['iVersion']} of '{_sFilePath}'")
+    # endif
+
+    xRecordType = GetRecordType(dicHeader["iLabelCount"])
+    if os.path.getsize(_sFilePath + ".bin") == 0:
+        # a stream without frames cannot be memory mapped
+        aRecords = np.empty((0,), dtype=xRecordType)
+    elif _bMemoryMap:
+        aRecords = np.memmap(_sFilePath + ".bin", dtype=xRecordType, mode="r")
+    else:
+        aRecords = np.fromfile(_sFilePath + ".bin", dtype=xRecordType)
+    # endif
+
+    return dicHeader, aRecords["iFrame"], aRecords["aPoints"]
+
+
+# enddef
@@ -32,19 +32,15 @@ import math
 
 
 import random
+import time
 
 from typing import Optional
 from anybase import convert
 
-from .cls_humgen import SingletonHumGenWrapper
-
 from .paramgenerators import ComputeParams
+from .paramgenerators import CreateRandomGenerator
 from .paramgenerators import SaveGeneratedParams
 
-try:
-    from HumGen3D import Human as HG_Human
-except Exception as xEx:
-    print("Error initializing anyhuman module:\n{}".format(str(xEx)))
 # HumGen V3 Legacy
 # try:
 #     from humgen3d.API import HG_Human, HG_Batch_Generator
@@ -53,6 +49,52 @@ except Exception as xEx:
 # # endtry
 
 
+###############################################################################
+def _GetHumGenWrapper():
+    """Return the HumGenWrapper of this process.
+
+    The wrapper module, the labelling modules and HumGen are imported on the first call,
+    i.e. when the first human is generated or modified, and not when this module is imported.
+    """
+    from .cls_humgen import SingletonHumGenWrapper
+
+    return SingletonHumGenWrapper()
+
+
+# enddef
+
+
+###############################################################################
+def _ComputeHumanParams(_dicParams: dict, _xHumanGenerator) -> dict:
+    """Compute the dictAnyhuman parameters for a human and save them, if configured"""
+    rnd = CreateRandomGenerator(_dicParams)
+
+    mode: str = _dicParams.get("sMode", "RANDOM_REALISTIC")
+    overwrite = _dicParams.get("mOverwrite", {})
+
+    generated_params: dict = ComputeParams(mode, _dicParams, overwrite, _xHumanGenerator.generator_config, rnd)
+    # Save to json File if bSave in mParamConfig is True
+    SaveGeneratedParams(_dicParams, generated_params)
+
+    return generated_params
+
+
+# enddef
+
+
+###############################################################################
+def _GetInstrumentationArgs(_dicParams: dict) -> dict:
+    """Instrumentation switches of HumGenWrapper.CreateHuman() from mParamConfig, for all modes"""
+    dicParamConfig: dict = _dicParams.get("mParamConfig") or {}
+    return {
+        "_sInstrumentationFile": dicParamConfig.get("sInstrumentationFile"),
+        "_bProfile": dicParamConfig.get("bProfile"),
+    }
+
+
+# enddef
+
+
 ###############################################################################
 def GenerateHuman(_dicParams, **kwargs):
     """
@@ -85,32 +127,10 @@ def GenerateHuman(_dicParams, **kwargs):
         Blender object
     """
 
-    # set a seed for the following randomization
-    # used to generate reproducible humans
-    if "xSeed" in _dicParams:
-        import numpy as np
-
-        np_seed = hash(_dicParams["xSeed"]) % (2**32)
-
-        random.seed(_dicParams["xSeed"])
-        # np.random.seed(np_seed)
-        rnd = random.Random(np_seed)
-    else:
-        rnd = random.Random(None)
-    # endif
-
-
-    mode:str = _dicParams.get("sMode", "RANDOM_REALISTIC")
-
-    xHumanGenerator = SingletonHumGenWrapper()
-
-    overwrite = _dicParams.get("mOverwrite", {})
-    # gender = _dicParams["sGender"]
+    xHumanGenerator = _GetHumGenWrapper()
 
     # first compute the parameters that should be used for the creation of the human
-    generated_params:dict = ComputeParams(mode, _dicParams, overwrite, xHumanGenerator.generator_config, rnd)
-    # Save to json File if bSave in mParamConfig is True
-    SaveGeneratedParams(_dicParams, generated_params)
+    generated_params: dict = _ComputeHumanParams(_dicParams, xHumanGenerator)
         
     # apply
     # params['posefilename'] =_dicParams.get('sPosefile')
@@ -121,13 +141,67 @@ def GenerateHuman(_dicParams, **kwargs):
     #     objX = lHumanGenerator.CreateFullRandomHuman(params["sGender"])
     # else:
     #     objX = lHumanGenerator.CreateHuman(params, generated_params)
-    objX = xHumanGenerator.CreateHuman(generated_params)
+    objX = xHumanGenerator.CreateHuman(generated_params, **_GetInstrumentationArgs(_dicParams))
 
     # objX["generator_param_dict"] = json.dumps(generated_params)
 
     return objX
 
 
+# enddef
+
+
+###############################################################################
+def GenerateHumans(_lParams: list, **kwargs) -> tuple:
+    """
+    Generate a batch of humans, e.g. a crowd.
+
+    Each element of _lParams is a dictionary as described for GenerateHuman().
+    The parameter sets of all humans are computed first. Afterwards, all humans are created
+    in one pass over the scene. Every human is created with the state of the global random
+    generator that GenerateHuman() would use for it, i.e. the state after its seeded parameter
+    computation, so a batch gives the same humans as single calls.
+
+    Parameters
+    ----------
+    _lParams : list
+        list of dicts with the parameters for human generation
+
+    Returns
+    -------
+    tuple
+        (lObjects, lTiming) with the Blender object of every human and a list of dicts with
+        the elements 'sId', 'fTimeParams' and 'fTimeCreate' in seconds and the instrumentation
+        report 'dicInstrumentation' of every human, see HumGenWrapper.CreateHuman()
+    """
+
+    xHumanGenerator = _GetHumGenWrapper()
+
+    lTiming: list = []
+    lGeneratedParams: list = []
+    lRandomStates: list = []
+    for dicParams in _lParams:
+        fStart = time.perf_counter()
+        lGeneratedParams.append(_ComputeHumanParams(dicParams, xHumanGenerator))
+        lRandomStates.append(random.getstate())
+        lTiming.append({"sId": dicParams.get("sId"), "fTimeParams": time.perf_counter() - fStart})
+    # endfor
+
+    lObjects: list = []
+    for dicParams, dicTiming, generated_params, tRandomState in zip(
+        _lParams, lTiming, lGeneratedParams, lRandomStates
+    ):
+        fStart = time.perf_counter()
+        # CreateRandomGenerator() seeds the global random generator, which is also used by the creation
+        random.setstate(tRandomState)
+        lObjects.append(xHumanGenerator.CreateHuman(generated_params, **_GetInstrumentationArgs(dicParams)))
+        dicTiming["fTimeCreate"] = time.perf_counter() - fStart
+        dicTiming["dicInstrumentation"] = xHumanGenerator.dicLastReport
+    # endfor
+
+    return lObjects, lTiming
+
+
 # enddef
 
 ##############################################################################################################
@@ -158,7 +232,9 @@ def ModifyHumanPostCreation(_objX, _dicParams, sMode, **kwargs):
     except Exception as e:
         print(e)
 
-    lHumanGenerator = SingletonHumGenWrapper()
+    from HumGen3D import Human as HG_Human
+
+    lHumanGenerator = _GetHumGenWrapper()
 
     lHumanGenerator.human_obj = HG_Human(_objX)
 
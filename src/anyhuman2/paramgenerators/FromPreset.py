@@ -1,7 +1,8 @@
 
-import json
 import os
 
+from .cls_preset_cache import xPresetCache
+
 
 class HumanFromPreset():
     """Class to generate human from randomly choosen preset and modify selected parameters
@@ -15,7 +16,13 @@ class HumanFromPreset():
         self.sGender:str = self.params["mParamConfig"].get("sGender", self.rnd.choice(["male", "female"])) if "mParamConfig" in self.params else self.rnd.choice(["male", "female"])
         
     def GetPreset(self) -> dict:
-        
+        """Randomly select preset and return its content"""
+        dPresets:dict = self.generator_config.dict_models[self.sGender]
+        sPreset:str = self.rnd.choice(list(dPresets.keys()))
+        addon_path:str = self.generator_config.dict_info["HumGenV4 Path"]
+        preset_path:str = dPresets[sPreset].replace('/', os.sep)
+        dPreset:dict = xPresetCache.Get(os.path.join(addon_path, preset_path))
+        return dPreset
 
     def GetGender(self) -> str:
         """Return the gender of the armature
@@ -121,10 +128,8 @@ class HumanFromPreset():
                 }
                 # Randomize facial hair concerning length
                 addon_path:str = self.generator_config.dict_info["HumGenV4 Path"]
-                face_hair_path:str = sFaceHair.replace('/', '\\')
-                with open(os.path.join(addon_path, face_hair_path), 'r') as f:
-                    file = json.load(f)
-                dBeardLength = file
+                face_hair_path:str = sFaceHair.replace('/', os.sep)
+                dBeardLength = xPresetCache.Get(os.path.join(addon_path, face_hair_path))
                 for key, value in enumerate(dBeardLength["hair_systems"]):
                     dBeardLength["hair_systems"][value].update({"length": self.rnd.uniform(0, 1.0)})
             else:
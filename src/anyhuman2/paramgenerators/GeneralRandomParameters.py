@@ -1,6 +1,6 @@
-import json
 import os
-import numpy as np
+
+from .cls_preset_cache import xPresetCache
 
 
 class GeneralRandomParameters:
@@ -28,7 +28,7 @@ class GeneralRandomParameters:
         gauss_number = self.rnd.gauss(mean, std_dev)
 
         # Apply linear transformation to map to desired range [min_value, max_value]
-        transformed_number = np.clip(gauss_number, min_value, max_value)
+        transformed_number = min(max(gauss_number, min_value), max_value)
 
         return transformed_number
 
@@ -48,9 +48,8 @@ class GeneralRandomParameters:
         sPreset: str = self.rnd.choice(list(dPresets.keys()))
         sPresetPath: str = dPresets[sPreset]
         addon_path: str = self.generator_config.dict_info["HumGenV4 Path"]
-        preset_path: str = sPresetPath.replace("/", "\\")
-        with open(os.path.join(addon_path, preset_path), "r") as f:
-            dPreset: dict = json.load(f)
+        preset_path: str = sPresetPath.replace("/", os.sep)
+        dPreset: dict = xPresetCache.Get(os.path.join(addon_path, preset_path))
         return dPreset
 
     def ArmatureName(self) -> str:
@@ -148,10 +147,8 @@ class GeneralRandomParameters:
                 }
                 # Randomize facial hair concerning length
                 addon_path: str = self.generator_config.dict_info["HumGenV4 Path"]
-                face_hair_path: str = sFaceHair.replace("/", "\\")
-                with open(os.path.join(addon_path, face_hair_path), "r") as f:
-                    file = json.load(f)
-                dBeardLength = file
+                face_hair_path: str = sFaceHair.replace("/", os.sep)
+                dBeardLength = xPresetCache.Get(os.path.join(addon_path, face_hair_path))
                 for key, value in enumerate(dBeardLength["hair_systems"]):
                     dBeardLength["hair_systems"][value].update({"length": self.gauss_with_min_max(0, 1.0)})
             else:
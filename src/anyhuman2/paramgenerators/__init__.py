@@ -34,11 +34,36 @@ from . import random_full
 from . import random_realistic
 import os
 import json
+import random
 import datetime
 from pathlib import Path
+
+from .cls_json_lines_sink import GetJsonLinesSink
 # from . import zwicky
 
 
+######################################################################
+def CreateRandomGenerator(params: dict) -> random.Random:
+    """Create the random number generator for a human from the optional 'xSeed' element of params"""
+
+    # set a seed for the following randomization
+    # used to generate reproducible humans
+    if "xSeed" in params:
+        np_seed = hash(params["xSeed"]) % (2**32)
+
+        random.seed(params["xSeed"])
+        # np.random.seed(np_seed)
+        rnd = random.Random(np_seed)
+    else:
+        rnd = random.Random(None)
+    # endif
+
+    return rnd
+
+
+# enddef
+
+
 ######################################################################
 def ComputeParams(mode, params, overwrite, generator_params, rnd) -> dict:
     """
@@ -120,7 +145,11 @@ def GetParams(mode, params, generator_params, rnd):
 
 def SaveGeneratedParams(params: dict, generated_params: dict):
     """
-    Save the generated parameters as a JSON file.
+    Save the generated parameters, if 'bSave' is True in mParamConfig.
+
+    If 'sFilePathJSONL' is given in mParamConfig, a record {"sId", "xSeed", "dictAnyhuman"} is appended
+    to this JSON Lines file, see CJsonLinesSink. Otherwise, the parameters are written to a new file
+    'human_<timestamp>.json' in the folder 'sFilePathJSON', which defaults to the personas folder.
 
     Args:
         params (dict): A dictionary containing the parameters.
@@ -130,26 +159,34 @@ def SaveGeneratedParams(params: dict, generated_params: dict):
         None
     """
     try:
-        saveJSON: dict = params["mParamConfig"].get("bSave", False)
-        filepath: dict = params["mParamConfig"].get("sFilePathJSON", {"sFilePathJSON": Path(__file__).resolve().parent})
-        current_datetime: str = datetime.datetime.now()
-        filename = current_datetime.strftime("%Y-%m-%d_%H-%M-%S")
-        filepath_new = Path(str(filepath) + "/" + f"human_{filename}.json")
-        # filepath_new = filepath_new.as_posix()
-        if saveJSON is True:
-            counter = 0
-            while filepath_new.exists():
-                file = f"{filepath_new.stem}_{counter:04d}.json"
-                with open(file, "w") as json_file:
-                    json.dump(generated_params, file)
-                counter += 1
-            if not filepath_new.exists():
-                with open(filepath_new, "w") as json_file:
-                    json.dump(generated_params, json_file)
-        else:
-            pass
+        saveJSON: bool = params["mParamConfig"].get("bSave", False)
+        if saveJSON is not True:
+            return
+        # endif
+
+        sFilePathJSONL = params["mParamConfig"].get("sFilePathJSONL")
+        if sFilePathJSONL is not None:
+            GetJsonLinesSink(sFilePathJSONL).Write(
+                {"sId": params.get("sId"), "xSeed": params.get("xSeed"), "dictAnyhuman": generated_params}
+            )
+            return
+        # endif
+
+        pathPersonas = Path(__file__).resolve().parent.parent / "personas"
+        filepath = Path(params["mParamConfig"].get("sFilePathJSON", pathPersonas))
+        filename = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        filepath_new = filepath / f"human_{filename}.json"
+        counter = 0
+        while filepath_new.exists():
+            filepath_new = filepath / f"human_{filename}_{counter:04d}.json"
+            counter += 1
+        # endwhile
+        with open(filepath_new, "w") as json_file:
+            json.dump(generated_params, json_file)
+        # endwith
     except KeyError as e:
         print(f"{e}: Could not save the generated parameters as a JSON file.")
-        pass
+    # endtry
 
 
+# enddef
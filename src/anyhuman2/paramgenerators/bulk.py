@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \bulk.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+"""Bulk generation of parameter sets for dataset manifests.
+
+Parameter sets are computed without Blender in a pool of worker processes and are streamed
+as JSON Lines to a file, one record per human, in index order:
+
+    {"iIndex": 0, "sId": "Human.000000", "xSeed": 1234..., "dictAnyhuman": {...}}
+
+The file is written with CJsonLinesSink, so it has an index sidecar and is gzip compressed
+if its name ends with '.gz'. As the bulk generation is the only writer of its output file,
+the lock file of the sink is removed when the file is complete.
+
+The seed of every human is derived from the base seed and its index only, so the output
+does not depend on the number of workers or the chunk size. For example:
+
+    python -m anyhuman2.paramgenerators.bulk <addon path> <output.jsonl> RANDOM_REALISTIC 100000
+"""
+
+import os
+import sys
+import hashlib
+import collections
+import concurrent.futures
+from typing import Optional
+
+from . import ComputeParams, CreateRandomGenerator
+from .dryrun import CreateGeneratorConfig
+from .cls_json_lines_sink import CJsonLinesSink
+
+# generator config of a worker process, set by _InitWorker()
+_xWorkerGeneratorConfig = None
+
+
+######################################################################
+def GetIndexSeed(_xBaseSeed, _iIndex: int) -> int:
+    """Deterministic seed of the human with index _iIndex.
+
+    The seed is an integer, as the hash of strings differs between processes.
+    """
+    bytesDigest = hashlib.sha256(f"{_xBaseSeed}:{_iIndex}".encode("utf-8")).digest()
+    return int.from_bytes(bytesDigest[:8], "little")
+
+
+# enddef
+
+
+######################################################################
+def _InitWorker(_xGeneratorConfig):
+    global _xWorkerGeneratorConfig
+    _xWorkerGeneratorConfig = _xGeneratorConfig
+
+
+# enddef
+
+
+######################################################################
+def _ComputeChunk(_sMode: str, _dicParamConfig: dict, _xBaseSeed, _iStart: int, _iStop: int, _sIdFormat: str) -> list:
+    """Compute the records with indices [_iStart, _iStop)"""
+    lRecords = []
+    for iIndex in range(_iStart, _iStop):
+        iSeed = GetIndexSeed(_xBaseSeed, iIndex)
+        sId = _sIdFormat.format(iIndex)
+        dicParams = {"sId": sId, "xSeed": iSeed, "sMode": _sMode, "mParamConfig": dict(_dicParamConfig)}
+
+        rnd = CreateRandomGenerator(dicParams)
+        dicAnyhuman = ComputeParams(_sMode, dicParams, {}, _xWorkerGeneratorConfig, rnd)
+
+        lRecords.append({"iIndex": iIndex, "sId": sId, "xSeed": iSeed, "dictAnyhuman": dicAnyhuman})
+    # endfor
+    return lRecords
+
+
+# enddef
+
+
+######################################################################
+def GenerateParamsBulk(
+    _sAddonPath: str,
+    _sOutputPath: str,
+    _iCount: int,
+    _sMode: str = "RANDOM_REALISTIC",
+    _dicParamConfig: Optional[dict] = None,
+    _xBaseSeed=0,
+    _iWorkers: Optional[int] = None,
+    _iChunkSize: int = 256,
+    _sIdFormat: str = "Human.{:06d}",
+) -> int:
+    """Compute _iCount parameter sets in a process pool and write them as JSON Lines.
+
+    Parameters
+    ----------
+    _sAddonPath : str
+        path to the HumGen addon folder
+    _sOutputPath : str
+        path of the JSON Lines file, which is overwritten together with its index
+    _iCount : int
+        number of parameter sets
+    _sMode : str
+        RANDOM_REALISTIC or RANDOM_FULL
+    _dicParamConfig : dict
+        mParamConfig used for all parameter sets
+    _xBaseSeed : int or str
+        base seed, from which the seed of each parameter set is derived, see GetIndexSeed()
+    _iWorkers : int
+        number of worker processes, defaults to the number of CPUs
+    _iChunkSize : int
+        number of parameter sets computed by a worker in one task
+    _sIdFormat : str
+        format of the sId of a parameter set, formatted with its index
+
+    Returns
+    -------
+    int
+        number of written parameter sets
+    """
+    if _sMode not in ("RANDOM_REALISTIC", "RANDOM_FULL"):
+        raise ValueError(f"Bulk generation supports the modes RANDOM_REALISTIC and RANDOM_FULL, not {_sMode}")
+    # endif
+
+    dicParamConfig = dict(_dicParamConfig or {})
+    # parameter sets are only written to the output file
+    dicParamConfig.pop("bSave", None)
+
+    xGeneratorConfig = CreateGeneratorConfig(_sAddonPath)
+    iWorkers = _iWorkers or os.cpu_count() or 1
+    # limit the number of chunks in flight, so that memory does not grow with _iCount
+    iMaxPending = 2 * iWorkers
+
+    for sPath in (_sOutputPath, _sOutputPath + ".idx"):
+        if os.path.exists(sPath):
+            os.remove(sPath)
+        # endif
+    # endfor
+
+    iWritten = 0
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=iWorkers, initializer=_InitWorker, initargs=(xGeneratorConfig,)
+    ) as xExecutor, CJsonLinesSink(_sOutputPath, _iBufferRecords=_iChunkSize) as xSink:
+        lPending = collections.deque()
+        for iStart in range(0, _iCount, _iChunkSize):
+            iStop = min(iStart + _iChunkSize, _iCount)
+            lPending.append(
+                (
+                    iStop - iStart,
+                    xExecutor.submit(_ComputeChunk, _sMode, dicParamConfig, _xBaseSeed, iStart, iStop, _sIdFormat),
+                )
+            )
+            while len(lPending) >= iMaxPending:
+                iChunkCount, xFuture = lPending.popleft()
+                for dicRecord in xFuture.result():
+                    xSink.Write(dicRecord)
+                # endfor
+                iWritten += iChunkCount
+            # endwhile
+        # endfor
+
+        while lPending:
+            iChunkCount, xFuture = lPending.popleft()
+            for dicRecord in xFuture.result():
+                xSink.Write(dicRecord)
+            # endfor
+            iWritten += iChunkCount
+        # endwhile
+    # endwith
+
+    if os.path.exists(xSink.sLockPath):
+        os.remove(xSink.sLockPath)
+    # endif
+
+    return iWritten
+
+
+# enddef
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(
+            "Usage: python -m anyhuman2.paramgenerators.bulk"
+            " <addon path> <output path> [mode] [count] [seed] [workers]"
+        )
+        sys.exit(1)
+    # endif
+
+    iWritten = GenerateParamsBulk(
+        sys.argv[1],
+        sys.argv[2],
+        int(sys.argv[4]) if len(sys.argv) > 4 else 1000,
+        _sMode=sys.argv[3] if len(sys.argv) > 3 else "RANDOM_REALISTIC",
+        _xBaseSeed=sys.argv[5] if len(sys.argv) > 5 else 0,
+        _iWorkers=int(sys.argv[6]) if len(sys.argv) > 6 else None,
+    )
+    print(f"Wrote {iWritten} parameter sets to {sys.argv[2]}")
+# endif
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_json_lines_bundle.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import os
+import mmap
+import gzip
+import json
+
+
+#########################################################################################################
+class CJsonLinesBundle:
+    """Random access to the records of a JSON Lines file written by CJsonLinesSink.
+
+    Only the index sidecar '<file>.idx' is read on creation. The records are read from a memory map
+    of the file when they are requested, so fetching a record by its index, sId or seed is O(1) and
+    does not open the file again. A plain JSON Lines file without sidecar is indexed by scanning it once.
+    """
+
+    def __init__(self, _sFilePath: str):
+        self.sFilePath: str = os.path.abspath(_sFilePath)
+        self.bCompressed: bool = self.sFilePath.endswith(".gz")
+        self.lOffsets: list = []
+        self.lSizes: list = []
+        self.dicIndexById: dict = {}
+        self.dicIndexBySeed: dict = {}
+        self._xFile = None
+        self._xMap = None
+
+        sIndexPath = self.sFilePath + ".idx"
+        if os.path.exists(sIndexPath):
+            self._ReadIndex(sIndexPath)
+        elif not self.bCompressed:
+            self._ScanFile()
+        else:
+            raise RuntimeError(f"Compressed JSON Lines file '{self.sFilePath}' has no index file '{sIndexPath}'")
+        # endif
+
+    # enddef
+
+    def __len__(self) -> int:
+        return len(self.lOffsets)
+
+    # enddef
+
+    ############################################################################################
+    def _AddEntry(self, _iOffset: int, _iSize: int, _sId, _xSeed):
+        iIndex = len(self.lOffsets)
+        self.lOffsets.append(_iOffset)
+        self.lSizes.append(_iSize)
+        # the first record with an sId or seed is returned for it
+        self.dicIndexById.setdefault(_sId, iIndex)
+        self.dicIndexBySeed.setdefault(_xSeed, iIndex)
+
+    # enddef
+
+    ############################################################################################
+    def _ReadIndex(self, _sIndexPath: str):
+        with open(_sIndexPath, "r", encoding="utf-8") as xFile:
+            for sLine in xFile:
+                if sLine.strip():
+                    dicEntry = json.loads(sLine)
+                    self._AddEntry(dicEntry["iOffset"], dicEntry["iSize"], dicEntry["sId"], dicEntry["xSeed"])
+                # endif
+            # endfor
+        # endwith
+
+    # enddef
+
+    ############################################################################################
+    def _ScanFile(self):
+        with open(self.sFilePath, "rb") as xFile:
+            iOffset = 0
+            for bytesLine in xFile:
+                if bytesLine.strip():
+                    dicRecord = json.loads(bytesLine)
+                    self._AddEntry(iOffset, len(bytesLine), dicRecord.get("sId"), dicRecord.get("xSeed"))
+                # endif
+                iOffset += len(bytesLine)
+            # endfor
+        # endwith
+
+    # enddef
+
+    ############################################################################################
+    def _GetMap(self) -> mmap.mmap:
+        if self._xMap is None:
+            self._xFile = open(self.sFilePath, "rb")
+            self._xMap = mmap.mmap(self._xFile.fileno(), 0, access=mmap.ACCESS_READ)
+        # endif
+        return self._xMap
+
+    # enddef
+
+    ############################################################################################
+    def GetByIndex(self, _iIndex: int) -> dict:
+        """Return the record with index _iIndex, i.e. the record of the _iIndex-th line of the index"""
+        iOffset = self.lOffsets[_iIndex]
+        bytesRecord = self._GetMap()[iOffset : iOffset + self.lSizes[_iIndex]]
+        if self.bCompressed:
+            bytesRecord = gzip.decompress(bytesRecord)
+        # endif
+        return json.loads(bytesRecord)
+
+    # enddef
+
+    ############################################################################################
+    def GetById(self, _sId: str) -> dict:
+        """Return the record with sId _sId"""
+        iIndex = self.dicIndexById.get(_sId)
+        if iIndex is None:
+            raise KeyError(f"No record with sId '{_sId}' in '{self.sFilePath}'")
+        # endif
+        return self.GetByIndex(iIndex)
+
+    # enddef
+
+    ############################################################################################
+    def GetBySeed(self, _xSeed) -> dict:
+        """Return the record with seed _xSeed"""
+        iIndex = self.dicIndexBySeed.get(_xSeed)
+        if iIndex is None:
+            raise KeyError(f"No record with seed '{_xSeed}' in '{self.sFilePath}'")
+        # endif
+        return self.GetByIndex(iIndex)
+
+    # enddef
+
+    ############################################################################################
+    def Close(self):
+        """Close the memory map of the file"""
+        if self._xMap is not None:
+            self._xMap.close()
+            self._xFile.close()
+            self._xMap = None
+            self._xFile = None
+        # endif
+
+    # enddef
+
+
+# endclass
+
+
+# bundles opened by this process, by file path
+_dicBundles: dict = {}
+
+
+############################################################################################
+def GetJsonLinesBundle(_sFilePath: str) -> CJsonLinesBundle:
+    """Return the bundle of this process for _sFilePath.
+
+    The bundle is opened again if the file or its index has been modified since it was opened.
+    """
+    sFilePath = os.path.abspath(_sFilePath)
+    sIndexPath = sFilePath + ".idx"
+    tStamp = (
+        os.stat(sFilePath).st_mtime_ns,
+        os.stat(sIndexPath).st_mtime_ns if os.path.exists(sIndexPath) else None,
+    )
+
+    tEntry = _dicBundles.get(sFilePath)
+    if tEntry is None or tEntry[0] != tStamp:
+        if tEntry is not None:
+            tEntry[1].Close()
+        # endif
+        tEntry = _dicBundles[sFilePath] = (tStamp, CJsonLinesBundle(sFilePath))
+    # endif
+
+    return tEntry[1]
+
+
+# enddef
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_json_lines_sink.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import os
+import gzip
+import json
+import time
+import atexit
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+# endtry
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+# endtry
+
+
+#########################################################################################################
+class CJsonLinesSink:
+    """Append-only JSON Lines file with one record per human.
+
+    Records are buffered and appended in blocks. Every record is a dict with at least the elements
+    'sId' and 'xSeed'. For each record a line {"sId", "xSeed", "iOffset", "iSize"} is appended to the
+    index sidecar file '<file>.idx', which gives random access to the record by sId or seed.
+
+    If the file name ends with '.gz', every record is written as its own gzip member. The file is then a
+    valid gzip file and a single record can be decompressed from its offset and size in the index.
+
+    Several processes, e.g. Blender workers, can append to the same file. A block of records and its
+    index lines are written while holding an exclusive lock on the file '<file>.lock'. The lock file is
+    kept when the sink is closed, as other processes may still append to the file. It can be deleted once
+    no process writes to the file anymore.
+    """
+
+    # time in seconds to wait for the lock file, before Flush() fails
+    fLockTimeout: float = 120.0
+
+    def __init__(self, _sFilePath: str, _bCompress: Optional[bool] = None, _iBufferRecords: int = 64):
+        self.sFilePath: str = os.path.abspath(_sFilePath)
+        self.sIndexPath: str = self.sFilePath + ".idx"
+        self.sLockPath: str = self.sFilePath + ".lock"
+        self.bCompress: bool = self.sFilePath.endswith(".gz") if _bCompress is None else _bCompress
+        self._iBufferRecords: int = _iBufferRecords
+        self._lBuffer: list = []
+
+        sFolder = os.path.dirname(self.sFilePath)
+        if not os.path.isdir(sFolder):
+            os.makedirs(sFolder, exist_ok=True)
+        # endif
+
+    # enddef
+
+    def __enter__(self):
+        return self
+
+    # enddef
+
+    def __exit__(self, _xType, _xValue, _xTraceback):
+        self.Close()
+
+    # enddef
+
+    ############################################################################################
+    def Write(self, _dicRecord: dict):
+        """Buffer a record, the buffer is flushed when it holds the configured number of records"""
+        bytesRecord = (json.dumps(_dicRecord) + "\n").encode("utf-8")
+        if self.bCompress:
+            bytesRecord = gzip.compress(bytesRecord, mtime=0)
+        # endif
+
+        self._lBuffer.append((_dicRecord["sId"], _dicRecord["xSeed"], bytesRecord))
+        if len(self._lBuffer) >= self._iBufferRecords:
+            self.Flush()
+        # endif
+
+    # enddef
+
+    ############################################################################################
+    def Flush(self):
+        """Append all buffered records and their index lines to the files"""
+        if not self._lBuffer:
+            return
+        # endif
+
+        with open(self.sLockPath, "a+b") as xLockFile:
+            self._Lock(xLockFile)
+            try:
+                with open(self.sFilePath, "ab") as xFile:
+                    xFile.seek(0, os.SEEK_END)
+                    iOffset = xFile.tell()
+                    lIndexLines = []
+                    for sId, xSeed, bytesRecord in self._lBuffer:
+                        lIndexLines.append(
+                            json.dumps({"sId": sId, "xSeed": xSeed, "iOffset": iOffset, "iSize": len(bytesRecord)})
+                        )
+                        iOffset += len(bytesRecord)
+                    # endfor
+                    xFile.write(b"".join(bytesRecord for _, _, bytesRecord in self._lBuffer))
+                    xFile.flush()
+                    os.fsync(xFile.fileno())
+                # endwith
+
+                with open(self.sIndexPath, "a", encoding="utf-8") as xIndexFile:
+                    xIndexFile.write("\n".join(lIndexLines) + "\n")
+                # endwith
+            finally:
+                self._Unlock(xLockFile)
+            # endtry
+        # endwith
+
+        self._lBuffer = []
+
+    # enddef
+
+    ############################################################################################
+    def Close(self):
+        """Flush the buffered records"""
+        self.Flush()
+
+    # enddef
+
+    ############################################################################################
+    @classmethod
+    def _Lock(cls, _xLockFile):
+        if fcntl is not None:
+            fcntl.flock(_xLockFile.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            _xLockFile.seek(0)
+            fStart = time.monotonic()
+            fDelay = 0.01
+            while True:
+                try:
+                    msvcrt.locking(_xLockFile.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    if time.monotonic() - fStart > cls.fLockTimeout:
+                        raise TimeoutError(f"Could not lock '{_xLockFile.name}' within {cls.fLockTimeout} s")
+                    # endif
+                    time.sleep(fDelay)
+                    fDelay = min(2.0 * fDelay, 1.0)
+                # endtry
+            # endwhile
+        # endif
+
+    # enddef
+
+    ############################################################################################
+    @staticmethod
+    def _Unlock(_xLockFile):
+        if fcntl is not None:
+            fcntl.flock(_xLockFile.fileno(), fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            _xLockFile.seek(0)
+            msvcrt.locking(_xLockFile.fileno(), msvcrt.LK_UNLCK, 1)
+        # endif
+
+    # enddef
+
+
+# endclass
+
+
+# sinks of this process by file path, flushed when the process exits
+_dicSinks: dict = {}
+
+
+############################################################################################
+def GetJsonLinesSink(_sFilePath: str, _iBufferRecords: int = 1) -> CJsonLinesSink:
+    """Return the sink of this process for _sFilePath.
+
+    By default every record is written immediately, so that the records of a worker that is killed are
+    not lost and the records can be read in the same process. The buffer size is only set when the sink
+    of _sFilePath is created.
+    """
+    sFilePath = os.path.abspath(_sFilePath)
+    xSink = _dicSinks.get(sFilePath)
+    if xSink is None:
+        xSink = _dicSinks[sFilePath] = CJsonLinesSink(sFilePath, _iBufferRecords=_iBufferRecords)
+    # endif
+    return xSink
+
+
+# enddef
+
+
+############################################################################################
+@atexit.register
+def FlushJsonLinesSinks():
+    """Flush the buffered records of all sinks of this process"""
+    for xSink in _dicSinks.values():
+        xSink.Flush()
+    # endfor
+
+
+# enddef
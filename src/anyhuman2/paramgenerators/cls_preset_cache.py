@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \cls_preset_cache.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import os
+import json
+import pickle
+import collections
+
+from ..cls_instrumentation import xInstrumentation
+
+
+#########################################################################################################
+class CPresetCache:
+    """In-process LRU cache of parsed JSON presets, e.g. HumGen model and face hair presets.
+
+    An entry is keyed on the absolute path and the modification time of the file, so an edited
+    preset is parsed again. The parsed preset is stored pickled and every call of Get() returns
+    a new copy, which callers are free to modify.
+    """
+
+    def __init__(self, _iMaxEntries: int = 128):
+        self._iMaxEntries: int = _iMaxEntries
+        self._dicEntries = collections.OrderedDict()
+        self.iHits: int = 0
+        self.iMisses: int = 0
+
+    # enddef
+
+    ############################################################################################
+    def Get(self, _sFilePath: str) -> dict:
+        """Return a copy of the parsed JSON file at _sFilePath"""
+        sFilePath = os.path.abspath(_sFilePath)
+        tKey = (sFilePath, os.stat(sFilePath).st_mtime_ns)
+
+        bytesData = self._dicEntries.get(tKey)
+        if bytesData is None:
+            self.iMisses += 1
+            xInstrumentation.Count("iFilesRead")
+            with open(sFilePath, "r") as xFile:
+                bytesData = pickle.dumps(json.load(xFile), protocol=pickle.HIGHEST_PROTOCOL)
+            # endwith
+            self._dicEntries[tKey] = bytesData
+            while len(self._dicEntries) > self._iMaxEntries:
+                self._dicEntries.popitem(last=False)
+            # endwhile
+        else:
+            self.iHits += 1
+            self._dicEntries.move_to_end(tKey)
+        # endif
+
+        return pickle.loads(bytesData)
+
+    # enddef
+
+    ############################################################################################
+    def Clear(self):
+        """Remove all entries and reset the hit and miss counters"""
+        self._dicEntries.clear()
+        self.iHits = 0
+        self.iMisses = 0
+
+    # enddef
+
+
+# endclass
+
+# cache shared by all parameter generators of this process
+xPresetCache = CPresetCache()
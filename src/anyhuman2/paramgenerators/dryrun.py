@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \dryrun.py
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render Blender Human add-on module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+"""Headless dry-run of the parameter generation.
+
+Computes dictAnyhuman parameter sets exactly like GenerateHuman() does, but without Blender.
+The content pack catalog is read from a HumGen addon folder, which can also be a synthetic
+tree created by anyhuman2.benchmark.content_pack. For example:
+
+    python -m anyhuman2.paramgenerators.dryrun <addon path> RANDOM_REALISTIC 10
+"""
+
+import sys
+import json
+from typing import Optional
+
+from ..cls_content_catalog import CContentCatalog
+from . import ComputeParams, CreateRandomGenerator, SaveGeneratedParams
+
+
+######################################################################
+def CreateGeneratorConfig(_sAddonPath: str, _sCachePath: Optional[str] = None):
+    """Create the generator config for the HumGen addon folder _sAddonPath, see CContentCatalog"""
+    return CContentCatalog(_sAddonPath, _sCachePath=_sCachePath).CreateGeneratorConfig()
+
+
+# enddef
+
+
+######################################################################
+def DryRunParams(_dicParams: dict, _xGeneratorConfig, _bSave: bool = False) -> dict:
+    """Compute the dictAnyhuman parameters of a human without creating it.
+
+    Parameters
+    ----------
+    _dicParams : dict
+        dict with the parameters for human generation, as passed to GenerateHuman()
+    _xGeneratorConfig : HumGenConfigValues
+        generator config, see CreateGeneratorConfig()
+    _bSave : bool
+        if True, the parameters are saved as configured in mParamConfig, see SaveGeneratedParams().
+        By default, the dry run has no side effects.
+
+    Returns
+    -------
+    dict
+        dictAnyhuman parameters
+    """
+    rnd = CreateRandomGenerator(_dicParams)
+
+    mode: str = _dicParams.get("sMode", "RANDOM_REALISTIC")
+    overwrite = _dicParams.get("mOverwrite", {})
+
+    generated_params: dict = ComputeParams(mode, _dicParams, overwrite, _xGeneratorConfig, rnd)
+    if _bSave:
+        SaveGeneratedParams(_dicParams, generated_params)
+    # endif
+
+    return generated_params
+
+
+# enddef
+
+
+######################################################################
+def DryRun(_sAddonPath: str, _sMode: str = "RANDOM_REALISTIC", _iCount: int = 1, _dicParamConfig: dict = None) -> list:
+    """Compute _iCount parameter sets with the seeds 0 to _iCount - 1"""
+    xGeneratorConfig = CreateGeneratorConfig(_sAddonPath)
+    return [
+        DryRunParams(
+            {
+                "sId": f"Human.{iIdx:04d}",
+                "xSeed": iIdx,
+                "sMode": _sMode,
+                "mParamConfig": dict(_dicParamConfig or {}),
+            },
+            xGeneratorConfig,
+        )
+        for iIdx in range(_iCount)
+    ]
+
+
+# enddef
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m anyhuman2.paramgenerators.dryrun <addon path> [mode] [count]")
+        sys.exit(1)
+    # endif
+
+    lParamSets = DryRun(
+        sys.argv[1],
+        sys.argv[2] if len(sys.argv) > 2 else "RANDOM_REALISTIC",
+        int(sys.argv[3]) if len(sys.argv) > 3 else 1,
+    )
+    print(json.dumps(lParamSets, indent=4))
+# endif
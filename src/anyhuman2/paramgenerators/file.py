@@ -30,9 +30,15 @@
 
 import json
 
+from .cls_json_lines_bundle import GetJsonLinesBundle
+
 ######################################################################
 def FileParams(params:dict) -> dict:
-    """_summary_
+    """Read the anyhuman dictionary of a human from file.
+
+    'sFilename' in mParamConfig is either a JSON file with a single anyhuman dictionary, or a
+    JSON Lines bundle ('.jsonl' or '.jsonl.gz') as written by CJsonLinesSink. From a bundle, the record
+    is selected by 'iRecord' (index) or 'sRecordId' (sId) in mParamConfig, or by the 'sId' of params.
 
     Parameters
     ----------
@@ -44,7 +50,17 @@ def FileParams(params:dict) -> dict:
     params : dict
         dictionary read from filename
     """
-    filename = params["mParamConfig"]["sFilename"].lower()
+    filename = params["mParamConfig"]["sFilename"]
+
+    if filename.endswith((".jsonl", ".jsonl.gz")):
+        xBundle = GetJsonLinesBundle(filename)
+        if "iRecord" in params["mParamConfig"]:
+            dicRecord = xBundle.GetByIndex(int(params["mParamConfig"]["iRecord"]))
+        else:
+            dicRecord = xBundle.GetById(params["mParamConfig"].get("sRecordId", params.get("sId")))
+        # endif
+        return dicRecord["dictAnyhuman"]
+    # endif
 
     with open(filename, "r") as file:
         params = json.load(file)
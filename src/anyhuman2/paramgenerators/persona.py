@@ -27,9 +27,10 @@
 # -----
 ###
 
-import json
 import os
 
+from .cls_preset_cache import xPresetCache
+
 ######################################################################
 def PersonaParams(params, generator_params):
     """ Create a anyhuman from a humgenv4 preset. 
@@ -47,22 +48,27 @@ def PersonaParams(params, generator_params):
         _description_
     """
     
-    persona_id = params["sPersonaId"].title()
-    if params["sId"] in params:
+    # the persona id can be given in mParamConfig or, as before, directly in the catharsys dictionary
+    persona_id = params.get("mParamConfig", {}).get("sPersonaId", params.get("sPersonaId")).title()
+    if "sId" in params:
         sArmatureName = params["sId"]
-    elif params["sPersonaId"] in params:
-        sArmatureName = params["sPersonaId"].title()
     else:
-        sArmatureName = None
+        sArmatureName = persona_id
 
     HumGenV4AddOnPath = generator_params.dict_info["HumGenV4 Path"]
     # Determine if persona_id is valid humgen preset and the gender of the preset 
+    dictHumGen_V4 = None
     for gender, model in generator_params.dict_models.items():
         if persona_id in model:
             filename = generator_params.dict_models[gender][persona_id]
             FullPath = os.path.join(HumGenV4AddOnPath, filename.replace("/", os.sep))
-            with open(FullPath, "r") as file:
-                dictHumGen_V4 = json.load(file)
+            dictHumGen_V4 = xPresetCache.Get(FullPath)
+            break
+    # endfor
+
+    if dictHumGen_V4 is None:
+        raise RuntimeError(f"Persona '{persona_id}' is not a HumGen model preset")
+    # endif
 
     dictAnyhuman = {
         "dictCustom": {
@@ -70,6 +76,8 @@ def PersonaParams(params, generator_params):
             "sArmatureName": sArmatureName,
             "bOpenPoseHandLabels": None,
             "bFacialRig": None,
+            "bLabelRigTemplate": params.get("mParamConfig", {}).get("bLabelRigTemplate", False),
+            "bFixClothBoneWeights": params.get("mParamConfig", {}).get("bFixClothBoneWeights", False),
             "sPoseFilename": None,
             "dBeardLength": None
         },
@@ -237,6 +237,8 @@ def FullyRandomizeParams(params, generator_config, rnd):
             "bFacialRig": True,
             "sWFLWLableFile": params["mParamConfig"].get("sWFLWLableFile", "WFLWLabel"),
             "sIMSLabels": params["mParamConfig"].get("sIMSLabels", "IMSLabel"),
+            "bLabelRigTemplate": params["mParamConfig"].get("bLabelRigTemplate", False),
+            "bFixClothBoneWeights": params["mParamConfig"].get("bFixClothBoneWeights", False),
             # "sEyebrowLabelsPath": params['mParamConfig'].get('sEyebrowLabelsPath', None),
             "sEyebrowStyle": sEyebrows,
             "sPoseFilename": None,
@@ -26,8 +26,293 @@
 # All rights reserved.
 # -----
 ###
+# numpy is only imported by the VECTORIZED sampler, so that the LEGACY sampler
+# and importing this module do not need it
 from .GeneralRandomParameters import GeneralRandomParameters
 
+# Distributions of the realistically randomized preset values as (path in dictHumGen_V4, min, max, distribution).
+# 'GAUSS' is a gaussian with mean (min + max) / 2 and standard deviation (max - min) / 6, clipped to [min, max],
+# 'UNIFORM' is a uniform distribution over [min, max]. An integer in the path is an index into a list.
+# The order of the table is the order of the draws of the LEGACY sampler and must not be changed.
+lRealisticTable: list = [
+    (("keys", "Forearm Length"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Forearm Thickness"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Hand Length"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Hand Thickness"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Hand Width"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Upper Arm Length"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Upper Arm Thickness"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Neck Length"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Neck Thickness"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Foot Length"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Shin Length"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Shin Thickness"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Thigh Length"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Thigh Thickness"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Back Muscles"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Biceps"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Calves Muscles"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Chest Muscles"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Forearm Muscles"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Hamstring Muscles"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Lower Butt Muscles"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Quad Muscles"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Shoulder Muscles"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Traps Muscles"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Triceps"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Upper Butt Muscles"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Stylized"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Belly Size"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Breast Size"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Chest Height"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Chest Width"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Hips Height"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Hips Size"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Shoulder Width"), 0.0, 1.0, "GAUSS"),
+    (("keys", "Waist Thickness"), 0.0, 1.0, "GAUSS"),
+    (("keys", "cheek_fullness"), -1.0, 1.0, "GAUSS"),
+    (("keys", "cheek_zygomatic_bone"), -1.0, 1.0, "GAUSS"),
+    (("keys", "cheek_zygomatic_proc"), -1.0, 1.0, "GAUSS"),
+    (("keys", "chin_dimple"), -1.0, 1.0, "GAUSS"),
+    (("keys", "chin_height"), -1.0, 1.0, "GAUSS"),
+    (("keys", "chin_size"), -1.0, 1.0, "GAUSS"),
+    (("keys", "chin_width"), -1.0, 1.0, "GAUSS"),
+    (("keys", "ear_antihelix_shape"), -1.0, 1.0, "GAUSS"),
+    (("keys", "ear_height"), -1.0, 1.0, "GAUSS"),
+    (("keys", "ear_lobe_size"), -1.0, 1.0, "GAUSS"),
+    (("keys", "ear_turn"), -1.0, 1.0, "GAUSS"),
+    (("keys", "ear_width"), -1.0, 1.0, "GAUSS"),
+    (("keys", "Eye Depth"), -1.0, 1.0, "GAUSS"),
+    (("keys", "Eye Distance"), -1.0, 1.0, "GAUSS"),
+    (("keys", "Eye Height"), -1.0, 1.0, "GAUSS"),
+    (("keys", "eyelid_fat_pad"), -1.0, 1.0, "GAUSS"),
+    (("keys", "eyelid_rotation"), -1.0, 1.0, "GAUSS"),
+    (("keys", "eyelid_shift_horizontal"), -1.0, 1.0, "GAUSS"),
+    (("keys", "eyelid_shift_vertical"), -1.0, 1.0, "GAUSS"),
+    (("keys", "eye_height"), -1.0, 1.0, "GAUSS"),
+    (("keys", "eye_orbit_size"), -1.0, 1.0, "GAUSS"),
+    (("keys", "eye_tilt"), -1.0, 1.0, "GAUSS"),
+    (("keys", "eye_width"), -1.0, 1.0, "GAUSS"),
+    (("keys", "jaw_location_horizontal"), -1.0, 1.0, "GAUSS"),
+    (("keys", "jaw_location_vertical"), -1.0, 1.0, "GAUSS"),
+    (("keys", "jaw_width"), -1.0, 1.0, "GAUSS"),
+    (("keys", "muzzle_location_horizontal"), -1.0, 1.0, "GAUSS"),
+    (("keys", "muzzle_location_vertical"), -1.0, 1.0, "GAUSS"),
+    (("keys", "lip_cupid_bow"), -1.0, 1.0, "GAUSS"),
+    (("keys", "lip_height"), -1.0, 1.0, "GAUSS"),
+    (("keys", "lip_location"), -1.0, 1.0, "GAUSS"),
+    (("keys", "lip_offset"), -1.0, 1.0, "GAUSS"),
+    (("keys", "lip_width"), -1.0, 1.0, "GAUSS"),
+    (("keys", "nose_angle"), -1.0, 1.0, "GAUSS"),
+    (("keys", "nose_bridge_height"), -1.0, 1.0, "GAUSS"),
+    (("keys", "nose_bridge_width"), -1.0, 1.0, "GAUSS"),
+    (("keys", "nose_height"), -1.0, 1.0, "GAUSS"),
+    (("keys", "nose_location"), -1.0, 1.0, "GAUSS"),
+    (("keys", "nose_nostril_flare"), -1.0, 1.0, "GAUSS"),
+    (("keys", "nose_nostril_turn"), -1.0, 1.0, "GAUSS"),
+    (("keys", "nose_tip_angle"), -1.0, 1.0, "GAUSS"),
+    (("keys", "nose_tip_length"), -1.0, 1.0, "GAUSS"),
+    (("keys", "nose_tip_size"), -1.0, 1.0, "GAUSS"),
+    (("keys", "nose_tip_width"), -1.0, 1.0, "GAUSS"),
+    (("keys", "Eye Scale"), -1.0, 1.0, "GAUSS"),
+    (("keys", "browridge_center_size"), -1.0, 1.0, "GAUSS"),
+    (("keys", "browridge_loc_horizontal"), -1.0, 1.0, "GAUSS"),
+    (("keys", "browridge_loc_vertical"), -1.0, 1.0, "GAUSS"),
+    (("keys", "forehead_size"), -1.0, 1.0, "GAUSS"),
+    (("keys", "temple_size"), -1.0, 1.0, "GAUSS"),
+    (("skin", "tone"), 0.0, 3.0, "GAUSS"),
+    (("skin", "redness"), 0.0, 1.0, "GAUSS"),
+    (("skin", "saturation"), 0.0, 1.0, "GAUSS"),
+    (("skin", "normal_strength"), 0.5, 10.0, "GAUSS"),
+    (("skin", "roughness_multiplier"), 0.5, 4.0, "GAUSS"),
+    (("skin", "freckles"), 0.0, 1.0, "GAUSS"),
+    (("skin", "splotches"), 0.0, 1.0, "GAUSS"),
+    (("skin", "cavity_strength"), 0.0, 1.0, "GAUSS"),
+    (("skin", "gender_specific", "mustache_shadow"), 0.0, 1.0, "GAUSS"),
+    (("skin", "gender_specific", "beard_shadow"), 0.0, 1.0, "GAUSS"),
+    (("eyes", "pupil_color", 0), 0.0, 1.0, "GAUSS"),
+    (("eyes", "pupil_color", 1), 0.0, 1.0, "GAUSS"),
+    (("eyes", "pupil_color", 2), 0.0, 1.0, "GAUSS"),
+    (("eyes", "sclera", 0), 0.0, 1.0, "GAUSS"),
+    (("eyes", "sclera", 1), 0.0, 1.0, "GAUSS"),
+    (("eyes", "sclera", 2), 0.0, 1.0, "GAUSS"),
+    (("hair", "eyebrows", "lightness"), 0.0, 1.0, "GAUSS"),
+    (("hair", "eyebrows", "redness"), 0.0, 1.0, "GAUSS"),
+    (("hair", "eyebrows", "roughness"), 0.0, 1.0, "GAUSS"),
+    (("hair", "eyebrows", "salt_and_pepper"), 0.0, 1.0, "GAUSS"),
+    (("hair", "eyebrows", "roots"), 0.0, 1.0, "GAUSS"),
+    (("hair", "eyebrows", "root_lightness"), 0.0, 1.0, "GAUSS"),
+    (("hair", "eyebrows", "root_redness"), 0.0, 1.0, "GAUSS"),
+    (("hair", "eyebrows", "roots_hue"), 0.0, 1.0, "GAUSS"),
+    (("hair", "eyebrows", "hue"), 0.0, 1.0, "GAUSS"),
+    (("hair", "regular_hair", "lightness"), 0.0, 1.0, "GAUSS"),
+    (("hair", "regular_hair", "redness"), 0.0, 1.0, "GAUSS"),
+    (("hair", "regular_hair", "roughness"), 0.0, 1.0, "GAUSS"),
+    (("hair", "regular_hair", "salt_and_pepper"), 0.0, 1.0, "GAUSS"),
+    (("hair", "regular_hair", "roots"), 0.0, 1.0, "GAUSS"),
+    (("hair", "regular_hair", "root_lightness"), 0.0, 1.0, "GAUSS"),
+    (("hair", "regular_hair", "root_redness"), 0.0, 1.0, "GAUSS"),
+    (("hair", "regular_hair", "roots_hue"), 0.0, 1.0, "GAUSS"),
+    (("hair", "regular_hair", "hue"), 0.0, 1.0, "GAUSS"),
+]
+
+
+############################################################################################
+def SampleTableLegacy(_xUniversalParams: GeneralRandomParameters, _lTable: list = lRealisticTable) -> list:
+    """Draw the table values one after the other from the random.Random instance of _xUniversalParams.
+
+    This gives the same values for the same seed as the per-value sampling of earlier versions.
+    """
+    lValues = []
+    for _, fMin, fMax, sDistribution in _lTable:
+        if sDistribution == "GAUSS":
+            lValues.append(_xUniversalParams.gauss_with_min_max(fMin, fMax))
+        else:
+            lValues.append(_xUniversalParams.rnd.uniform(fMin, fMax))
+        # endif
+    # endfor
+    return lValues
+
+
+# enddef
+
+
+# compiled tables as {id of table: (table, compiled table)}, see _GetTableGroups() and _GetTableArrays()
+_dicTableGroups: dict = {}
+_dicTableArrays: dict = {}
+
+# numpy bit generator of the VECTORIZED sampler, which is re-seeded for every human
+_xBitGenerator = None
+
+
+############################################################################################
+def _GetCompiled(_dicCompiled: dict, _lTable: list, _funcCompile):
+    tEntry = _dicCompiled.get(id(_lTable))
+    if tEntry is None or tEntry[0] is not _lTable:
+        tEntry = _dicCompiled[id(_lTable)] = (_lTable, _funcCompile(_lTable))
+    # endif
+    return tEntry[1]
+
+
+# enddef
+
+
+############################################################################################
+def _GetTableGroups(_lTable: list) -> list:
+    """Table entries grouped by their parent path, as list of (parent path, [(key, value index), ...])"""
+
+    def Compile(_lTable: list) -> list:
+        dicGroups = {}
+        for iIdx, (tPath, *_) in enumerate(_lTable):
+            dicGroups.setdefault(tPath[:-1], []).append((tPath[-1], iIdx))
+        # endfor
+        return list(dicGroups.items())
+
+    # enddef
+
+    return _GetCompiled(_dicTableGroups, _lTable, Compile)
+
+
+# enddef
+
+
+############################################################################################
+def _GetTableArrays(_lTable: list) -> tuple:
+    """Arrays (mean, standard deviation, min, max, is gauss) of the distributions of the table"""
+
+    def Compile(_lTable: list) -> tuple:
+        import numpy as np
+
+        aMin = np.array([xEntry[1] for xEntry in _lTable], dtype=np.float64)
+        aMax = np.array([xEntry[2] for xEntry in _lTable], dtype=np.float64)
+        aIsGauss = np.array([xEntry[3] == "GAUSS" for xEntry in _lTable])
+        return (aMin + aMax) / 2, (aMax - aMin) / 6, aMin, aMax, aIsGauss
+
+    # enddef
+
+    return _GetCompiled(_dicTableArrays, _lTable, Compile)
+
+
+# enddef
+
+
+############################################################################################
+def GetSeededGenerator(_iSeed: int) -> "np.random.Generator":
+    """Return the numpy random generator of the VECTORIZED sampler, seeded with the 128 bit integer _iSeed.
+
+    The state of a single PCG64 bit generator is set directly, which is much faster than creating a new
+    generator for every human.
+    """
+    global _xBitGenerator
+    import numpy as np
+
+    if _xBitGenerator is None:
+        _xBitGenerator = np.random.Generator(np.random.PCG64(0))
+    # endif
+    dicState = _xBitGenerator.bit_generator.state
+    dicState["state"]["state"] = _iSeed
+    dicState["has_uint32"] = 0
+    dicState["uinteger"] = 0
+    _xBitGenerator.bit_generator.state = dicState
+    return _xBitGenerator
+
+
+# enddef
+
+
+############################################################################################
+def SampleTable(_xGenerator: "np.random.Generator", _lTable: list = lRealisticTable) -> "np.ndarray":
+    """Draw all table values with a single vectorized draw per distribution.
+
+    Parameters
+    ----------
+    _xGenerator : np.random.Generator
+        seeded numpy random generator
+    _lTable : list
+        table of distributions, see lRealisticTable
+
+    Returns
+    -------
+    np.ndarray
+        array of shape (len(_lTable),)
+    """
+    import numpy as np
+
+    aMean, aStdDev, aMin, aMax, aIsGauss = _GetTableArrays(_lTable)
+
+    aValues = _xGenerator.standard_normal(len(_lTable))
+    aValues *= aStdDev
+    aValues += aMean
+    np.maximum(aValues, aMin, out=aValues)
+    np.minimum(aValues, aMax, out=aValues)
+    if not aIsGauss.all():
+        aValues = np.where(aIsGauss, aValues, aMin + (aMax - aMin) * _xGenerator.random(len(_lTable)))
+    # endif
+
+    return aValues
+
+
+# enddef
+
+
+############################################################################################
+def ApplyTable(_dicConfig: dict, _lValues, _lTable: list = lRealisticTable):
+    """Write the sampled values into the HumGenV4 config at the paths given in the table"""
+    lValues = _lValues.tolist() if hasattr(_lValues, "tolist") else _lValues
+    for tParent, lKeys in _GetTableGroups(_lTable):
+        xTarget = _dicConfig
+        for xKey in tParent:
+            xTarget = xTarget[xKey]
+        # endfor
+        for xKey, iIdx in lKeys:
+            xTarget[xKey] = float(lValues[iIdx])
+        # endfor
+    # endfor
+
+
+# enddef
+
+
 ############################################################################################
 def RealisticRandomizeParams(params, generator_config, rnd):
     """
@@ -40,6 +325,13 @@ def RealisticRandomizeParams(params, generator_config, rnd):
 
     If gender is not given, it will be selected randomly.
 
+    The preset values are drawn from the distributions in lRealisticTable. The sampler is selected
+    with 'sSampler' in mParamConfig:
+    - 'LEGACY' (default): one draw per value from rnd. The same seed gives the same human as in
+        earlier versions, so existing seeds stay reproducible.
+    - 'VECTORIZED': one vectorized draw for all values from a numpy PCG64 generator that is seeded from rnd.
+        The same seed again gives the same human, but not the same as with 'LEGACY'.
+
 
     Parameters
     ----------
@@ -69,137 +361,31 @@ def RealisticRandomizeParams(params, generator_config, rnd):
     outfit = universal_params.RandomizeOutfit()
     sFootwear = universal_params.RandomFootwear()
     sSkinTexture = universal_params.RandomizeSkin()
+    sSampler: str = params.get("mParamConfig", {}).get("sSampler", "LEGACY")
     # HumGenV4 Config
     NewHumGenV4Config = dPreset
-    # Keys
-    NewHumGenV4Config["keys"]["Forearm Length"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Forearm Thickness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Hand Length"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Hand Thickness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Hand Width"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Upper Arm Length"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Upper Arm Thickness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Neck Length"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Neck Thickness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Foot Length"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Shin Length"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Shin Thickness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Thigh Length"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Thigh Thickness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Back Muscles"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Biceps"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Calves Muscles"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Chest Muscles"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Forearm Muscles"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Hamstring Muscles"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Lower Butt Muscles"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Quad Muscles"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Shoulder Muscles"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Traps Muscles"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Triceps"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Upper Butt Muscles"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Stylized"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Belly Size"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Breast Size"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Chest Height"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Chest Width"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Hips Height"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Hips Size"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Shoulder Width"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["Waist Thickness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["keys"]["cheek_fullness"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["cheek_zygomatic_bone"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["cheek_zygomatic_proc"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["chin_dimple"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["chin_height"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["chin_size"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["chin_width"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["ear_antihelix_shape"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["ear_height"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["ear_lobe_size"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["ear_turn"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["ear_width"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["Eye Depth"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["Eye Distance"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["Eye Height"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["eyelid_fat_pad"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["eyelid_rotation"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["eyelid_shift_horizontal"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["eyelid_shift_vertical"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["eye_height"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["eye_orbit_size"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["eye_tilt"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["eye_width"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["jaw_location_horizontal"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["jaw_location_vertical"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["jaw_width"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["muzzle_location_horizontal"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["muzzle_location_vertical"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["lip_cupid_bow"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["lip_height"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["lip_location"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["lip_offset"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["lip_width"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["nose_angle"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["nose_bridge_height"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["nose_bridge_width"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["nose_height"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["nose_location"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["nose_nostril_flare"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["nose_nostril_turn"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["nose_tip_angle"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["nose_tip_length"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["nose_tip_size"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["nose_tip_width"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["Eye Scale"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["browridge_center_size"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["browridge_loc_horizontal"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["browridge_loc_vertical"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["forehead_size"] = universal_params.gauss_with_min_max(-1.0, 1.0)
-    NewHumGenV4Config["keys"]["temple_size"] = universal_params.gauss_with_min_max(-1.0, 1.0)
+    # Keys, skin, eyes, eye brows and regular hair
+    NewHumGenV4Config["eyes"]["pupil_color"] = [0.0, 0.0, 0.0, 1.00]
+    NewHumGenV4Config["eyes"]["sclera"] = [0.0, 0.0, 0.0, 1.00]
+    if sSampler == "VECTORIZED":
+        ApplyTable(NewHumGenV4Config, SampleTable(GetSeededGenerator(rnd.getrandbits(128))))
+    elif sSampler == "LEGACY":
+        ApplyTable(NewHumGenV4Config, SampleTableLegacy(universal_params))
+    else:
+        raise ValueError(f"Unknown sampler '{sSampler}', expected 'LEGACY' or 'VECTORIZED'")
+    # endif
     # Skin
-    NewHumGenV4Config["skin"]["tone"] = universal_params.gauss_with_min_max(0, 3.0)
-    NewHumGenV4Config["skin"]["redness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["skin"]["saturation"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["skin"]["normal_strength"] = universal_params.gauss_with_min_max(0.5, 10)
-    NewHumGenV4Config["skin"]["roughness_multiplier"] = universal_params.gauss_with_min_max(0.5, 4.0)
-    NewHumGenV4Config["skin"]["freckles"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["skin"]["splotches"] = universal_params.gauss_with_min_max(0, 1.0)
     NewHumGenV4Config["skin"]["texture.set"] = sSkinTexture
-    NewHumGenV4Config["skin"]["cavity_strength"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["skin"]["gender_specific"]["mustache_shadow"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["skin"]["gender_specific"]["beard_shadow"] =  universal_params.gauss_with_min_max(0, 1.0)
-    # Eyes
-    NewHumGenV4Config["eyes"]["pupil_color"] = [universal_params.gauss_with_min_max(0, 1.0), universal_params.gauss_with_min_max(0, 1.0), universal_params.gauss_with_min_max(0, 1.0), 1.00]
-    NewHumGenV4Config["eyes"]["sclera"] = [universal_params.gauss_with_min_max(0, 1.0), universal_params.gauss_with_min_max(0, 1.0), universal_params.gauss_with_min_max(0, 1.0), 1.00]
     # Height
     NewHumGenV4Config["height"]["set"] = height
     NewHumGenV4Config["keys"]["height_150"] = height_150
     NewHumGenV4Config["keys"]["height_200"] = height_200
-    # Randomize Eye brows
+    # Eye brows
     NewHumGenV4Config["hair"]["eyebrows"]["set"] = sEyebrows
-    NewHumGenV4Config["hair"]["eyebrows"]["lightness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["hair"]["eyebrows"]["redness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["hair"]["eyebrows"]["roughness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["hair"]["eyebrows"]["salt_and_pepper"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["hair"]["eyebrows"]["roots"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["hair"]["eyebrows"]["root_lightness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["hair"]["eyebrows"]["root_redness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["hair"]["eyebrows"]["roots_hue"] = universal_params.gauss_with_min_max(0, 1.0)
     NewHumGenV4Config["hair"]["eyebrows"]["fast_or_accurate"] = 1
-    NewHumGenV4Config["hair"]["eyebrows"]["hue"] = universal_params.gauss_with_min_max(0, 1.0)
-    # Randomize Regular Hair
+    # Regular Hair
     NewHumGenV4Config["hair"]["regular_hair"]["set"] = sRegularHair
-    NewHumGenV4Config["hair"]["regular_hair"]["lightness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["hair"]["regular_hair"]["redness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["hair"]["regular_hair"]["roughness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["hair"]["regular_hair"]["salt_and_pepper"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["hair"]["regular_hair"]["roots"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["hair"]["regular_hair"]["root_lightness"] = universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["hair"]["regular_hair"]["root_redness"]= universal_params.gauss_with_min_max(0, 1.0)
-    NewHumGenV4Config["hair"]["regular_hair"]["roots_hue"] = universal_params.gauss_with_min_max(0, 1.0)
     NewHumGenV4Config["hair"]["regular_hair"]["fast_or_accurate"] = 1.0
-    NewHumGenV4Config["hair"]["regular_hair"]["hue"] = universal_params.gauss_with_min_max(0, 1.0)
     # Face hair
     NewHumGenV4Config["hair"]["face_hair"] = dFaceHair
     # Clothing
@@ -217,6 +403,8 @@ def RealisticRandomizeParams(params, generator_config, rnd):
                 "bFacialRig": True,
                 "sWFLWLableFile": params['mParamConfig'].get('sWFLWLableFile', 'WFLWLabel'),
                 "sIMSLabels": params['mParamConfig'].get('sIMSLabels', 'IMSLabel'),
+                "bLabelRigTemplate": params['mParamConfig'].get('bLabelRigTemplate', False),
+                "bFixClothBoneWeights": params['mParamConfig'].get('bFixClothBoneWeights', False),
                 # "sEyebrowLabelsPath": params['mParamConfig'].get('sEyebrowLabelsPath', None),
                 "sEyebrowStyle": sEyebrows,
                 "sPoseFilename": None,
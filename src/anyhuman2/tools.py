@@ -26,94 +26,388 @@
 # </LICENSE>
 ###
 
-import bpy
 import mathutils
+import numpy as np
+
+from typing import Optional
+
+# scipy is not bundled with Blender. If it is available, it is used for the bulk
+# nearest neighbour query, otherwise the mathutils KD-tree is used.
+try:
+    from scipy.spatial import cKDTree
+except Exception:
+    cKDTree = None
+# endtry
+
+from .cls_skin_index_cache import CSkinIndexCache
+from .cls_cloth_weight_cache import CClothWeightCache
+
+# spatial index of the skin vertices, shared by all cloth meshes of a body
+xSkinIndexCache = CSkinIndexCache()
+# transferred cloth weights, persistent across processes
+xClothWeightCache = CClothWeightCache()
+
 
 ############################################################################################
-def FixClothBoneWeights(skinMesh, clothMeshes, paramMaxDist=10.0):
+def GetVertexArray(_objMesh, _sAttribute: str = "co") -> np.ndarray:
+    """Read a 3D vertex attribute of a mesh object into a numpy array with a single foreach_get call.
 
-    # use this option to use two separte kd trees for estimation of closest vertex
-    # this can help when there is self-intersection of the skin at the armpits
-    bUseTwoTrees = False
+    Parameters
+    ----------
+    _objMesh : Blender object
+        mesh object
+    _sAttribute : str
+        name of the vertex attribute, e.g. 'co' or 'normal'
 
-    for clothMesh in clothMeshes:
-        noVertices = len(skinMesh.data.vertices)
-
-        # sort the skin vertices into to separate trees based on their orientation
-        # this is a hack to prevent wrong assignemnt in the armpits of
-        # big humans (intersection)
-        skinVertexTreeLF = mathutils.kdtree.KDTree(noVertices)
-        skinVertexTreeRF = mathutils.kdtree.KDTree(noVertices)
-
-        for i, vertex in enumerate(skinMesh.data.vertices):
-            vertexWorld = skinMesh.matrix_world @ vertex.co
-
-            normalWorld = vertex.normal
-            leftFacing = normalWorld.x >= 0
-            if leftFacing and bUseTwoTrees:
-                skinVertexTreeLF.insert(vertexWorld, i)
-            else:
-                skinVertexTreeRF.insert(vertexWorld, i)
-            # endif
-        # endfor skinvertex
+    Returns
+    -------
+    np.ndarray
+        array of shape (N, 3) with the attribute values in object coordinates
+    """
+    xVertices = _objMesh.data.vertices
+    aData = np.empty(len(xVertices) * 3, dtype=np.float32)
+    xVertices.foreach_get(_sAttribute, aData)
+    return aData.reshape(-1, 3).astype(np.float64)
 
-        skinVertexTreeLF.balance()
-        skinVertexTreeRF.balance()
 
-        clothMesh.vertex_groups.clear()
+# enddef
 
-        context = bpy.context
-        scene = context.scene
 
-        for vertex_group in skinMesh.vertex_groups:
-            clothMesh.vertex_groups.new(name=vertex_group.name)
+############################################################################################
+def GetShapeKeyBlendedCoords(_objMesh) -> np.ndarray:
+    """Vertex coordinates of a mesh with all shape keys blended by their current values.
 
-        sum = 0.0
-        count = 0
-        for name, kb in clothMesh.data.shape_keys.key_blocks.items():
-            sum += kb.value
-            count += 1
+    Computes co + sum_k value_k * (co_k - co) for all vertices at once.
 
-        mult = sum if sum < 1.0 else sum / float(count)
+    Parameters
+    ----------
+    _objMesh : Blender object
+        mesh object
 
-        for id_cloth_vertex, clothVertex in enumerate(clothMesh.data.vertices):
-            clothVertexWorld = clothMesh.matrix_world @ clothVertex.co
+    Returns
+    -------
+    np.ndarray
+        array of shape (N, 3) with the blended coordinates in object coordinates
+    """
+    aCo = GetVertexArray(_objMesh, "co")
 
-            x = clothVertex.co
+    xShapeKeys = _objMesh.data.shape_keys
+    if xShapeKeys is None:
+        return aCo
+    # endif
 
-            for name, kb in clothMesh.data.shape_keys.key_blocks.items():
-                x += (kb.data[id_cloth_vertex].co - clothVertex.co) * kb.value
-            # endfor
+    # key blocks with a value of zero do not contribute
+    lKeyBlocks = [xKeyBlock for xKeyBlock in xShapeKeys.key_blocks if xKeyBlock.value != 0.0]
+    if len(lKeyBlocks) == 0:
+        return aCo
+    # endif
 
-            clothVertexWorld = clothMesh.matrix_world @ x
-            clothNormalWorld = clothMesh.matrix_world.to_3x3() @ clothVertex.normal
-            leftFacing = clothNormalWorld.x >= 0
+    aValues = np.array([xKeyBlock.value for xKeyBlock in lKeyBlocks], dtype=np.float64)
+    aKeys = np.empty((len(lKeyBlocks), aCo.size), dtype=np.float32)
+    for iIdx, xKeyBlock in enumerate(lKeyBlocks):
+        xKeyBlock.data.foreach_get("co", aKeys[iIdx])
+    # endfor
 
-            if leftFacing and bUseTwoTrees:
-                closestVectorWorld, id_skin_vertex, dist = skinVertexTreeLF.find(
-                    clothVertexWorld
-                )
-            else:
-                closestVectorWorld, id_skin_vertex, dist = skinVertexTreeRF.find(
-                    clothVertexWorld
-                )
-            # endif
+    aOffsets = aKeys.reshape(len(lKeyBlocks), -1, 3) - aCo
+    return aCo + np.tensordot(aValues, aOffsets, axes=1)
+
+
+# enddef
+
+
+############################################################################################
+def TransformPoints(_aPoints: np.ndarray, _xMatrix) -> np.ndarray:
+    """Apply an affine 4x4 transformation to an array of points of shape (N, 3)"""
+    aMatrix = np.array(_xMatrix, dtype=np.float64)
+    return _aPoints @ aMatrix[:3, :3].T + aMatrix[:3, 3]
+
+
+# enddef
+
+
+############################################################################################
+def BuildVertexIndex(_aPoints: np.ndarray):
+    """Build a nearest neighbour index over the given points.
+
+    The returned index is queried with QueryVertexIndex(). The index of a point is its row in _aPoints.
+    """
+    if cKDTree is not None:
+        return cKDTree(_aPoints)
+    # endif
+
+    xTree = mathutils.kdtree.KDTree(len(_aPoints))
+    for iIdx, aPoint in enumerate(_aPoints.tolist()):
+        xTree.insert(aPoint, iIdx)
+    # endfor
+    xTree.balance()
+    return xTree
+
+
+# enddef
+
+
+############################################################################################
+def QueryVertexIndex(_xIndex, _aQuery: np.ndarray) -> tuple:
+    """Find the closest indexed point for every query point.
+
+    Returns
+    -------
+    tuple
+        (aIdx, aDist) integer array of point indices and float array of distances
+    """
+    if cKDTree is not None and isinstance(_xIndex, cKDTree):
+        aDist, aIdx = _xIndex.query(_aQuery)
+        return aIdx.astype(np.int64), aDist
+    # endif
+
+    aIdx = np.empty(len(_aQuery), dtype=np.int64)
+    aDist = np.empty(len(_aQuery), dtype=np.float64)
+    for iQuery, aPoint in enumerate(_aQuery.tolist()):
+        _, aIdx[iQuery], aDist[iQuery] = _xIndex.find(aPoint)
+    # endfor
+    return aIdx, aDist
+
+
+# enddef
+
+
+############################################################################################
+def BuildSkinIndex(_objSkin, _bUseTwoTrees: bool = False) -> dict:
+    """Build the nearest neighbour indices over the skin vertices in world coordinates.
+
+    The skin vertices are split into a left and a right facing set by their normals, if _bUseTwoTrees
+    is True. Otherwise, all vertices are in the right facing set.
+
+    Returns
+    -------
+    dict
+        {bLeft: (xIndex, aSkinSel)} with the index over the skin vertices with indices aSkinSel,
+        or None if the set is empty
+    """
+    aSkinCo = TransformPoints(GetVertexArray(_objSkin, "co"), _objSkin.matrix_world)
+    aSkinLeft = GetVertexArray(_objSkin, "normal")[:, 0] >= 0
+    aSkinLeft &= _bUseTwoTrees
+
+    dicSkinIndex = {}
+    for bLeft in (True, False):
+        aSkinSel = np.flatnonzero(aSkinLeft == bLeft)
+        dicSkinIndex[bLeft] = (BuildVertexIndex(aSkinCo[aSkinSel]), aSkinSel) if len(aSkinSel) > 0 else None
+    # endfor
+
+    return dicSkinIndex
+
+
+# enddef
+
+
+############################################################################################
+def FindClosestSkinVertices(_dicSkinIndex: dict, _aClothCo, _aClothLeft) -> tuple:
+    """Find the closest skin vertex for every cloth vertex.
+
+    Each cloth vertex is only matched against the skin vertices facing the same side,
+    see BuildSkinIndex().
 
-            skin_vertex = skinMesh.data.vertices[id_skin_vertex]
+    Returns
+    -------
+    tuple
+        (aSkinIdx, aDist) for every cloth vertex
+    """
+    aSkinIdx = np.zeros(len(_aClothCo), dtype=np.int64)
+    aDist = np.full(len(_aClothCo), np.inf, dtype=np.float64)
 
-            if dist < paramMaxDist:
-                already_in = []
-                for g in skin_vertex.groups:
-                    group = clothMesh.vertex_groups[g.group]
+    for bLeft, tSkinIndex in _dicSkinIndex.items():
+        aClothSel = np.flatnonzero(_aClothLeft == bLeft)
+        if tSkinIndex is None or len(aClothSel) == 0:
+            continue
+        # endif
 
-                    weight = g.weight
+        xIndex, aSkinSel = tSkinIndex
+        aIdx, aSelDist = QueryVertexIndex(xIndex, _aClothCo[aClothSel])
+        aSkinIdx[aClothSel] = aSkinSel[aIdx]
+        aDist[aClothSel] = aSelDist
+    # endfor
 
-                    if not group.name in already_in:
-                        group.add([id_cloth_vertex], weight, "ADD")
-                        already_in.append(group.name)
-                    # endif
-                # endfor
+    return aSkinIdx, aDist
+
+
+# enddef
+
+
+############################################################################################
+def GroupClothWeights(_objSkin, _aClothIdx: np.ndarray, _aSkinIdx: np.ndarray) -> dict:
+    """Group the cloth vertices by the (vertex group, weight) pairs of their matching skin vertices.
+
+    Parameters
+    ----------
+    _objSkin : Blender object
+        skin mesh
+    _aClothIdx : np.ndarray
+        indices of the cloth vertices to assign
+    _aSkinIdx : np.ndarray
+        index of the matching skin vertex for every entry in _aClothIdx
+
+    Returns
+    -------
+    dict
+        arrays 'aGroups' and 'aWeights' with one entry per (vertex group, weight) pair, and the cloth
+        vertex indices of all pairs concatenated in 'aCloth', where pair i starts at 'aStarts'[i]
+    """
+    # group the cloth vertices by their skin vertex, so that the groups of every
+    # skin vertex are only read once
+    aOrder = np.argsort(_aSkinIdx, kind="stable")
+    aSkinSorted = _aSkinIdx[aOrder]
+    aClothSorted = _aClothIdx[aOrder]
+    aUniqueSkin, aStart = np.unique(aSkinSorted, return_index=True)
+    lClothPerSkin = np.split(aClothSorted, aStart[1:])
+
+    xSkinVertices = _objSkin.data.vertices
+    dicGroupWeights = {}
+    for iSkinVertex, aCloth in zip(aUniqueSkin.tolist(), lClothPerSkin):
+        for xGroup in xSkinVertices[iSkinVertex].groups:
+            dicGroupWeights.setdefault((xGroup.group, xGroup.weight), []).append(aCloth)
+        # endfor
+    # endfor
+
+    lClothArrays = [np.concatenate(lArrays) for lArrays in dicGroupWeights.values()]
+    aCounts = np.array([len(aCloth) for aCloth in lClothArrays], dtype=np.int64)
+    return {
+        "aGroups": np.array([iGroup for iGroup, _ in dicGroupWeights], dtype=np.int32),
+        "aWeights": np.array([fWeight for _, fWeight in dicGroupWeights], dtype=np.float32),
+        "aStarts": np.concatenate(([0], np.cumsum(aCounts))).astype(np.int64),
+        "aCloth": np.concatenate(lClothArrays).astype(np.int32) if lClothArrays else np.zeros(0, dtype=np.int32),
+    }
+
+
+# enddef
+
+
+############################################################################################
+def ApplyClothWeights(_objCloth, _dicWeights: dict):
+    """Add the grouped weights of GroupClothWeights() to the vertex groups of the cloth mesh,
+    with a single call per (vertex group, weight) pair."""
+    lClothGroups = list(_objCloth.vertex_groups)
+    aStarts = _dicWeights["aStarts"]
+    aCloth = _dicWeights["aCloth"]
+    for iPair, (iGroup, fWeight) in enumerate(zip(_dicWeights["aGroups"].tolist(), _dicWeights["aWeights"].tolist())):
+        lClothGroups[iGroup].add(aCloth[aStarts[iPair] : aStarts[iPair + 1]].tolist(), fWeight, "REPLACE")
+    # endfor
+
+
+# enddef
+
+
+############################################################################################
+def AssignClothWeights(_objSkin, _objCloth, _aClothIdx: np.ndarray, _aSkinIdx: np.ndarray):
+    """Copy the vertex group weights of skin vertices to their matching cloth vertices.
+
+    Cloth vertices that share the same vertex group and weight are added with a single call.
+    The cloth mesh must have the same vertex groups, in the same order, as the skin mesh.
+
+    Parameters
+    ----------
+    _objSkin : Blender object
+        skin mesh
+    _objCloth : Blender object
+        cloth mesh
+    _aClothIdx : np.ndarray
+        indices of the cloth vertices to assign
+    _aSkinIdx : np.ndarray
+        index of the matching skin vertex for every entry in _aClothIdx
+    """
+    if len(_aClothIdx) == 0:
+        return
+    # endif
+
+    ApplyClothWeights(_objCloth, GroupClothWeights(_objSkin, _aClothIdx, _aSkinIdx))
+
+
+# enddef
+
+
+############################################################################################
+def FixClothBoneWeights(
+    skinMesh, clothMeshes, paramMaxDist=10.0, _sOutfitFile=None, _bUseWeightCache: Optional[bool] = None
+):
+    """Transfer the bone weights of the skin to the cloth meshes.
+
+    Every cloth vertex, with its shape keys applied, gets the vertex group weights of the
+    closest skin vertex, if that is closer than paramMaxDist. All vertex data is read with
+    foreach_get and processed as numpy arrays, and there is one bulk nearest neighbour query
+    per cloth mesh. The skin index is taken from the process-wide xSkinIndexCache.
+
+    If _bUseWeightCache is True, the weights are first looked up in the persistent xClothWeightCache,
+    which is keyed on the outfit file _sOutfitFile, the body shape and the cloth shape-key values.
+    Only cloth meshes without cache entry need the nearest neighbour search. As the cache only pays off
+    for repeated body shapes, e.g. in PERSONA mode, it is off by default and enabled with the environment
+    variable ANYHUMAN_CLOTH_WEIGHT_CACHE=1.
+
+    Parameters
+    ----------
+    skinMesh : Blender object
+        skin mesh with the vertex groups of the armature
+    clothMeshes : list
+        cloth mesh objects whose vertex groups are replaced
+    paramMaxDist : float
+        maximal distance between a cloth vertex and its closest skin vertex
+    _sOutfitFile : str
+        path of the outfit .blend file the cloth meshes come from, optional
+    _bUseWeightCache : bool
+        use the persistent cloth weight cache, defaults to CClothWeightCache.IsEnabled()
+    """
+    if _bUseWeightCache is None:
+        _bUseWeightCache = xClothWeightCache.IsEnabled()
+    # endif
+
+    # use this option to use two separte kd trees for estimation of closest vertex
+    # this can help when there is self-intersection of the skin at the armpits
+    bUseTwoTrees = False
+
+    sSkinShapeHash = xClothWeightCache.GetSkinShapeHash(skinMesh) if _bUseWeightCache else None
+    dicSkinIndex = None
+
+    for clothMesh in clothMeshes:
+        clothMesh.vertex_groups.clear()
+
+        for vertex_group in skinMesh.vertex_groups:
+            clothMesh.vertex_groups.new(name=vertex_group.name)
+        # endfor
+
+        if _bUseWeightCache:
+            sKey = xClothWeightCache.GetKey(
+                skinMesh, clothMesh, _sOutfitFile, sSkinShapeHash, (paramMaxDist, bUseTwoTrees)
+            )
+            dicWeights = xClothWeightCache.Load(sKey)
+            if dicWeights is not None:
+                ApplyClothWeights(clothMesh, dicWeights)
+                continue
             # endif
+        # endif
+
+        if dicSkinIndex is None:
+            # sort the skin vertices into to separate trees based on their orientation
+            # this is a hack to prevent wrong assignemnt in the armpits of
+            # big humans (intersection)
+            # The trees are built once per body shape and shared by all garments.
+            dicSkinIndex = xSkinIndexCache.Get(skinMesh, lambda objSkin: BuildSkinIndex(objSkin, bUseTwoTrees))
+        # endif
+
+        xMatrixWorld = clothMesh.matrix_world
+        aClothCo = TransformPoints(GetShapeKeyBlendedCoords(clothMesh), xMatrixWorld)
+        aClothNormal = GetVertexArray(clothMesh, "normal") @ np.array(xMatrixWorld.to_3x3(), dtype=np.float64).T
+        aClothLeft = aClothNormal[:, 0] >= 0
+        aClothLeft &= bUseTwoTrees
+
+        aSkinIdx, aDist = FindClosestSkinVertices(dicSkinIndex, aClothCo, aClothLeft)
+
+        aClothIdx = np.flatnonzero(aDist < paramMaxDist)
+        dicWeights = GroupClothWeights(skinMesh, aClothIdx, aSkinIdx[aClothIdx])
+        ApplyClothWeights(clothMesh, dicWeights)
+
+        if _bUseWeightCache:
+            xClothWeightCache.Save(
+                sKey, aClothIdx=aClothIdx.astype(np.int32), aSkinIdx=aSkinIdx[aClothIdx].astype(np.int32), **dicWeights
+            )
+        # endif
     # endfor clothMesh
 
 
@@ -128,6 +422,3 @@ def FixClothBoneWeights(skinMesh, clothMeshes, paramMaxDist=10.0):
 # FixClothBoneWeights(skinMesh, clothMeshes)
 #
 # print("done")
-
-
-